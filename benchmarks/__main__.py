@@ -0,0 +1,72 @@
+"""
+Run the benchmarks, save the results as a JSON baseline and compare a run against one.
+
+    python -m benchmarks                                  run them all
+    python -m benchmarks logger builder                   run bench_logger and bench_builder
+    python -m benchmarks --save baseline.json             run and save the results
+    python -m benchmarks --compare baseline.json          run and compare against a baseline, exit 1 on a regression
+
+A row regresses when its ns per record grow by more than `--tolerance` (10% by default). Timings are only comparable
+on the same machine and Python version, which the baseline records.
+"""
+import argparse as _argparse
+import importlib as _importlib
+import json as _json
+import platform as _platform
+import sys as _sys
+
+from ._measure import report
+
+BENCHMARKS = ("logger", "builder", "format", "file", "threads", "time", "sanitize")
+
+
+def run(names, records: int) -> dict:
+    results = {}
+    for name in names:
+        module = _importlib.import_module(f".bench_{name}", __package__)
+        results[name] = module.run(records)
+        report(f"bench_{name} - {(module.__doc__ or '').strip().splitlines()[0]}", results[name])
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> int:
+    """ Print the change of every row also in `baseline`, return the number of regressions """
+    regressions = 0
+    print(f"Compared with {baseline['python']} on {baseline['machine']}")
+    for name, rows in results.items():
+        for row, result in rows.items():
+            if (before := baseline["results"].get(name, {}).get(row)) is None or not before["ns_per_record"]:
+                continue
+            change = result["ns_per_record"] / before["ns_per_record"] - 1
+            regressed = change > tolerance
+            regressions += regressed
+            print(f"    {name + ': ' + row:<48} {before['ns_per_record']:>12.1f} -> {result['ns_per_record']:>12.1f} ns {change:>+8.1%}"
+                  f"    {before.get('peak_bytes_per_record', 0):>10.1f} -> {result['peak_bytes_per_record']:>10.1f} B peak"
+                  f"{'    REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = _argparse.ArgumentParser(prog="python -m benchmarks", description="Measure the ns and the bytes allocated per record of melogger's hot paths")
+    parser.add_argument("names", nargs="*", metavar="name", help=f"benchmarks to run - {', '.join(BENCHMARKS)} - all by default")
+    parser.add_argument("-n", "--records", type=int, default=20000, help="records per measurement")
+    parser.add_argument("--save", metavar="FILE", help="save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results with a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="ns per record growth reported as a regression")
+    args = parser.parse_args(argv)
+    if unknown := [name for name in args.names if name not in BENCHMARKS]:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(args.names or BENCHMARKS, args.records)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            _json.dump({"python": _platform.python_version(), "machine": _platform.platform(), "records": args.records,
+                        "results": results}, file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            return 1 if compare(results, _json.load(file), args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    _sys.exit(main())
@@ -0,0 +1,94 @@
+import threading as _threading
+import time as _time
+import tracemalloc as _tracemalloc
+
+
+def measure(func, records: int = 20000, repeat: int = 5, setup=None) -> dict:
+    """
+    Call `func` `records` times and report the best ns per call, the peak bytes one call holds at once - its temporaries
+    included - and the bytes each call leaves allocated. `setup` is called before every call, outside the measurement.
+    """
+    func()
+    best = None
+    for _ in range(repeat):
+        elapsed = _timed(func, records) if setup is None else _timed_with_setup(func, records, setup)
+        best = elapsed if best is None else min(best, elapsed)
+
+    allocations = max(records // 10, 1)
+    _tracemalloc.start()
+    try:
+        total = 0
+        start, _ = _tracemalloc.get_traced_memory()
+        for _ in range(allocations):
+            if setup is not None:
+                setup()
+            _tracemalloc.reset_peak()
+            current, _ = _tracemalloc.get_traced_memory()
+            func()
+            total += _tracemalloc.get_traced_memory()[1] - current
+        retained = _tracemalloc.get_traced_memory()[0] - start
+    finally:
+        _tracemalloc.stop()
+    return {"ns_per_record": round(best / records, 1), "peak_bytes_per_record": round(total / allocations, 1),
+            "retained_bytes_per_record": round(retained / allocations, 1)}
+
+
+def _timed(func, records: int) -> int:
+    start = _time.perf_counter_ns()
+    for _ in range(records):
+        func()
+    return _time.perf_counter_ns() - start
+
+
+def _timed_with_setup(func, records: int, setup) -> int:
+    elapsed = 0
+    for _ in range(records):
+        setup()
+        start = _time.perf_counter_ns()
+        func()
+        elapsed += _time.perf_counter_ns() - start
+    return elapsed
+
+
+def measure_threads(func, threads: int, records: int = 20000, repeat: int = 3) -> dict:
+    """
+    Call `func` `records` times split over `threads` threads started together and report the best wall clock ns per call,
+    the peak bytes held while they run per thread - per call in flight - and the bytes each call leaves allocated.
+    """
+    def run(calls: int, barrier: _threading.Barrier) -> None:
+        barrier.wait()
+        for _ in range(calls):
+            func()
+
+    def timed(calls: int) -> int:
+        barrier = _threading.Barrier(threads + 1)
+        workers = [_threading.Thread(target=run, args=(calls // threads, barrier)) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = _time.perf_counter_ns()
+        for worker in workers:
+            worker.join()
+        return _time.perf_counter_ns() - start
+
+    func()
+    records -= records % threads
+    best = min(timed(records) for _ in range(repeat))
+
+    allocations = max(records // 10 - records // 10 % threads, threads)
+    _tracemalloc.start()
+    try:
+        start, _ = _tracemalloc.get_traced_memory()
+        timed(allocations)
+        current, peak = _tracemalloc.get_traced_memory()
+    finally:
+        _tracemalloc.stop()
+    return {"ns_per_record": round(best / records, 1), "peak_bytes_per_record": round((peak - start) / threads, 1),
+            "retained_bytes_per_record": round((current - start) / allocations, 1)}
+
+
+def report(title: str, results: dict) -> None:
+    print(title)
+    for name, result in results.items():
+        print(f"    {name:<32} {result['ns_per_record']:>12.1f} ns {result['peak_bytes_per_record']:>12.1f} B peak"
+              f" {result['retained_bytes_per_record']:>10.1f} B retained")
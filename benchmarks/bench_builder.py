@@ -0,0 +1,60 @@
+"""
+Cost of one call on loggers made by LoggerBuilder, from the level method to the bytes written.
+
+Every level method on a logger with a console and a file handler, disabled calls, the console, file and rotating
+handlers alone, and the `end=""` / `\\r` continuation paths. Console output goes to os.devnull.
+
+    python -m benchmarks.bench_builder
+"""
+import contextlib as _contextlib
+import logging as _logging
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+
+from melogger import Levels, LoggerBuilder
+from ._measure import measure, report
+
+
+def only(logger, handler_type: type):
+    """ `logger` without its handlers but the ones of `handler_type` """
+    LoggerBuilder.remove_handlers(logger, lambda handler: not isinstance(handler, handler_type))
+    return logger
+
+
+def run(records: int = 20000) -> dict:
+    logs_path = _tempfile.mkdtemp()
+    loggers = []
+
+    def build(name: str, **kwargs):
+        loggers.append(logger := LoggerBuilder.build(f"bench_{name}", logs_path=logs_path, **kwargs))
+        return logger
+
+    with open(_os.devnull, "w") as devnull, _contextlib.redirect_stdout(devnull):
+        try:
+            both = build("both", logs_level=Levels.DEBUG, file_name="both.log", file_max_size=1024 ** 3)
+            disabled = build("disabled", logs_level=Levels.INFO, file_name="disabled.log")
+            console = build("console", logs_level=Levels.INFO)
+            file = only(build("file", file_name="file.log", file_max_size=1024 ** 3), _logging.FileHandler)
+            rotating = only(build("rotating", file_name="rotating.log", file_max_size=64 * 1024, file_backups=2), _logging.FileHandler)
+            results = {f"logger.{method}": measure(lambda: getattr(both, method)("Message with some text"), records)
+                       for method in ["debug", "info", "warning", "error", "critical", "plain"]}
+            results.update({
+                "disabled debug": measure(lambda: disabled.debug("Message with some text"), records),
+                "console": measure(lambda: console.info("Message with some text"), records),
+                "file": measure(lambda: file.info("Message with some text"), records),
+                "rotating (64K files)": measure(lambda: rotating.info("Message with some text"), records),
+                "end=\"\" continuation": measure(lambda: (both.info("Part", end=""), both.plain(" done")), records // 2),
+                "\\r progress": measure(lambda: both.info("Progress", prefix="\r", end=""), records),
+            })
+            return results
+        finally:
+            for logger in loggers:
+                for handler in list(logger.handlers):
+                    handler.close()
+                    logger.removeHandler(handler)
+            _shutil.rmtree(logs_path)
+
+
+if __name__ == "__main__":
+    report("LoggerBuilder loggers (per call)", run())
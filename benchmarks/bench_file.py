@@ -0,0 +1,58 @@
+"""
+Cost of writing one record with the file handlers, and of one rotation.
+
+The text RotatingFileHandler (one write per record, and batched), BinaryFileHandler and MmapFileHandler, where a record
+is a copy into the mapped segment. The `doRollover` rows are the cost of one rotation through 10 backups for the logging
+thread, with the rename cascade done there and in the background - the background rotation is given the time to
+prepare the next file between rotations, outside the measurement, as it has between the rotations of a real log.
+
+    python -m benchmarks.bench_file
+"""
+import logging as _logging
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+
+from melogger import FORMATS, FileFormatter, Levels
+from melogger.handlers import BinaryFileHandler, MmapFileHandler, RotatingFileHandler
+from ._measure import measure, report
+
+
+def make_record() -> _logging.LogRecord:
+    record = _logging.LogRecord("bench", Levels.INFO.value, __file__, 1, "Message with some text", (), None, "run", None)
+    record.__dict__.update({"prefix": "", "terminator": "\n", "crt_module": "bench_file", "crt_method_name": "run"})
+    return record
+
+
+def run(records: int = 20000) -> dict:
+    logs_path = _tempfile.mkdtemp()
+    record = make_record()
+    handlers = {
+        "rotating": RotatingFileHandler(_os.path.join(logs_path, "text.log"), maxBytes=64 * 1024 ** 2, backupCount=1, encoding="utf-8"),
+        "rotating (batch 64K)": RotatingFileHandler(_os.path.join(logs_path, "batch.log"), maxBytes=64 * 1024 ** 2, backupCount=1,
+                                                    encoding="utf-8", batch_size=64 * 1024),
+        "binary": BinaryFileHandler(_os.path.join(logs_path, "binary.log"), maxBytes=64 * 1024 ** 2, backupCount=1),
+        "mmap": MmapFileHandler(_os.path.join(logs_path, "mmap.log"), segment_size=64 * 1024 ** 2, backupCount=1),
+    }
+    try:
+        results = {}
+        for name, handler in handlers.items():
+            handler.setFormatter(FileFormatter(FORMATS))
+            handler.terminator = ""
+            results[name] = measure(lambda: handler.handle(record), records)
+        for name, background in [("doRollover", False), ("doRollover (background)", True)]:
+            handler = RotatingFileHandler(_os.path.join(logs_path, f"{background}.log"), maxBytes=1024 ** 2, backupCount=10, encoding="utf-8",
+                                          background_rotation=background)
+            handlers[name] = handler
+            handler.setFormatter(FileFormatter(FORMATS))
+            results[name] = measure(lambda: (handler.handle(record), handler.doRollover()), min(records, 500),
+                                    setup=handler.rotator.join if background else None)
+        return results
+    finally:
+        for handler in handlers.values():
+            handler.close()
+        _shutil.rmtree(logs_path)
+
+
+if __name__ == "__main__":
+    report("File handlers (per record)", run())
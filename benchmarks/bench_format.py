@@ -0,0 +1,60 @@
+"""
+Cost of formatting one record with ConsoleFormatter / FileFormatter / JsonFormatter and encoding it for BinaryFileHandler.
+
+`deepcopy + *` reproduces the deep copy each formatter used to make of every record, the other rows read the record
+through the copy-on-write view the formatters use now. `json.dumps` is the NDJSON line of a record with flat extras
+built with the general json machinery, for comparison with JsonFormatter's direct path.
+
+    python -m benchmarks.bench_format
+"""
+import json as _json
+import logging as _logging
+import os as _os
+import tempfile as _tempfile
+from copy import deepcopy as _deepcopy
+
+from melogger import FORMATS, ConsoleFormatter, FileFormatter, JsonFormatter, Levels
+from melogger.format._view import _RecordView
+from melogger.handlers import BinaryFileHandler
+from ._measure import measure, report
+
+
+class _DeepCopyView(_RecordView):
+    def __init__(self, record: _logging.LogRecord):
+        super().__init__(record)
+        self.__dict__ = _deepcopy(record.__dict__)
+
+
+def make_record() -> _logging.LogRecord:
+    return _logging.LogRecord("bench", Levels.INFO.value, __file__, 1, "Message with some text", (), None, "main", None)
+
+
+def run(records: int = 20000) -> dict:
+    record = make_record()
+    record.__dict__.update({"prefix": "", "terminator": "\n", "col_start": FORMATS.get(Levels.INFO.value).color,
+                            "crt_module": "bench_format", "crt_method_name": "run", "extra": {"user": "bench", "ids": list(range(20))}})
+    console, file, json = ConsoleFormatter(FORMATS), FileFormatter(FORMATS), JsonFormatter(FORMATS)
+    flat_record = make_record()
+    flat_record.__dict__.update({"prefix": "", "terminator": "\n", "crt_module": "bench_format", "crt_method_name": "run",
+                                 "user": "bench", "request_id": 42, "elapsed": 0.125, "cached": False})
+
+    def json_dumps():
+        return _json.dumps({"timestamp": json.formatTime(flat_record), "level": "INFO", "module": flat_record.crt_module,
+                            "function": flat_record.crt_method_name, "process": flat_record.process, "message": flat_record.getMessage(),
+                            "cached": flat_record.cached, "elapsed": flat_record.elapsed, "request_id": flat_record.request_id,
+                            "user": flat_record.user}, ensure_ascii=False)
+
+    binary = BinaryFileHandler(_os.path.join(_tempfile.gettempdir(), "bench_format.bin"), delay=True)
+    return {
+        "deepcopy + console": measure(lambda: console._format(_DeepCopyView(record)), records),
+        "console": measure(lambda: console.format(record), records),
+        "deepcopy + file": measure(lambda: file._format(_DeepCopyView(record)), records),
+        "file": measure(lambda: file.format(record), records),
+        "json.dumps": measure(json_dumps, records),
+        "json": measure(lambda: json.format(flat_record), records),
+        "binary": measure(lambda: binary.encode(flat_record), records),
+    }
+
+
+if __name__ == "__main__":
+    report("Formatters (per record)", run())
@@ -0,0 +1,49 @@
+"""
+Cost of the Logger level methods.
+
+`disabled` calls are below the logger level, the other rows go through a handler that drops the formatted line, with a
+format that renders the caller (`%(module)s`) and one that does not. The `repr` rows log the repr of a large dict built
+eagerly with an f-string, passed as a lazy %-style argument and passed as a lazy message.
+
+    python -m benchmarks.bench_logger
+"""
+import logging as _logging
+
+from melogger import FORMATS, ConsoleFormatter, Levels, Logger
+from melogger.utils import LevelData
+from ._measure import measure, report
+
+NO_CALLER_FORMATS = {level: LevelData(data.label, data.color, "%(prefix)s%(asctime)s [%(level_name)s] %(message)s%(terminator)s")
+                     for level, data in FORMATS.items()}
+
+
+class _NullHandler(_logging.Handler):
+    def emit(self, record: _logging.LogRecord) -> None:
+        self.format(record)
+
+
+def make_logger(formats: dict, level: Levels = Levels.INFO) -> Logger:
+    handler = _NullHandler()
+    handler.setFormatter(ConsoleFormatter(formats))
+    logger = Logger("bench")
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return logger
+
+
+def run(records: int = 20000) -> dict:
+    logger, no_caller = make_logger(FORMATS), make_logger(NO_CALLER_FORMATS)
+    payload = {i: list(range(10)) for i in range(100)}
+    return {
+        "disabled debug": measure(lambda: logger.debug("Message"), records),
+        "disabled debug (kwargs)": measure(lambda: logger.debug("Message", end="", color=""), records),
+        "info": measure(lambda: logger.info("Message"), records),
+        "info (no caller in format)": measure(lambda: no_caller.info("Message"), records),
+        "disabled debug f-string repr": measure(lambda: logger.debug(f"Payload {payload!r}"), records),
+        "disabled debug lazy arg repr": measure(lambda: logger.debug("Payload %s", lambda: repr(payload)), records),
+        "disabled debug lazy msg repr": measure(lambda: logger.debug(lambda: f"Payload {payload!r}"), records),
+    }
+
+
+if __name__ == "__main__":
+    report("Logger (per call)", run())
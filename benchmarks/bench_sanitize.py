@@ -0,0 +1,28 @@
+"""
+Cost of the ANSI stripping and prefix / terminator validation done per record.
+
+    python -m benchmarks.bench_sanitize
+"""
+import re as _re
+
+from melogger import Colors
+from melogger.format import _sanitize
+from ._measure import measure, report
+
+ANSI_REGEX = r"\033\[[\d;]*[A-Za-z]"
+
+
+def run(records: int = 20000) -> dict:
+    plain, colored = "Message without colors " * 4, f"Message {Colors.COL.RED}with{Colors.END} colors " * 4
+    return {
+        "re.sub, no escape": measure(lambda: _re.sub(ANSI_REGEX, "", plain), records),
+        "strip_ansi, no escape": measure(lambda: _sanitize.strip_ansi(plain), records),
+        "re.sub, escapes": measure(lambda: _re.sub(ANSI_REGEX, "", colored), records),
+        "strip_ansi, escapes": measure(lambda: _sanitize.strip_ansi(colored), records),
+        "re.sub prefix check": measure(lambda: len(_re.sub(r"[ \t\r]", "", "\t\r")) > 0, records),
+        "validate_prefix": measure(lambda: _sanitize.validate_prefix("\t\r"), records),
+    }
+
+
+if __name__ == "__main__":
+    report("Sanitizer (per record)", run())
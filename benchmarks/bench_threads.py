@@ -0,0 +1,54 @@
+"""
+Cost of one record when 1, 4 and 16 threads log together to a LoggerBuilder file logger.
+
+The file is written per record, batched, and through the queue of async mode (the cost for the logging threads, the
+queued records are written after). ns per record are wall clock: lower is more records per second overall.
+
+    python -m benchmarks.bench_threads
+"""
+import logging as _logging
+import shutil as _shutil
+import tempfile as _tempfile
+
+from melogger import Levels, LoggerBuilder
+from ._measure import measure_threads, report
+
+THREADS = (1, 4, 16)
+
+
+def file_logger(name: str, logs_path: str, async_mode: bool = False, **kwargs):
+    """ A LoggerBuilder file logger without its console handler """
+    logger = LoggerBuilder.build(name, logs_path=logs_path, file_name=f"{name}.log", file_max_size=1024 ** 3, **kwargs)
+    LoggerBuilder.remove_handlers(logger, lambda handler: not isinstance(handler, _logging.FileHandler))
+    if async_mode:
+        file_handler, = logger.handlers
+        logger.removeHandler(file_handler)
+        logger.addHandler(LoggerBuilder.get_queue_handler([file_handler], Levels.INFO))
+    return logger
+
+
+def run(records: int = 20000) -> dict:
+    logs_path = _tempfile.mkdtemp()
+    loggers = {
+        "file": file_logger("bench_threads_file", logs_path),
+        "file (batch 64K)": file_logger("bench_threads_batch", logs_path, file_batch_size=64 * 1024),
+        "async file": file_logger("bench_threads_async", logs_path, async_mode=True),
+    }
+    try:
+        results = {}
+        for name, logger in loggers.items():
+            for threads in THREADS:
+                results[f"{name}, {threads} thread{'s' if threads > 1 else ''}"] = measure_threads(
+                    lambda: logger.info("Message with some text"), threads, records)
+            logger.flush()
+        return results
+    finally:
+        for logger in loggers.values():
+            for handler in list(logger.handlers):
+                handler.close()
+                logger.removeHandler(handler)
+        _shutil.rmtree(logs_path)
+
+
+if __name__ == "__main__":
+    report("Threads (per record)", run())
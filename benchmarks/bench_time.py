@@ -0,0 +1,28 @@
+"""
+Cost of rendering `%(asctime)s` - logging.Formatter.formatTime against the per-second cache of the melogger formatters.
+
+    python -m benchmarks.bench_time
+"""
+import logging as _logging
+
+from melogger import FORMATS, ConsoleFormatter, Levels
+from ._measure import measure, report
+
+
+def run(records: int = 20000) -> dict:
+    record = _logging.LogRecord("bench", Levels.INFO.value, __file__, 1, "Message", (), None)
+    reference, formatter = _logging.Formatter(), ConsoleFormatter(FORMATS)
+
+    def new_second():
+        record.created += 1
+        return formatter.formatTime(record)
+
+    return {
+        "logging.Formatter.formatTime": measure(lambda: reference.formatTime(record), records),
+        "cached, same second": measure(lambda: formatter.formatTime(record), records),
+        "cached, new second each time": measure(new_second, records),
+    }
+
+
+if __name__ == "__main__":
+    report("asctime (per record)", run())
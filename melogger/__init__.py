@@ -1,9 +1,9 @@
 from .builder import LoggerBuilder
-from .colors import Colors
-from .format import ConsoleFormatter, FileFormatter
+from .colors import Colors, ColorSupport
+from .format import ConsoleFormatter, FileFormatter, JsonFormatter
 from .logger import Logger
-from .utils import Levels, FORMATS
+from .utils import Levels, FORMATS, QueuePolicy, FileFormat, Compression
 
-__all__ = ["LoggerBuilder", "Logger", "ConsoleFormatter", "FileFormatter", "Levels", "Colors", "FORMATS"]
+__all__ = ["LoggerBuilder", "Logger", "ConsoleFormatter", "FileFormatter", "JsonFormatter", "Levels", "Colors", "ColorSupport", "FORMATS", "QueuePolicy", "FileFormat", "Compression"]
 
 VERSION = "1.2.2"
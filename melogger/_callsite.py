@@ -0,0 +1,38 @@
+from typing import NamedTuple as _NamedTuple
+
+
+class CallSite(_NamedTuple):
+    module: str
+    function: str
+    path: str
+    line: int
+
+
+class _CallSiteCache:
+    """
+    Call site data keyed on the caller's code object and line, computed once per call site.
+    Code objects are keyed by identity (equal code from two files compares equal) and kept alive by their entry.
+    The cache is bounded, the oldest call site is evicted first, so generated code can't grow it without limit.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.__sites = {}
+
+    def __len__(self) -> int:
+        return len(self.__sites)
+
+    def get(self, frame) -> CallSite:
+        key = (id(code := frame.f_code), frame.f_lineno)
+        if (entry := self.__sites.get(key)) is None:
+            entry = code, CallSite(code.co_filename.split("/")[-1].split(".")[0], code.co_name, code.co_filename, frame.f_lineno)
+            while len(self.__sites) >= self.max_size:
+                try:
+                    del self.__sites[next(iter(self.__sites))]
+                except (KeyError, RuntimeError, StopIteration):
+                    break
+            self.__sites[key] = entry
+        return entry[1]
+
+    def clear(self) -> None:
+        self.__sites.clear()
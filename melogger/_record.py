@@ -0,0 +1,28 @@
+import logging as _logging
+from functools import partial as _partial
+from types import FunctionType as _FunctionType, MethodType as _MethodType
+
+LAZY_TYPES = (_FunctionType, _MethodType, _partial)
+
+
+class _LogRecord(_logging.LogRecord):
+    """
+    LogRecord whose message is rendered on the first getMessage() - when a handler formats it - and cached for the
+    other handlers. A msg or %-style args that are functions, lambdas, bound methods or partials are called without
+    arguments then, so records that are never formatted never pay for them.
+    """
+    __slots__ = ("_rendered",)
+
+    def getMessage(self) -> str:
+        try:
+            return self._rendered
+        except AttributeError:
+            pass
+        msg = self.msg() if isinstance(self.msg, LAZY_TYPES) else self.msg
+        msg = msg if isinstance(msg, str) else str(msg)
+        if args := self.args:
+            if isinstance(args, tuple):
+                args = tuple(arg() if isinstance(arg, LAZY_TYPES) else arg for arg in args)
+            msg = msg % args
+        self._rendered = msg
+        return msg
@@ -0,0 +1,51 @@
+import itertools as _itertools
+import random as _random
+import threading as _threading
+from zlib import crc32 as _crc32
+
+from .utils import Levels as _Levels
+
+
+class _Sampler:
+    """
+    Decides which calls of the sampled levels are logged, before their record is built. The policy of a level is either a
+    rate - a float between 0 and 1, the share of the calls logged - or N - an int, one call in N is logged.
+
+    Without `key` rates are drawn at random and 1-in-N counts the calls. With `key`, calls passing that keyword argument
+    (a request or trace id) are decided by the CRC32 of its value, so all the calls of one request are kept or dropped
+    together, on every level with the same policy and in every process.
+    """
+
+    def __init__(self, policies: dict, key: str = None):
+        self.key = key
+        self.policies = {}
+        self.sampled_out = {}
+        self.__counters = {}
+        self.__lock = _threading.Lock()
+        for level, policy in policies.items():
+            level = level.value if isinstance(level, _Levels) else level
+            if level >= _Levels.WARN.value:
+                raise ValueError(f"Level {level} can not be sampled - only levels below WARN")
+            if isinstance(policy, bool) or not isinstance(policy, (int, float)):
+                raise ValueError(f"Invalid sampling policy {policy!r} - a rate between 0 and 1 or an int N for 1 in N")
+            if isinstance(policy, float) and not 0 <= policy <= 1 or isinstance(policy, int) and policy < 1:
+                raise ValueError(f"Invalid sampling policy {policy!r} - a rate between 0 and 1 or an int N for 1 in N")
+            self.policies[level] = policy
+            self.sampled_out[level] = 0
+            self.__counters[level] = _itertools.count()
+
+    def sample(self, level: int, kwargs: dict) -> bool:
+        """ True if the call is logged """
+        if (policy := self.policies.get(level)) is None:
+            return True
+        if self.key is not None and (value := kwargs.get(self.key)) is not None:
+            hashed = _crc32(value.encode() if isinstance(value, str) else str(value).encode())
+            keep = hashed < policy * 0x100000000 if isinstance(policy, float) else hashed % policy == 0
+        elif isinstance(policy, float):
+            keep = _random.random() < policy
+        else:
+            keep = next(self.__counters[level]) % policy == 0
+        if not keep:
+            with self.__lock:
+                self.sampled_out[level] += 1
+        return keep
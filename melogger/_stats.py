@@ -0,0 +1,134 @@
+import logging as _logging
+import threading as _threading
+import time as _time
+
+from ._callsite import CallSite as _CallSite
+
+# methods wrapped per handler instance, the class methods are left untouched
+WRAPPED = ("emit", "format", "encode", "doRollover", "handleError")
+
+
+class _HandlerStats:
+    """
+    Counters of one instrumented handler: records emitted, bytes of the formatted records (text encoded as the handler
+    writes it, binary frames as they are), ns formatting them, ns writing them (the rest of emit), rotations, ns
+    rotating and errors.
+    """
+    FIELDS = ("records", "bytes", "format_ns", "write_ns", "rotations", "rotate_ns", "errors")
+
+    def __init__(self):
+        self.__lock = _threading.Lock()
+        # ns formatting during the emit running in this thread, taken off its write time
+        self.__emitting = _threading.local()
+        self.encoding = "utf-8"
+        self.reset()
+
+    def reset(self) -> None:
+        with self.__lock:
+            for field in self.FIELDS:
+                setattr(self, field, 0)
+
+    def snapshot(self) -> dict:
+        with self.__lock:
+            return {field: getattr(self, field) for field in self.FIELDS}
+
+    def wrap(self, handler: _logging.Handler) -> None:
+        """ Time and count `handler` through instance attributes shadowing its methods """
+        self.encoding = getattr(handler, "encoding", None) or getattr(getattr(handler, "stream", None), "encoding", None) or "utf-8"
+        for name in WRAPPED:
+            if hasattr(handler, name):
+                setattr(handler, name, getattr(self, f"_wrap_{name.lower()}")(getattr(handler, name)))
+
+    def _wrap_emit(self, emit):
+        def timed_emit(record):
+            emitting = self.__emitting
+            emitting.format_ns = 0
+            start = _time.perf_counter_ns()
+            try:
+                return emit(record)
+            finally:
+                elapsed = _time.perf_counter_ns() - start
+                with self.__lock:
+                    self.records += 1
+                    self.write_ns += elapsed - emitting.format_ns
+        return timed_emit
+
+    def _wrap_format(self, format_record):
+        def timed_format(record):
+            start = _time.perf_counter_ns()
+            text = format_record(record)
+            elapsed = _time.perf_counter_ns() - start
+            size = len(text) if isinstance(text, bytes) or text.isascii() else len(text.encode(self.encoding, "replace"))
+            self.__emitting.format_ns = getattr(self.__emitting, "format_ns", 0) + elapsed
+            with self.__lock:
+                self.format_ns += elapsed
+                self.bytes += size
+            return text
+        return timed_format
+
+    _wrap_encode = _wrap_format
+
+    def _wrap_dorollover(self, do_rollover):
+        def timed_rollover(*args, **kwargs):
+            start = _time.perf_counter_ns()
+            try:
+                return do_rollover(*args, **kwargs)
+            finally:
+                elapsed = _time.perf_counter_ns() - start
+                with self.__lock:
+                    self.rotations += 1
+                    self.rotate_ns += elapsed
+        return timed_rollover
+
+    def _wrap_handleerror(self, handle_error):
+        def counted_error(record):
+            with self.__lock:
+                self.errors += 1
+            return handle_error(record)
+        return counted_error
+
+
+def instrument(handler: _logging.Handler) -> _HandlerStats:
+    """ Instrument `handler` and the handlers it hands records to (queue, ring buffer), once """
+    if (stats := handler.__dict__.get("stats")) is None:
+        stats = handler.stats = _HandlerStats()
+        stats.wrap(handler)
+    for target in getattr(handler, "handlers", None) or getattr(handler, "targets", None) or ():
+        instrument(target)
+    return stats
+
+
+def uninstrument(handler: _logging.Handler) -> None:
+    """ Restore the methods of `handler` and of the handlers it hands records to """
+    if handler.__dict__.pop("stats", None) is not None:
+        for name in WRAPPED:
+            handler.__dict__.pop(name, None)
+    for target in getattr(handler, "handlers", None) or getattr(handler, "targets", None) or ():
+        uninstrument(target)
+
+
+class _TimedCallSites:
+    """ Call site cache counting the caller lookups of one logger and the ns spent in them """
+
+    def __init__(self, call_sites):
+        self.call_sites = call_sites
+        self.__lock = _threading.Lock()
+        self.lookups = 0
+        self.lookup_ns = 0
+
+    def __len__(self) -> int:
+        return len(self.call_sites)
+
+    def snapshot(self) -> tuple:
+        """ (lookups, ns) read together """
+        with self.__lock:
+            return self.lookups, self.lookup_ns
+
+    def get(self, frame) -> _CallSite:
+        start = _time.perf_counter_ns()
+        site = self.call_sites.get(frame)
+        elapsed = _time.perf_counter_ns() - start
+        with self.__lock:
+            self.lookup_ns += elapsed
+            self.lookups += 1
+        return site
@@ -0,0 +1,80 @@
+import threading as _threading
+import time as _time
+
+from ._callsite import CallSite
+
+
+class _Suppressor:
+    """
+    Drops log calls before their record is built. Every call site gets a token bucket of `burst` records refilled at
+    `rate` records per second (0 - no limit), and with `collapse` a call identical to the previous call of the logger
+    (same call site, level and message - one last call is kept for all the sites) is collapsed into it.
+
+    What was dropped is reported as (level, call site, count) summaries: with the next call let through, at least every
+    `summary_interval` seconds while calls keep being dropped, and by pending() at the end of the execution.
+    """
+    MAX_SITES = 4096
+
+    def __init__(self, rate: float = 0, burst: int = 10, collapse: bool = False, summary_interval: float = 10.0):
+        self.rate = rate
+        self.burst = burst
+        self.collapse = collapse
+        self.summary_interval = summary_interval
+        self.suppressed = 0
+        self.__buckets = {}
+        self.__last = None
+        self.__repeats = 0
+        self.__repeats_reported = 0.0
+        self.__lock = _threading.Lock()
+
+    def allow(self, site: CallSite, level: int, msg) -> tuple:
+        """ (True if the call is let through, summaries to log first) """
+        now = _time.monotonic()
+        summaries = []
+        with self.__lock:
+            if self.collapse:
+                if (key := (site, level, msg)) == self.__last:
+                    self.__repeats += 1
+                    self.suppressed += 1
+                    if now - self.__repeats_reported >= self.summary_interval:
+                        summaries.append((level, site, self.__repeats))
+                        self.__repeats, self.__repeats_reported = 0, now
+                    return False, summaries
+                if self.__repeats:
+                    summaries.append((self.__last[1], self.__last[0], self.__repeats))
+                    self.__repeats = 0
+                self.__last, self.__repeats_reported = key, now
+            if self.rate > 0:
+                if (bucket := self.__buckets.get(site)) is None:
+                    if len(self.__buckets) >= self.MAX_SITES:
+                        self.__buckets.clear()
+                    # tokens, last refill, dropped, level of the dropped calls, last summary
+                    bucket = self.__buckets[site] = [self.burst, now, 0, level, now]
+                tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                if tokens < 1:
+                    bucket[0] = tokens
+                    bucket[2] += 1
+                    bucket[3] = level
+                    self.suppressed += 1
+                    if now - bucket[4] >= self.summary_interval:
+                        summaries.append((level, site, bucket[2]))
+                        bucket[2], bucket[4] = 0, now
+                    return False, summaries
+                bucket[0] = tokens - 1
+                if bucket[2]:
+                    summaries.append((bucket[3], site, bucket[2]))
+                    bucket[2] = 0
+                bucket[4] = now
+        return True, summaries
+
+    def pending(self) -> list:
+        """ Summaries of the calls dropped since the last summaries, cleared """
+        with self.__lock:
+            summaries = [(bucket[3], site, bucket[2]) for site, bucket in self.__buckets.items() if bucket[2]]
+            for bucket in self.__buckets.values():
+                bucket[2] = 0
+            if self.__repeats:
+                summaries.append((self.__last[1], self.__last[0], self.__repeats))
+                self.__repeats = 0
+        return summaries
@@ -1,12 +1,14 @@
 import logging as _logging
 import os as _os
 import sys as _sys
-from logging.handlers import RotatingFileHandler as _RotatingFileHandler
 from typing import Union as _Union
 
-from .format import (FileFormatter as _FileFormatter, ConsoleFormatter as _ConsoleFormatter)
+from .colors import ColorSupport as _ColorSupport
+from .format import (FileFormatter as _FileFormatter, ConsoleFormatter as _ConsoleFormatter, JsonFormatter as _JsonFormatter)
+from .handlers import (BinaryFileHandler as _BinaryFileHandler, BufferedStreamHandler as _BufferedStreamHandler, MmapFileHandler as _MmapFileHandler, QueueHandler as _QueueHandler,
+                       RingBufferHandler as _RingBufferHandler, RotatingFileHandler as _RotatingFileHandler, SharedFileHandler as _SharedFileHandler)
 from .logger import Logger as _Logger
-from .utils import Levels as _Levels, FORMATS as _FORMATS
+from .utils import Levels as _Levels, FORMATS as _FORMATS, QueuePolicy as _QueuePolicy, FileFormat as _FileFormat, Compression as _Compression
 
 
 class LoggerBuilder:
@@ -21,7 +23,32 @@ class LoggerBuilder:
               file_mode: str = "a",
               file_enc="utf-8",
               file_backups=5,
-              file_max_size=1024 ** 2 * 5) -> _Logger:
+              file_max_size=1024 ** 2 * 5,
+              console_batch_size: int = 0,
+              console_flush_interval: float = 0.5,
+              async_mode: bool = False,
+              queue_size: int = 10000,
+              queue_policy: _Union[str, _QueuePolicy] = _QueuePolicy.BLOCK,
+              file_batch_size: int = 0,
+              file_flush_interval: float = 0.5,
+              file_fsync_ms: int = 0,
+              file_fsync_records: int = 0,
+              file_fsync_level: _Union[int, _Levels] = None,
+              file_shared: bool = False,
+              console_colors: _ColorSupport = None,
+              file_format: _Union[str, _FileFormat] = _FileFormat.TEXT,
+              file_compression: _Union[str, _Compression] = None,
+              file_mmap: bool = False,
+              file_rotate_interval: float = 0,
+              file_background_rotation: bool = False,
+              suppress_rate: float = 0,
+              suppress_burst: int = 10,
+              suppress_duplicates: bool = False,
+              sampling: dict = None,
+              sampling_key: str = None,
+              ring_buffer_size: int = 0,
+              ring_buffer_level: _Union[int, _Levels] = _Levels.ERROR,
+              instrument: bool = False) -> _Logger:
         """
         :param name: Logger name
         :param logs_level: Lowest logs level that will be displayed
@@ -34,13 +61,53 @@ class LoggerBuilder:
         :param file_enc: encoding for file
         :param file_backups: number of replicas
         :param file_max_size: max size of a file
+        :param console_batch_size: console output is written once per batch of this many characters - 0 writes every record
+        :param console_flush_interval: max seconds a batched console record waits to be written
+        :param async_mode: log methods only queue the records, a background thread formats and writes them
+        :param queue_size: max number of queued records in async mode
+        :param queue_policy: what a full queue does with a new record - block, drop_newest or drop_oldest
+        :param file_batch_size: file records are written once per batch of this many bytes - 0 writes every record
+        :param file_flush_interval: max seconds a batched file record waits to be written
+        :param file_fsync_ms: fsync the file at most this many milliseconds after a write - 0 never
+        :param file_fsync_records: fsync the file every this many records - 0 never
+        :param file_fsync_level: fsync the file after every record of this level or above - None never
+        :param file_shared: several processes log to the same file - every record is appended with one write and rotation is coordinated between them
+        :param console_colors: colors the console displays - None detects them from stdout (TTY, TERM, COLORTERM, NO_COLOR, FORCE_COLOR)
+        :param file_format: text - the formats of each level -, json - one JSON object per line - or binary - compact records, read with `python -m melogger.decode`
+        :param file_compression: compress rotated backups - gzip, bz2 or lzma - on a background thread - None keeps them as they are
+        :param file_mmap: write records into memory mapped segments of file_max_size bytes, file_backups full segments are kept
+        :param file_rotate_interval: also rotate the file every this many seconds, aligned to local time (3600 hourly, 86400 at midnight) - 0 never
+        :param file_background_rotation: rename the backups and open the next file on a background thread, not on the logging thread
+        :param suppress_rate: calls let through per second and call site once suppress_burst calls were logged from it - 0 no limit
+        :param suppress_burst: calls a call site logs before suppress_rate applies
+        :param suppress_duplicates: collapse consecutive calls repeating the same message into the first one
+        :param sampling: share (float) or 1 in N (int) of the calls logged per level below WARN, e.g. {Levels.DEBUG: 0.01} - None logs all
+        :param sampling_key: keyword argument whose value decides the sampling of a call, the same for all the calls of a request
+        :param ring_buffer_size: keep the last this many records below logs_level in memory, written out on ring_buffer_level or a crash - 0 never
+        :param ring_buffer_level: a record of this level or above writes out the kept records before it
+        :param instrument: count and time the records of every handler, read with logger.stats() - can be switched with logger.instrument()
         :return: Logger
         """
         logger = _Logger(name)
-        logger.addHandler(LoggerBuilder.get_console_handler(logs_level, formats=formats, terminator=terminator))
+        handlers = [LoggerBuilder.get_console_handler(logs_level, formats=formats, terminator=terminator, batch_size=console_batch_size, flush_interval=console_flush_interval, colors=console_colors)]
         if file_name:
-            logger.addHandler(LoggerBuilder.get_file_handler(file_name, logs_level, formats=formats, logs_path=logs_path, file_terminator=file_terminator, file_mode=file_mode, file_enc=file_enc, file_backups=file_backups, file_max_size=file_max_size))
+            handlers.append(LoggerBuilder.get_file_handler(file_name, logs_level, formats=formats, logs_path=logs_path, file_terminator=file_terminator, file_mode=file_mode, file_enc=file_enc, file_backups=file_backups, file_max_size=file_max_size,
+                                                             file_batch_size=file_batch_size, file_flush_interval=file_flush_interval, file_fsync_ms=file_fsync_ms,
+                                                             file_fsync_records=file_fsync_records, file_fsync_level=file_fsync_level, file_shared=file_shared,
+                                                             file_format=file_format, file_compression=file_compression,
+                                                             file_mmap=file_mmap, file_rotate_interval=file_rotate_interval,
+                                                             file_background_rotation=file_background_rotation))
+        if ring_buffer_size > 0:
+            handlers.insert(0, LoggerBuilder.get_ring_buffer_handler(list(handlers), logs_level, capacity=ring_buffer_size, trigger_level=ring_buffer_level))
+        if async_mode:
+            handlers = [LoggerBuilder.get_queue_handler(handlers, logs_level, queue_size=queue_size, queue_policy=queue_policy)]
+        for handler in handlers:
+            logger.addHandler(handler)
         logger.setLevel(logs_level)
+        logger.set_suppression(suppress_rate, suppress_burst, suppress_duplicates)
+        logger.set_sampling(sampling, sampling_key)
+        if instrument:
+            logger.instrument()
         return logger
 
     @staticmethod
@@ -51,10 +118,15 @@ class LoggerBuilder:
         return handler
 
     @staticmethod
-    def get_console_handler(logs_level: _Union[int, _Levels], *, formats: dict = _FORMATS, terminator: str = ""):
+    def get_console_handler(logs_level: _Union[int, _Levels], *, formats: dict = _FORMATS, terminator: str = "",
+                            batch_size: int = 0, flush_interval: float = 0.5, colors: _ColorSupport = None) -> _logging.StreamHandler:
+        if batch_size > 0:
+            handler = _BufferedStreamHandler(stream=_sys.stdout, batch_size=batch_size, flush_interval=flush_interval)
+        else:
+            handler = _logging.StreamHandler(stream=_sys.stdout)
         return LoggerBuilder.__setup_handler(
-            handler=_logging.StreamHandler(stream=_sys.stdout),
-            formatter=_ConsoleFormatter(formats),
+            handler=handler,
+            formatter=_ConsoleFormatter(formats, colors=_ColorSupport.detect(handler.stream) if colors is None else colors),
             level=logs_level,
             terminator=terminator
         )
@@ -62,30 +134,81 @@ class LoggerBuilder:
     @staticmethod
     def get_file_handler(file_name: str, logs_level: _Union[int, _Levels], *, formats: dict = _FORMATS,
                          logs_path: str = None, file_terminator: str = "", file_mode: str = "a", file_enc="utf-8",
-                         file_backups=5, file_max_size=1024 ** 2 * 5) -> _logging.FileHandler:
+                         file_backups=5, file_max_size=1024 ** 2 * 5, file_batch_size: int = 0, file_flush_interval: float = 0.5,
+                         file_fsync_ms: int = 0, file_fsync_records: int = 0, file_fsync_level: _Union[int, _Levels] = None,
+                         file_shared: bool = False, file_format: _Union[str, _FileFormat] = _FileFormat.TEXT,
+                         file_compression: _Union[str, _Compression] = None, file_mmap: bool = False, file_rotate_interval: float = 0,
+                         file_background_rotation: bool = False) -> _logging.Handler:
+        file_format = _FileFormat(file_format)
+        if file_format is _FileFormat.JSON:
+            formatter, file_terminator = _JsonFormatter(formats), "\n"
+        else:
+            formatter = _FileFormatter(formats)
+        if file_shared and (file_format is _FileFormat.BINARY or file_compression or file_rotate_interval):
+            raise ValueError("binary files, compressed backups and time based rotation are not supported with file_shared")
+        if file_mmap and (file_shared or file_format is _FileFormat.BINARY or file_compression or file_rotate_interval):
+            raise ValueError("file_mmap writes text or json segments, it can not be shared, compressed or rotated by time")
         logs_path = logs_path or _os.path.abspath(_os.curdir)
         file_path = _os.path.join(logs_path, file_name)
         if not _os.path.isdir(logs_path):
-            _os.mkdir(logs_path)
+            _os.makedirs(logs_path, exist_ok=True)
+        if file_shared:
+            return LoggerBuilder.__setup_handler(
+                handler=_SharedFileHandler(file_path, maxBytes=file_max_size, backupCount=file_backups, encoding=file_enc),
+                formatter=formatter,
+                level=logs_level,
+                terminator=file_terminator
+            )
+        if file_mmap:
+            return LoggerBuilder.__setup_handler(
+                handler=_MmapFileHandler(file_path, segment_size=file_max_size, backupCount=file_backups, encoding=file_enc),
+                formatter=formatter,
+                level=logs_level,
+                terminator=file_terminator
+            )
         kwargs = {
             "filename": file_path,
             "mode": file_mode,
-            "encoding": file_enc
+            "encoding": file_enc,
+            "batch_size": file_batch_size,
+            "flush_interval": file_flush_interval,
+            "fsync_ms": file_fsync_ms,
+            "fsync_records": file_fsync_records,
+            "fsync_level": file_fsync_level.value if isinstance(file_fsync_level, _Levels) else file_fsync_level,
+            "compression": file_compression
         }
         if file_mode == "a":
             kwargs.update({
                 "backupCount": file_backups,
-                "maxBytes": file_max_size
+                "maxBytes": file_max_size,
+                "interval": file_rotate_interval,
+                "background_rotation": file_background_rotation
             })
+        if file_format is _FileFormat.BINARY:
+            del kwargs["encoding"]
         return LoggerBuilder.__setup_handler(
-            handler=_RotatingFileHandler(**kwargs),
-            formatter=_FileFormatter(formats, is_rfh=file_max_size is not None and file_max_size > 0),
+            handler=_BinaryFileHandler(**kwargs) if file_format is _FileFormat.BINARY else _RotatingFileHandler(**kwargs),
+            formatter=formatter,
             level=logs_level,
             terminator=file_terminator
         )
 
+    @staticmethod
+    def get_queue_handler(handlers: list, logs_level: _Union[int, _Levels], *, queue_size: int = 10000,
+                          queue_policy: _Union[str, _QueuePolicy] = _QueuePolicy.BLOCK) -> _QueueHandler:
+        handler = _QueueHandler(handlers, max_size=queue_size, policy=queue_policy)
+        handler.setLevel(logs_level.value if isinstance(logs_level, _Levels) else logs_level)
+        return handler
+
+    @staticmethod
+    def get_ring_buffer_handler(targets: list, logs_level: _Union[int, _Levels], *, capacity: int = 1000,
+                                trigger_level: _Union[int, _Levels] = _Levels.ERROR) -> _RingBufferHandler:
+        handler = _RingBufferHandler(targets, capacity=capacity, trigger_level=trigger_level.value if isinstance(trigger_level, _Levels) else trigger_level)
+        handler.setLevel(logs_level.value if isinstance(logs_level, _Levels) else logs_level)
+        return handler
+
     @staticmethod
     def remove_handlers(logger, _filter):
         for handler in list(logger.handlers):
             if _filter(handler):
-                logger.handlers.remove(handler)
+                logger.removeHandler(handler)
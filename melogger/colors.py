@@ -1,3 +1,9 @@
+import os as _os
+import re as _re
+from enum import Enum as _Enum
+from functools import lru_cache as _lru_cache
+
+
 class Colors:
     END = "\033[0m"
 
@@ -69,11 +75,102 @@ class Colors:
         GREY = "\033[47m"
 
     @staticmethod
+    @_lru_cache(maxsize=256)
     def rgb(r_val, g_val, b_val) -> str:
         return f"\033[38;2;{r_val};{g_val};{b_val}m"
 
     @staticmethod
+    @_lru_cache(maxsize=256)
     def hex(hex_val: str) -> str:
         hex_val = hex_val[1:] if hex_val.startswith("#") else hex_val
         rgb = tuple(int(hex_val[i:i + 2], 16) for i in (0, 2, 4))
         return f"\033[38;2;{rgb[0]};{rgb[1]};{rgb[2]}m"
+
+
+class ColorSupport(_Enum):
+    """ Colors a stream can display """
+    NONE = 0
+    BASIC = 16
+    EXTENDED = 256
+    TRUECOLOR = 2 ** 24
+
+    @staticmethod
+    def detect(stream) -> "ColorSupport":
+        """
+        Color support of `stream`: NO_COLOR disables colors, FORCE_COLOR (0-3) forces them, otherwise streams that are
+        not a TTY get no colors and TERM / COLORTERM tell the rest.
+        """
+        if _os.environ.get("NO_COLOR"):
+            return ColorSupport.NONE
+        if (force := _os.environ.get("FORCE_COLOR")) is not None:
+            return {"0": ColorSupport.NONE, "false": ColorSupport.NONE, "2": ColorSupport.EXTENDED, "3": ColorSupport.TRUECOLOR}.get(force.lower(), ColorSupport.BASIC)
+        try:
+            if not stream.isatty():
+                return ColorSupport.NONE
+        except (AttributeError, ValueError):
+            return ColorSupport.NONE
+        term = _os.environ.get("TERM", "")
+        if term == "dumb":
+            return ColorSupport.NONE
+        if _os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit") or _os.environ.get("WT_SESSION"):
+            return ColorSupport.TRUECOLOR
+        return ColorSupport.EXTENDED if "256" in term else ColorSupport.BASIC
+
+
+class Palette:
+    """ Escape codes converted down to what a ColorSupport level can display, memoized per code. """
+    ESCAPE_REGEX = _re.compile(r"\033\[([\d;]*)([A-Za-z])")
+    BASIC_RGB = ((0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+                 (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255), (255, 255, 255))
+    MAX_CACHED = 256
+
+    def __init__(self, support: ColorSupport):
+        self.support = support
+        self.__codes = {}
+
+    def __call__(self, code: str) -> str:
+        """ `code` - one or more escape codes - converted for this palette """
+        if (converted := self.__codes.get(code)) is None:
+            converted = "" if self.support is ColorSupport.NONE else self.ESCAPE_REGEX.sub(self.__convert, code)
+            if len(self.__codes) < self.MAX_CACHED:
+                self.__codes[code] = converted
+        return converted
+
+    def text(self, text: str) -> str:
+        """ Every escape code of `text` converted for this palette """
+        if self.support is ColorSupport.TRUECOLOR or "\033" not in text:
+            return text
+        return self.ESCAPE_REGEX.sub(lambda match: self(match.group(0)), text)
+
+    def __convert(self, match: _re.Match) -> str:
+        if match.group(2) != "m" or self.support is ColorSupport.TRUECOLOR:
+            return match.group(0)
+        params, converted = match.group(1).split(";"), []
+        while params:
+            param = params.pop(0)
+            if param in ("38", "48") and len(params) >= 2 and params[0] in ("2", "5"):
+                kind = params.pop(0)
+                if kind == "2" and len(params) >= 3:
+                    rgb = tuple(int(params.pop(0) or 0) for _ in range(3))
+                else:
+                    rgb = self.__index_rgb(int(params.pop(0) or 0))
+                converted.append(self.__color(rgb, background=param == "48"))
+            else:
+                converted.append(param)
+        return f"\033[{';'.join(converted)}m"
+
+    def __color(self, rgb: tuple, background: bool) -> str:
+        if self.support is ColorSupport.EXTENDED:
+            r, g, b = (round(value / 255 * 5) for value in rgb)
+            return f"{48 if background else 38};5;{16 + 36 * r + 6 * g + b}"
+        index = min(range(16), key=lambda i: sum((a - b) ** 2 for a, b in zip(self.BASIC_RGB[i], rgb)))
+        return str((40 if background else 30) + index if index < 8 else (100 if background else 90) + index - 8)
+
+    @classmethod
+    def __index_rgb(cls, index: int) -> tuple:
+        if index < 16:
+            return cls.BASIC_RGB[index]
+        if index < 232:
+            index -= 16
+            return tuple(0 if value == 0 else 55 + value * 40 for value in (index // 36, index // 6 % 6, index % 6))
+        return (8 + (index - 232) * 10,) * 3
@@ -0,0 +1,107 @@
+"""
+Streaming decoder of binary log files (file_format="binary"): records are rendered back through the level formats,
+as the text file handler writes them.
+
+    python -m melogger.decode app.log.1 app.log
+    python -m melogger.decode --follow app.log
+    cat app.log | python -m melogger.decode
+"""
+import argparse as _argparse
+import logging as _logging
+import struct as _struct
+import sys as _sys
+import time as _time
+from typing import Iterator as _Iterator
+
+from .format import FileFormatter as _FileFormatter
+from .handlers._binary import MAGIC, FRAME, STRING, SITE, RECORD, FRAME_RESET, FRAME_STRING, FRAME_SITE, FRAME_RECORD
+from .utils import FORMATS as _FORMATS
+
+
+def read_records(stream, follow: bool = False, poll_interval: float = 0.25) -> _Iterator[_logging.LogRecord]:
+    """
+    Records of a binary log `stream` (opened "rb"), read one frame at a time. A truncated last frame ends the records,
+    unless `follow` is set: then the stream is polled for more data every `poll_interval` seconds, like `tail -f`.
+    A corrupt frame raises ValueError with its offset in the stream.
+    """
+    if (magic := _read(stream, len(MAGIC), follow, poll_interval)) != MAGIC:
+        raise ValueError(f"Not a binary log file: {magic!r}")
+    strings, sites = {}, {}
+    offset = len(MAGIC)
+    while (header := _read(stream, FRAME.size, follow, poll_interval)) is not None:
+        kind, size = FRAME.unpack(header)
+        if (payload := _read(stream, size, follow, poll_interval)) is None:
+            return
+        try:
+            record = _read_frame(kind, payload, strings, sites)
+        except (KeyError, _struct.error) as e:
+            raise ValueError(f"Corrupt frame of kind {kind} at offset {offset}") from e
+        offset += FRAME.size + size
+        if record is not None:
+            yield record
+
+
+def _read_frame(kind: int, payload: bytes, strings: dict, sites: dict) -> _logging.LogRecord | None:
+    """ Apply one frame to the string and call site tables, the record of a record frame """
+    if kind == FRAME_RESET:
+        strings.clear()
+        sites.clear()
+    elif kind == FRAME_STRING:
+        strings[STRING.unpack_from(payload)[0]] = payload[STRING.size:].decode("utf-8", "surrogateescape")
+    elif kind == FRAME_SITE:
+        site_id, levelno, *ids, process, thread, lineno = SITE.unpack_from(payload)
+        level_name, module, function, prefix, terminator = (strings[string_id] for string_id in ids)
+        sites[site_id] = {"levelno": levelno, "levelname": level_name, "module": module, "funcName": function, "process": process,
+                          "thread": thread, "lineno": lineno, "prefix": prefix, "terminator": terminator,
+                          "crt_module": module, "crt_method_name": function}
+    elif kind == FRAME_RECORD:
+        created, site_id = RECORD.unpack_from(payload)
+        record = _logging.makeLogRecord(sites[site_id])
+        record.created, record.msecs = created, int((created - int(created)) * 1000) + 0.0
+        record.msg = payload[RECORD.size:].decode("utf-8", "surrogateescape")
+        return record
+    return None
+
+
+def _read(stream, size: int, follow: bool, poll_interval: float) -> bytes | None:
+    data = stream.read(size)
+    while len(data) < size:
+        if not follow:
+            return None
+        _time.sleep(poll_interval)
+        data += stream.read(size - len(data))
+    return data
+
+
+def decode(stream, output, formats: dict = _FORMATS, follow: bool = False) -> None:
+    """ Write the records of binary log `stream` to the text `output`, rendered through `formats` """
+    formatter = _FileFormatter(formats)
+    for record in read_records(stream, follow):
+        output.write(formatter.format(record))
+        if follow:
+            output.flush()
+
+
+def main(argv: list = None) -> int:
+    parser = _argparse.ArgumentParser(prog="python -m melogger.decode", description="Render binary melogger files as text.")
+    parser.add_argument("files", nargs="*", default=["-"], help="binary log files, oldest first - `-` or nothing reads stdin")
+    parser.add_argument("-f", "--follow", action="store_true", help="keep reading the last file as it grows")
+    args = parser.parse_args(argv)
+    try:
+        for i, file_name in enumerate(args.files):
+            follow = args.follow and i == len(args.files) - 1
+            if file_name == "-":
+                decode(_sys.stdin.buffer, _sys.stdout, follow=follow)
+            else:
+                with open(file_name, "rb") as stream:
+                    decode(stream, _sys.stdout, follow=follow)
+    except ValueError as e:
+        print(f"{parser.prog}: {file_name}: {e}", file=_sys.stderr)
+        return 1
+    except (BrokenPipeError, KeyboardInterrupt):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    _sys.exit(main())
@@ -1,4 +1,5 @@
 from ._console import _ConsoleFormatter as ConsoleFormatter
 from ._file import _FileFormatter as FileFormatter
+from ._json import _JsonFormatter as JsonFormatter
 
-__all__ = ["ConsoleFormatter", "FileFormatter"]
+__all__ = ["ConsoleFormatter", "FileFormatter", "JsonFormatter"]
@@ -1,27 +1,41 @@
 import logging as _logging
 import os
-import re
-from copy import deepcopy as _deepcopy
+import threading as _threading
+import time as _time
 from typing import Literal, Mapping, Any
 
-from melogger.colors import Colors as _Colors
+from melogger.colors import Colors as _Colors, ColorSupport, Palette as _Palette
 from melogger.utils import Levels
+from . import _sanitize
+from ._template import compile_formats as _compile_formats
+from ._view import _RecordView
 
 
 class _ConsoleFormatter(_logging.Formatter):
     LINE_SEP = os.linesep
-    ANSI_REGEX = r"\033\[[\d;]*[A-Za-z]"
+    ANSI_REGEX = _sanitize.ANSI_REGEX
+    MAX_THREADS = 1024
     _logging.addLevelName(Levels.PLAIN.value, "PLAIN")
-    prev_message = None
 
-    def __init__(self, message_formats: dict, fmt: str = None, date_fmt: str = None, style: Literal["%", "{", "$"] = "%", validate: bool = True, *, defaults: Mapping[str, Any] = None):
+    def __init__(self, message_formats: dict, fmt: str = None, date_fmt: str = None, style: Literal["%", "{", "$"] = "%", validate: bool = True, *, defaults: Mapping[str, Any] = None,
+                 colors: ColorSupport = ColorSupport.TRUECOLOR):
         self.level_data = None
+        self.palette = _Palette(colors)
+        self._colors = {level: self.palette(level_data.color) for level, level_data in message_formats.items()}
         self.FORMATS = message_formats
+        self._templates = _compile_formats(message_formats)
+        self._terminators = {}
+        self.__time_cache = (None, None, None, "")
         super().__init__(fmt, date_fmt, style, validate, defaults=defaults)
 
+    @property
+    def uses_caller(self) -> bool:
+        """ True when any level format renders the caller (module, function, line ...) """
+        return any(template.uses_caller for template in self._templates.values())
+
     def format(self, message: _logging.LogRecord) -> str:
-        formatted_message = self._format(_deepcopy(message))
-        self.__set_prev_message(message)
+        formatted_message = self._format(_RecordView(message))
+        self.__set_prev_terminator(message)
         return formatted_message
 
     def _format(self, message: _logging.LogRecord) -> str:
@@ -36,26 +50,80 @@ class _ConsoleFormatter(_logging.Formatter):
         self.level_data = self.FORMATS.get(message.levelno)
         message.level_name = self.level_data.label
         self.custom_format(message)
-        return _logging.Formatter(self.level_data.text_format).format(message)
+        return self._render(message, self._templates[message.levelno])
+
+    def _render(self, message: _RecordView, template) -> str:
+        message.message = message.getMessage()
+        if template.uses_time:
+            message.asctime = self.formatTime(message, self.datefmt)
+        values = message.values()
+        if defaults := self._style._defaults:
+            values = defaults | values
+        text = template.render(values)
+        if message.exc_info and not message.exc_text:
+            message.exc_text = self.formatException(message.exc_info)
+        if message.exc_text:
+            text = (text if text[-1:] == "\n" else text + "\n") + message.exc_text
+        if message.stack_info:
+            text = (text if text[-1:] == "\n" else text + "\n") + self.formatStack(message.stack_info)
+        return text
+
+    def formatTime(self, message: _logging.LogRecord, datefmt: str = None) -> str:
+        """
+        Same output as logging.Formatter.formatTime, but the date and time are rendered once per second and only the
+        milliseconds are added per record. The cache is also dropped when the timezone changes (time.tzset()).
+        """
+        second = int(message.created)
+        cache = self.__time_cache
+        if cache[0] != second or cache[1] is not _time.tzname or cache[2] != datefmt:
+            text = _time.strftime(datefmt or self.default_time_format, self.converter(message.created))
+            self.__time_cache = cache = (second, _time.tzname, datefmt, text)
+        if datefmt or not self.default_msec_format:
+            return cache[3]
+        return self.default_msec_format % (cache[3], message.msecs)
 
     def custom_format(self, message: _logging.LogRecord) -> None:
-        message.col_end = _Colors.END
-        message.col_start = self.level_data.color if not hasattr(message, "col_start") else "".join(re.findall(self.ANSI_REGEX, message.col_start))
-        if self.prev_message is not None and message.levelno < Levels.PLAIN.value and '\r' not in message.prefix and '\n' not in self.prev_message.terminator:
+        self.__set_colors(message)
+        prev_terminator = self.prev_terminator(message)
+        if prev_terminator is not None and message.levelno < Levels.PLAIN.value and '\r' not in message.prefix and '\n' not in prev_terminator:
             message.prefix = '\n' + message.prefix
 
-    @classmethod
-    def __set_prev_message(cls, message: _logging.LogRecord) -> None:
-        cls.prev_message = message
+    def __set_colors(self, message: _logging.LogRecord) -> None:
+        # colors are converted down to what the stream displays, with no color work at all for ColorSupport.NONE
+        support = self.palette.support
+        if support is ColorSupport.NONE:
+            message.col_start, message.col_end = "", ""
+            message.msg = _sanitize.strip_ansi(message.msg)
+            return
+        message.col_end = _Colors.END
+        if not hasattr(message, "col_start"):
+            message.col_start = self._colors.get(message.levelno) or self.palette(self.level_data.color)
+        elif support is ColorSupport.TRUECOLOR:
+            message.col_start = _sanitize.ansi_codes(message.col_start)
+        else:
+            message.col_start = self.palette(_sanitize.ansi_codes(message.col_start))
+            if isinstance(message.msg, str):
+                message.msg = self.palette.text(message.msg)
+
+    def prev_terminator(self, message: _logging.LogRecord) -> str | None:
+        """ Terminator of the previous record this formatter handled from the thread that logged `message`. """
+        return self._terminators.get(message.thread)
+
+    def __set_prev_terminator(self, message: _logging.LogRecord) -> None:
+        # line continuation (end="", "\r" prefixes) is tracked per formatter - so per handler - and per logging thread
+        if len(self._terminators) >= self.MAX_THREADS and message.thread not in self._terminators:
+            alive = {thread.ident for thread in _threading.enumerate()}
+            self._terminators = {thread: terminator for thread, terminator in self._terminators.items() if thread in alive}
+        self._terminators[message.thread] = message.terminator
 
     # noinspection PyUnresolvedReferences
     @staticmethod
     def __validate_pref(message: _logging.LogRecord):
-        if hasattr(message, "prefix") and len(re.sub(r"[ \t\r]", "", message.prefix)) > 0:
-            raise ValueError("prefix supports only ` `, `\\t` or `\\r`")
+        if hasattr(message, "prefix"):
+            _sanitize.validate_prefix(message.prefix)
 
     # noinspection PyUnresolvedReferences
     @staticmethod
     def __validate_terminator(message: _logging.LogRecord):
-        if hasattr(message, "terminator") and len(re.sub(r"\n", "", message.terminator)) > 0:
-            raise ValueError("terminator supports only new line")
+        if hasattr(message, "terminator"):
+            _sanitize.validate_terminator(message.terminator)
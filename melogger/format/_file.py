@@ -1,29 +1,26 @@
 import logging as _logging
-import re
-from copy import deepcopy as _deepcopy
+import warnings as _warnings
 from typing import Literal, Mapping, Any
 
+from . import _sanitize
 from ._console import _ConsoleFormatter
+from ..colors import ColorSupport
 from ..utils import Levels
 
 
 class _FileFormatter(_ConsoleFormatter):
 
-    def __init__(self, message_formats: dict, fmt: str = None, date_fmt: str = None, style: Literal["%", "{", "$"] = "%", validate: bool = True, *, defaults: Mapping[str, Any] = None, is_rfh: bool = False):
-        self.__is_rfh = is_rfh
-        super().__init__(message_formats, fmt, date_fmt, style, validate, defaults=defaults)
-
-    def format(self, message: _logging.LogRecord) -> str:
-        if self.__is_rfh is True and not hasattr(message, str(id(message))):
-            test_message = self._format(_deepcopy(message))
-            setattr(message, str(id(message)), True)
-            return test_message
-        return super().format(message)
+    def __init__(self, message_formats: dict, fmt: str = None, date_fmt: str = None, style: Literal["%", "{", "$"] = "%", validate: bool = True, *, defaults: Mapping[str, Any] = None,
+                 colors: ColorSupport = ColorSupport.TRUECOLOR, is_rfh: bool = False):
+        # is_rfh is deprecated and ignored: RotatingFileHandler formats every record once, no second pass to tell apart
+        if is_rfh:
+            _warnings.warn("FileFormatter(is_rfh=...) is deprecated and ignored", DeprecationWarning, stacklevel=2)
+        super().__init__(message_formats, fmt, date_fmt, style, validate, defaults=defaults, colors=colors)
 
     # noinspection PyTypeChecker
     def custom_format(self, message: _logging.LogRecord) -> None:
         message.col_start, message.col_end = "", ""
-        message.msg = re.sub(self.ANSI_REGEX, "", message.msg)
+        message.msg = _sanitize.strip_ansi(message.msg)
         self.__handle_pref(message)
 
     # noinspection PyTypeChecker
@@ -32,9 +29,8 @@ class _FileFormatter(_ConsoleFormatter):
         if message_cr := len(split_cr) > 1:
             message.prefix = f'\r{split_cr[-1]}'
 
-        if self.prev_message is not None:
-            prev_new_line = '\n' in self.prev_message.terminator
-            if prev_new_line:
+        if (prev_terminator := self.prev_terminator(message)) is not None:
+            if '\n' in prev_terminator:
                 message.prefix = message.prefix.replace('\r', "")
             elif message_cr:
                 message.prefix = message.prefix.replace('\r', "\n")
@@ -0,0 +1,74 @@
+import json as _json
+import logging as _logging
+from json.encoder import encode_basestring as _encode_str
+
+from . import _sanitize
+from ._console import _ConsoleFormatter
+
+
+def _dump(value) -> str:
+    """ JSON of `value`: str, int, float, bool and None are written directly, anything else goes through json.dumps """
+    value_type = type(value)
+    if value_type is str:
+        return _encode_str(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value_type is bool:
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if value_type is float:
+        return float.__repr__(value) if value - value == 0 else _encode_str(_NON_FINITE[str(value)])
+    try:
+        return _json.dumps(value, ensure_ascii=False, default=str, allow_nan=False)
+    except ValueError:
+        return _json.dumps(_finite(value), ensure_ascii=False, default=str)
+
+
+# NaN and infinity are not JSON numbers, they are written as the strings JavaScript uses for them
+_NON_FINITE = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _finite(value):
+    """ `value` with the NaN and infinite floats nested in its lists, tuples and dicts replaced by strings """
+    if isinstance(value, float) and value - value != 0:
+        return _NON_FINITE[str(value)]
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    return value
+
+
+class _JsonFormatter(_ConsoleFormatter):
+    """
+    One JSON object per record (NDJSON): timestamp, level, module, function, process, message and the custom extras
+    passed to the log call, sorted by name. Colors, prefixes and terminators are not written - every record is one line.
+    Extras named like a key of the record (timestamp, level, function) are written as `extra_<name>`, so no key repeats.
+    """
+    RECORD_FIELDS = frozenset(_logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+    INTERNAL_FIELDS = frozenset({"prefix", "terminator", "col_start", "col_end", "crt_module", "crt_method_name", "level_name"})
+    EXCLUDED_FIELDS = RECORD_FIELDS | INTERNAL_FIELDS
+    RESERVED_KEYS = frozenset({"timestamp", "level", "module", "function", "process", "message", "exc_info", "stack_info"})
+
+    @property
+    def uses_caller(self) -> bool:
+        return True
+
+    def format(self, message: _logging.LogRecord) -> str:
+        level_data = self.FORMATS.get(message.levelno)
+        fields = message.__dict__
+        text = (f'{{"timestamp": {_encode_str(self.formatTime(message, self.datefmt))}'
+                f', "level": {_encode_str(level_data.label if level_data else message.levelname)}'
+                f', "module": {_dump(fields.get("crt_module", message.module))}'
+                f', "function": {_dump(fields.get("crt_method_name", message.funcName))}'
+                f', "process": {_dump(message.process)}'
+                f', "message": {_encode_str(_sanitize.strip_ansi(message.getMessage()))}')
+        if extras := fields.keys() - self.EXCLUDED_FIELDS:
+            text += "".join([f", {_encode_str(f'extra_{key}' if key in self.RESERVED_KEYS else key)}: {_dump(fields[key])}"
+                             for key in sorted(extras)])
+        if message.exc_info:
+            text += f', "exc_info": {_encode_str(self.formatException(message.exc_info))}'
+        if message.stack_info:
+            text += f', "stack_info": {_encode_str(self.formatStack(message.stack_info))}'
+        return text + "}"
@@ -0,0 +1,44 @@
+import re as _re
+
+ANSI_REGEX = _re.compile(r"\033\[[\d;]*[A-Za-z]")
+PREFIX_REGEX = _re.compile(r"[ \t\r]*")
+TERMINATOR_REGEX = _re.compile(r"\n*")
+MAX_CACHED = 256
+
+_valid_prefixes = set()
+_valid_terminators = set()
+_ansi_codes = {}
+
+
+def strip_ansi(text) -> str:
+    """ `text` (str() of it, when it is not a str) without ANSI escape codes. Text without ESC is returned as it is. """
+    if not isinstance(text, str):
+        text = str(text)
+    return ANSI_REGEX.sub("", text) if "\033" in text else text
+
+
+def ansi_codes(text: str) -> str:
+    """ Only the ANSI escape codes of `text`, joined. """
+    if (codes := _ansi_codes.get(text)) is None:
+        codes = "".join(ANSI_REGEX.findall(text)) if "\033" in text else ""
+        if len(_ansi_codes) < MAX_CACHED:
+            _ansi_codes[text] = codes
+    return codes
+
+
+def validate_prefix(prefix: str) -> None:
+    if prefix in _valid_prefixes:
+        return
+    if not PREFIX_REGEX.fullmatch(prefix):
+        raise ValueError("prefix supports only ` `, `\\t` or `\\r`")
+    if len(_valid_prefixes) < MAX_CACHED:
+        _valid_prefixes.add(prefix)
+
+
+def validate_terminator(terminator: str) -> None:
+    if terminator in _valid_terminators:
+        return
+    if not TERMINATOR_REGEX.fullmatch(terminator):
+        raise ValueError("terminator supports only new line")
+    if len(_valid_terminators) < MAX_CACHED:
+        _valid_terminators.add(terminator)
@@ -0,0 +1,38 @@
+import logging as _logging
+import re as _re
+
+
+class _Template:
+    """ A `%`-style template parsed once, at build time, and rendered against a record's attributes. """
+    FIELD_REGEX = _re.compile(r"%%|%\((?P<name>\w+)\)[#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa]")
+    CALLER_FIELDS = frozenset({"module", "funcName", "filename", "lineno", "pathname", "crt_module", "crt_method_name"})
+
+    __slots__ = ("text_format", "fields", "uses_time", "uses_caller")
+
+    def __init__(self, text_format: str):
+        if not isinstance(text_format, str):
+            raise ValueError(f"Invalid format {text_format!r}: expected a str")
+        fields = [match.group("name") for match in self.FIELD_REGEX.finditer(text_format) if match.group("name")]
+        if not fields or "%" in self.FIELD_REGEX.sub("", text_format):
+            raise ValueError(f"Invalid format {text_format!r} for '%' style")
+        self.text_format = text_format
+        self.fields = frozenset(fields)
+        self.uses_time = "asctime" in self.fields
+        self.uses_caller = not self.CALLER_FIELDS.isdisjoint(self.fields)
+
+    def render(self, values) -> str:
+        try:
+            return self.text_format % values
+        except KeyError as e:
+            raise ValueError(f"Formatting field not found in record: {e}")
+
+
+def compile_formats(message_formats: dict) -> dict:
+    """ Compile the `text_format` of every level in `message_formats`, raising ValueError on the first bad template. """
+    templates = {}
+    for level, level_data in message_formats.items():
+        try:
+            templates[level] = _Template(level_data.text_format)
+        except ValueError as e:
+            raise ValueError(f"{_logging.getLevelName(level)}: {e}") from None
+    return templates
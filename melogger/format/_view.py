@@ -0,0 +1,20 @@
+import logging as _logging
+
+from .._record import LAZY_TYPES as _LAZY_TYPES
+
+
+class _RecordView:
+    """
+    Copy-on-write view of a LogRecord for the formatters.
+    Only the attribute dict is copied (shallow), so values set while formatting never reach the record.
+    """
+    getMessage = _logging.LogRecord.getMessage
+
+    def __init__(self, record: _logging.LogRecord):
+        self.__dict__ = record.__dict__.copy()
+        # args and lazy messages are rendered by the record - once for all the formatters - before they are sanitized
+        if record.args or isinstance(record.msg, _LAZY_TYPES):
+            self.msg, self.args = record.getMessage(), ()
+
+    def values(self) -> dict:
+        return self.__dict__
@@ -0,0 +1,9 @@
+from ._binary import _BinaryFileHandler as BinaryFileHandler
+from ._mmap import _MmapFileHandler as MmapFileHandler
+from ._queue import _QueueHandler as QueueHandler
+from ._ring import _RingBufferHandler as RingBufferHandler
+from ._rotating import _RotatingFileHandler as RotatingFileHandler
+from ._shared import _SharedFileHandler as SharedFileHandler
+from ._stream import _BufferedStreamHandler as BufferedStreamHandler
+
+__all__ = ["BinaryFileHandler", "BufferedStreamHandler", "MmapFileHandler", "QueueHandler", "RingBufferHandler", "RotatingFileHandler", "SharedFileHandler"]
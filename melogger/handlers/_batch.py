@@ -0,0 +1,75 @@
+import logging as _logging
+import threading as _threading
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+
+
+class _BatchMixin(_ABC):
+    """
+    Collects formatted records (str, or bytes for files) of a logging.Handler and writes them with one `_write_batch()`
+    call per batch.
+    A batch is written once it holds `batch_size` characters (bytes), on a record at `flush_level` or above, or
+    `flush_interval` seconds after its first record - a background thread, started with the first batch, takes care of
+    the last one.
+    With `flush_partial` a record that does not end the line (`end=""`) is written at once, so the line shows up.
+    """
+
+    def _init_batch(self, batch_size: int, flush_interval: float, flush_level: int = _logging.ERROR, flush_partial: bool = False) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.flush_partial = flush_partial
+        self.__pending = []
+        self.__pending_size = 0
+        self.__wake = _threading.Event()
+        self.__stop = _threading.Event()
+        self.__flusher = None
+
+    @_abstractmethod
+    def _write_batch(self, data: str) -> None:
+        """ Write out the records of one batch, joined """
+
+    def _add_to_batch(self, text: str, levelno: int) -> None:
+        self.__pending.append(text)
+        self.__pending_size += len(text)
+        if (self.__pending_size >= self.batch_size or levelno >= self.flush_level or (self.flush_partial and text[-1:] != "\n")
+                or self.__stop.is_set()):
+            self._commit_batch()
+        elif len(self.__pending) == 1:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """ Have the background thread call flush() in `flush_interval` seconds. """
+        # not alive in a forked child: threads are not copied by fork()
+        if self.__flusher is None or not self.__flusher.is_alive():
+            self.__flusher = _threading.Thread(target=self.__run, name="melogger-batch", daemon=True)
+            self.__flusher.start()
+        self.__wake.set()
+
+    @property
+    def pending_size(self) -> int:
+        return self.__pending_size
+
+    def _commit_batch(self) -> None:
+        if self.__pending:
+            data = self.__pending[0][:0].join(self.__pending)
+            self.__pending.clear()
+            self.__pending_size = 0
+            self._write_batch(data)
+
+    def __run(self) -> None:
+        while not self.__stop.is_set():
+            self.__wake.wait()
+            self.__wake.clear()
+            if not self.__stop.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except Exception:
+                    # the error is raised again by the next write on the logging thread
+                    pass
+
+    def _stop_batch(self) -> None:
+        self.__stop.set()
+        self.__wake.set()
+        if self.__flusher is not None and self.__flusher is not _threading.current_thread():
+            self.__flusher.join()
+        self.__flusher = None
@@ -0,0 +1,108 @@
+import logging as _logging
+import struct as _struct
+from typing import Union as _Union
+
+from ._rotating import _RotatingFileHandler
+from ..format import _sanitize
+from ..utils import Compression as _Compression
+
+MAGIC = b"MELOGBIN\x01\n"
+FRAME = _struct.Struct("<BI")
+STRING = _struct.Struct("<I")
+SITE = _struct.Struct("<IBIIIIIIQI")
+RECORD = _struct.Struct("<dI")
+FRAME_RESET, FRAME_STRING, FRAME_SITE, FRAME_RECORD = 0, 1, 2, 3
+
+
+class _BinaryFileHandler(_RotatingFileHandler):
+    """
+    Rotating file handler writing a compact binary format, decoded with `python -m melogger.decode`.
+
+    A file starts with MAGIC and holds length-prefixed frames (FRAME: type, payload size):
+      - string frames intern the level names, modules, functions, prefixes and terminators
+      - site frames intern what records logged from the same line share: level, string ids, process, thread and line
+      - record frames hold only the time, the site id and the UTF-8 message
+    Strings and sites are written once per file, the first time a record uses them. Appending to an existing file starts
+    with a reset frame, so the ids of the previous writer are dropped.
+    """
+    MAX_INTERNED = 65536
+    HEADER_SIZE = len(MAGIC)
+
+    def __init__(self, filename, mode="a", maxBytes=0, backupCount=0, delay=False, *, batch_size: int = 0, flush_interval: float = 0.5,
+                 fsync_ms: int = 0, fsync_records: int = 0, fsync_level: int = None,
+                 compression: _Union[str, _Compression] = None, interval: float = 0, background_rotation: bool = False):
+        self.__strings = {}
+        self.__sites = {}
+        mode = "wb" if "w" in mode else "ab"
+        super().__init__(filename, mode, maxBytes, backupCount, None, True, None, batch_size=batch_size, flush_interval=flush_interval,
+                         fsync_ms=fsync_ms, fsync_records=fsync_records, fsync_level=fsync_level, compression=compression,
+                         interval=interval, background_rotation=background_rotation)
+        if not delay:
+            self.stream = self._open()
+
+    @property
+    def uses_caller(self) -> bool:
+        return True
+
+    def _start_file(self, stream):
+        stream = super()._start_file(stream)
+        self.__strings, self.__sites = {}, {}
+        if self.size == 0:
+            stream.write(MAGIC)
+            self.size = len(MAGIC)
+        else:
+            stream.write(FRAME.pack(FRAME_RESET, 0))
+            self.size += FRAME.size
+        return stream
+
+    def encode(self, record: _logging.LogRecord) -> bytes:
+        """ Frames of `record`: the strings and the site this file does not hold yet, then the record """
+        fields = record.__dict__
+        site = (record.levelno, record.levelname, fields.get("crt_module", record.module), fields.get("crt_method_name", record.funcName),
+                fields.get("prefix", ""), fields.get("terminator", "\n"), record.process or 0, record.thread or 0, record.lineno or 0)
+        frames = []
+        if (site_id := self.__sites.get(site)) is None:
+            site_id = self.__intern_site(frames, site)
+        message = _sanitize.strip_ansi(record.getMessage())
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _logging.Formatter().formatException(record.exc_info)
+        if record.exc_text:
+            message = (message if message[-1:] == "\n" else message + "\n") + record.exc_text
+        message = message.encode("utf-8", "surrogateescape")
+        frames.append(FRAME.pack(FRAME_RECORD, RECORD.size + len(message)) + RECORD.pack(record.created, site_id) + message)
+        return frames[0] if len(frames) == 1 else b"".join(frames)
+
+    def __intern_site(self, frames: list, site: tuple) -> int:
+        if len(self.__sites) >= self.MAX_INTERNED or len(self.__strings) >= self.MAX_INTERNED:
+            self.__strings.clear()
+            self.__sites.clear()
+            frames.append(FRAME.pack(FRAME_RESET, 0))
+        levelno, *names, process, thread, lineno = site
+        string_ids = [self.__intern_string(frames, name) for name in names]
+        site_id = self.__sites[site] = len(self.__sites)
+        frames.append(FRAME.pack(FRAME_SITE, SITE.size) + SITE.pack(site_id, levelno, *string_ids, process, thread, lineno))
+        return site_id
+
+    def __intern_string(self, frames: list, value) -> int:
+        value = value if isinstance(value, str) else str(value)
+        if (string_id := self.__strings.get(value)) is None:
+            string_id = self.__strings[value] = len(self.__strings)
+            data = value.encode("utf-8", "surrogateescape")
+            frames.append(FRAME.pack(FRAME_STRING, STRING.size + len(data)) + STRING.pack(string_id) + data)
+        return string_id
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            data = self.encode(record)
+            if self._rollover_due(len(data), record):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                data = self.encode(record)
+            self._add_record(data, len(data), record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
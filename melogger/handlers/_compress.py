@@ -0,0 +1,133 @@
+import bz2 as _bz2
+import gzip as _gzip
+import lzma as _lzma
+import os as _os
+import queue as _queue
+import shutil as _shutil
+import sys as _sys
+import tempfile as _tempfile
+import threading as _threading
+import traceback as _traceback
+from typing import Union as _Union
+
+from ..utils import Compression as _Compression
+
+_OPENERS = {_Compression.GZIP: _gzip.open, _Compression.BZ2: _bz2.open, _Compression.LZMA: _lzma.open}
+
+
+class _Job:
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path  # where the uncompressed backup is now - None once rotation dropped it
+
+
+class _BackupCompressor:
+    """
+    Rotates the backups of a log file and compresses them on a background thread, never on the logging thread.
+
+    A new backup `<file>.1` is renamed into place at once and compressed later to `<file>.1.gz` (.bz2, .xz). The
+    rotation cascade moves plain and compressed backups alike, so the order holds while compressions are pending and a
+    rotation never waits for one: jobs follow their backup as it moves and are dropped with it. A compression writes a
+    `.part` file and only replaces the plain backup once it is complete.
+    """
+    _STOP = object()
+    CHUNK_SIZE = 1024 ** 2
+
+    def __init__(self, compression: _Union[str, _Compression]):
+        self.compression = _Compression(compression)
+        self.extension = self.compression.extension
+        self.__open = _OPENERS[self.compression]
+        self.__lock = _threading.Lock()
+        self.__jobs = {}
+        self.__queue = _queue.Queue()
+        self.__thread = None
+
+    def rotate(self, base_filename: str, backup_count: int, source: str = None) -> None:
+        """
+        Move `base_filename` - or the `source` it was moved to - to `<base_filename>.1`, shifting older backups up to
+        `backup_count`, and compress it later
+        """
+        with self.__lock:
+            for i in range(backup_count - 1, 0, -1):
+                backups, destinations = self.__names(base_filename, i), self.__names(base_filename, i + 1)
+                if any(_os.path.exists(path) for path in backups):
+                    self.__remove(destinations)
+                    for path, destination in zip(backups, destinations):
+                        if _os.path.exists(path):
+                            self.__move(path, destination)
+            backup = f"{base_filename}.1"
+            self.__remove(self.__names(base_filename, 1))
+            _os.rename(source or base_filename, backup)
+            self.__jobs[backup] = job = _Job(backup)
+        self.__submit(job)
+
+    def __names(self, base_filename: str, index: int) -> tuple:
+        return f"{base_filename}.{index}", f"{base_filename}.{index}{self.extension}"
+
+    def __move(self, source: str, destination: str) -> None:
+        _os.rename(source, destination)
+        if job := self.__jobs.pop(source, None):
+            job.path = destination
+            self.__jobs[destination] = job
+
+    def __remove(self, paths: tuple) -> None:
+        for path in paths:
+            if _os.path.exists(path):
+                _os.remove(path)
+            if job := self.__jobs.pop(path, None):
+                job.path = None
+
+    def __submit(self, job: _Job) -> None:
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = _threading.Thread(target=self.__run, name="melogger-compress", daemon=True)
+            self.__thread.start()
+        self.__queue.put(job)
+
+    def __run(self) -> None:
+        while (job := self.__queue.get()) is not self._STOP:
+            try:
+                self.__compress(job)
+            except Exception:
+                # the backup stays uncompressed, rotation goes on
+                _traceback.print_exc(file=_sys.stderr)
+            finally:
+                self.__queue.task_done()
+        self.__queue.task_done()
+
+    def __compress(self, job: _Job) -> None:
+        with self.__lock:
+            if job.path is None:
+                return
+            source = open(job.path, "rb")
+        with source:
+            directory, name = _os.path.split(job.path)
+            fd, part = _tempfile.mkstemp(prefix=f"{name}.", suffix=".part", dir=directory)
+            try:
+                with _os.fdopen(fd, "wb") as file, self.__open(file, "wb") as target:
+                    _shutil.copyfileobj(source, target, self.CHUNK_SIZE)
+                with self.__lock:
+                    if job.path is not None:
+                        _os.replace(part, f"{job.path}{self.extension}")
+                        _os.remove(job.path)
+                        del self.__jobs[job.path]
+                        job.path = None
+            finally:
+                if _os.path.exists(part):
+                    _os.remove(part)
+
+    @property
+    def pending(self) -> int:
+        """ Backups not compressed yet """
+        return self.__queue.unfinished_tasks
+
+    def join(self) -> None:
+        """ Wait for the pending compressions """
+        if self.__thread is not None and self.__thread.is_alive():
+            self.__queue.join()
+
+    def close(self) -> None:
+        if self.__thread is not None and self.__thread.is_alive():
+            self.__queue.put(self._STOP)
+            self.__thread.join()
+        self.__thread = None
@@ -0,0 +1,126 @@
+import logging as _logging
+import mmap as _mmap
+import os as _os
+import re as _re
+
+
+class _MmapFileHandler(_logging.Handler):
+    """
+    File handler writing records straight into memory mapped, preallocated segments `<file>.000001`, `<file>.000002` ...
+    Logging a record costs a copy into the mapping instead of a write() call; the OS writes the pages out.
+
+    A full segment is truncated to its used length and the next one is mapped - this takes the place of size based
+    rotation, the `backupCount` newest full segments are kept. close() truncates the last segment to its used length.
+    After a crash the last segment is still full size: its end is found again by skipping the NUL bytes of the unused
+    space, which is why NUL characters of records are written as `\\0`.
+    """
+    SEGMENT_DIGITS = 6
+    RECOVERY_CHUNK = 64 * 1024
+
+    def __init__(self, filename: str, segment_size: int = 16 * 1024 ** 2, backupCount: int = 0, encoding: str = "utf-8", errors: str = None):
+        super().__init__()
+        self.baseFilename = _os.path.abspath(filename)
+        self.segment_size = segment_size
+        self.backupCount = backupCount
+        self.encoding = encoding or "utf-8"
+        self.errors = errors or "strict"
+        self.terminator = "\n"
+        self.segment = None
+        self.position = 0
+        self.__fd = None
+        self.__map = None
+        self.__segment_regex = _re.compile(rf"{_re.escape(_os.path.basename(self.baseFilename))}\.(\d{{{self.SEGMENT_DIGITS}}})")
+        self.__open_last_segment()
+
+    def segments(self) -> list:
+        """ Paths of the segments on disk, oldest first """
+        directory = _os.path.dirname(self.baseFilename)
+        numbers = sorted(int(match.group(1)) for name in _os.listdir(directory) if (match := self.__segment_regex.fullmatch(name)))
+        return [self.__segment_path(number) for number in numbers]
+
+    def __segment_path(self, number: int) -> str:
+        return f"{self.baseFilename}.{number:0{self.SEGMENT_DIGITS}d}"
+
+    def __open_last_segment(self) -> None:
+        segments = self.segments()
+        if not segments:
+            self.__map_segment(1, self.segment_size)
+            return
+        number = int(segments[-1].rsplit(".", 1)[1])
+        if _os.path.getsize(segments[-1]) >= self.segment_size:
+            # not closed cleanly - the last record ends before the NUL bytes of the preallocated space
+            self.__map_segment(number, _os.path.getsize(segments[-1]), create=False)
+            self.position = self.__used_length()
+        else:
+            self.__map_segment(number + 1, self.segment_size)
+
+    def __map_segment(self, number: int, size: int, create: bool = True) -> None:
+        path = self.__segment_path(number)
+        self.__fd = _os.open(path, _os.O_RDWR | _os.O_CREAT | (_os.O_TRUNC if create else 0), 0o644)
+        if create:
+            if hasattr(_os, "posix_fallocate"):
+                _os.posix_fallocate(self.__fd, 0, size)
+            else:
+                _os.ftruncate(self.__fd, size)
+        self.__map = _mmap.mmap(self.__fd, size)
+        self.segment = path
+        self.position = 0
+
+    def __used_length(self) -> int:
+        end = len(self.__map)
+        while end > 0:
+            start = max(0, end - self.RECOVERY_CHUNK)
+            if used := len(self.__map[start:end].rstrip(b"\0")):
+                return start + used
+            end = start
+        return 0
+
+    def __unmap_segment(self) -> None:
+        if self.__map is not None:
+            self.__map.flush()
+            self.__map.close()
+            _os.ftruncate(self.__fd, self.position)
+            _os.close(self.__fd)
+        self.__map, self.__fd = None, None
+
+    def doRollover(self, size: int = 0) -> None:
+        """ Truncate the current segment and map the next one, large enough for a record of `size` bytes """
+        number = int(self.segment.rsplit(".", 1)[1]) + 1
+        self.__unmap_segment()
+        self.__map_segment(number, max(size, self.segment_size))
+        for path in self.segments()[:-self.backupCount - 1]:
+            _os.remove(path)
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            text = f"{self.format(record)}{self.terminator}"
+            data = (text.replace("\0", "\\0") if "\0" in text else text).encode(self.encoding, self.errors)
+            if self.__map is None:
+                self.__open_last_segment()
+            end = self.position + len(data)
+            if end > len(self.__map):
+                self.doRollover(len(data))
+                end = len(data)
+            self.__map[self.position:end] = data
+            self.position = end
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """ Write the mapped pages out to the file (msync) """
+        self.acquire()
+        try:
+            if self.__map is not None:
+                self.__map.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.__unmap_segment()
+        finally:
+            self.release()
+        super().close()
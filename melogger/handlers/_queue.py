@@ -0,0 +1,243 @@
+import asyncio as _asyncio
+import logging as _logging
+import os as _os
+import queue as _queue
+import threading as _threading
+import weakref as _weakref
+from typing import Iterable as _Iterable, Union as _Union
+
+from ..utils import QueuePolicy as _QueuePolicy
+
+_STOP = object()
+
+
+class _RecordQueue(_queue.Queue):
+    """ Bounded queue counting the records ever put on it, so a flush can wait for the ones queued before it """
+
+    def _init(self, maxsize: int) -> None:
+        super()._init(maxsize)
+        self.puts = 0
+
+    def _put(self, item) -> None:
+        self.queue.append(item)
+        if item is not _STOP:
+            self.puts += 1
+
+
+class _FlushRequest:
+    """ An aflush() waiting for the writer thread to hand the first `target` records to the target handlers """
+    __slots__ = ("loop", "future", "target")
+
+    def __init__(self, loop: _asyncio.AbstractEventLoop, target: int):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.target = target
+
+    def resolve(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.__set_result)
+        except RuntimeError:  # the loop was closed while the request waited
+            pass
+
+    def __set_result(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class _QueueHandler(_logging.Handler):
+    """
+    Puts records on a bounded queue, a background writer thread hands them to the target handlers.
+    A full queue blocks the caller, drops the new record or drops the oldest queued record, depending on `policy`.
+    A caller running an asyncio event loop is never blocked: with the block policy, a full queue drops its record.
+    Queued records are written out on flush(), aflush() and close(), which logging.shutdown() calls at interpreter exit.
+    A flush waits only for the records queued before it, other threads can keep logging meanwhile. A forked child
+    starts a writer thread of its own, with an empty queue.
+    """
+    _STOP = _STOP
+    _instances = _weakref.WeakSet()
+
+    def __init__(self, handlers: _Iterable[_logging.Handler], max_size: int = 10000, policy: _Union[str, _QueuePolicy] = _QueuePolicy.BLOCK):
+        super().__init__()
+        self.handlers = list(handlers)
+        self.policy = _QueuePolicy(policy)
+        self.max_size = max_size
+        self.dropped = 0
+        self.__closed = False
+        self.__start()
+        _QueueHandler._instances.add(self)
+
+    def __start(self) -> None:
+        self.queue = _RecordQueue(self.max_size)
+        self.__handled = 0
+        self.__progress = _threading.Condition()
+        self.__requests = []
+        self.__drop_lock = _threading.Lock()
+        self.__thread = _threading.Thread(target=self.__run, name="melogger-queue", daemon=True)
+        self.__thread.start()
+
+    def _after_fork(self) -> None:
+        # the records queued before the fork are written by the parent, the child only needs a writer of its own
+        if not self.__closed:
+            self.__start()
+
+    @property
+    def uses_caller(self) -> bool:
+        return any(getattr(handler, "uses_caller", getattr(handler.formatter, "uses_caller", True)) for handler in self.handlers)
+
+    def setLevel(self, level) -> None:
+        """ Set the level of the target handlers, the queue takes records from the lowest level one of them accepts. """
+        level = _logging._checkLevel(level)
+        for handler in self.handlers:
+            handler.setLevel(level)
+        super().setLevel(min([level, *(handler.level for handler in self.handlers)]))
+
+    def dump(self) -> None:
+        """ Write out the queued records, then dump the records kept by ring buffer targets. """
+        self.flush()
+        for handler in self.handlers:
+            if hasattr(handler, "dump"):
+                handler.dump()
+
+    def handle(self, record: _logging.LogRecord) -> bool:
+        if rv := self.filter(record):
+            self.emit(record)
+        return rv
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        if self.__closed:
+            self.__dispatch(record)
+        elif self.policy is _QueuePolicy.BLOCK:
+            try:
+                self.queue.put_nowait(record)
+            except _queue.Full:
+                if _asyncio._get_running_loop() is not None:
+                    self.__count_drop()
+                else:
+                    self.queue.put(record)
+        elif self.policy is _QueuePolicy.DROP_NEWEST:
+            try:
+                self.queue.put_nowait(record)
+            except _queue.Full:
+                self.__count_drop()
+        else:
+            self.__put_drop_oldest(record)
+
+    def __put_drop_oldest(self, record: _logging.LogRecord) -> None:
+        while not self.__closed:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except _queue.Full:
+                pass
+            try:
+                oldest = self.queue.get_nowait()
+            except _queue.Empty:
+                continue
+            if oldest is self._STOP:
+                self.queue.put_nowait(oldest)
+                self.queue.task_done()
+                break
+            self.__count_drop()
+            self.queue.task_done()
+            self.__record_handled()
+        self.__dispatch(record)
+
+    def __count_drop(self) -> None:
+        with self.__drop_lock:
+            self.dropped += 1
+
+    def __run(self) -> None:
+        while True:
+            record = self.queue.get()
+            try:
+                if record is self._STOP:
+                    return
+                self.__dispatch(record)
+            except Exception:
+                self.handleError(record)
+            finally:
+                # done before the flush waiting for it is answered, so its caller sees no unfinished task
+                self.queue.task_done()
+                if record is not self._STOP:
+                    self.__record_handled()
+
+    def __record_handled(self) -> None:
+        """ Count a record handed to the targets or dropped, and answer the aflush() calls waiting for it """
+        with self.__progress:
+            self.__handled += 1
+            self.__progress.notify_all()
+            if not self.__requests or self.__requests[0].target > self.__handled:
+                return
+            done = [request for request in self.__requests if request.target <= self.__handled]
+            self.__requests = [request for request in self.__requests if request.target > self.__handled]
+        self.__flush_targets()
+        for request in done:
+            request.resolve()
+
+    def __dispatch(self, record: _logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def flush(self) -> None:
+        """ Wait until the records queued so far were handed to the target handlers, then flush them. """
+        if _threading.current_thread() is not self.__thread:
+            target = self.queue.puts
+            with self.__progress:
+                while self.__handled < target and self.__thread.is_alive():
+                    self.__progress.wait(0.1)
+            if not self.__thread.is_alive():
+                self.__drain()
+        self.__flush_targets()
+
+    async def aflush(self) -> None:
+        """
+        Wait, without blocking the event loop, until the records queued so far were handed to the target handlers and
+        they were flushed. The writer thread flushes them once it handled the last of those records.
+        """
+        loop = _asyncio.get_running_loop()
+        if not self.__thread.is_alive():
+            return await loop.run_in_executor(None, self.flush)
+        request = _FlushRequest(loop, self.queue.puts)
+        with self.__progress:
+            if pending := self.__handled < request.target:
+                self.__requests.append(request)
+        if pending:
+            await request.future
+        else:
+            await loop.run_in_executor(None, self.__flush_targets)
+
+    def __flush_targets(self) -> None:
+        for handler in self.handlers:
+            handler.flush()
+
+    def __drain(self) -> None:
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except _queue.Empty:
+                return
+            if record is not self._STOP:
+                self.__dispatch(record)
+            self.queue.task_done()
+            if record is not self._STOP:
+                self.__record_handled()
+
+    def close(self) -> None:
+        self.__closed = True
+        if self.__thread.is_alive() and _threading.current_thread() is not self.__thread:
+            self.queue.put(self._STOP)
+            self.__thread.join()
+        self.__drain()
+        for handler in self.handlers:
+            handler.close()
+        super().close()
+
+
+def _restart_writers() -> None:
+    for handler in list(_QueueHandler._instances):
+        handler._after_fork()
+
+
+if hasattr(_os, "register_at_fork"):
+    _os.register_at_fork(after_in_child=_restart_writers)
@@ -0,0 +1,72 @@
+import logging as _logging
+from typing import Iterable as _Iterable
+
+
+class _RingBufferHandler(_logging.Handler):
+    """
+    Keeps the last `capacity` records below the level of the target handlers - the ones they do not write - in a
+    preallocated ring, unformatted. A record of `trigger_level` or above, or dump(), hands the kept records to the targets,
+    oldest first, so an error is preceded by the DEBUG context that led to it.
+
+    Add it to the logger before its targets. setLevel() sets the level the targets write from: the handler itself keeps
+    accepting records from `capture_level`, and Logger.setLevel keeps the logger enabled for them.
+    """
+
+    def __init__(self, targets: _Iterable[_logging.Handler], capacity: int = 1000, trigger_level: int = _logging.ERROR,
+                 capture_level: int = _logging.DEBUG):
+        super().__init__(capture_level)
+        self.targets = list(targets)
+        self.capacity = capacity
+        self.trigger_level = trigger_level
+        self.target_level = capture_level
+        self.__records = [None] * capacity
+        self.__next = 0
+        self.__count = 0
+
+    @property
+    def uses_caller(self) -> bool:
+        return any(getattr(target, "uses_caller", getattr(target.formatter, "uses_caller", True)) for target in self.targets)
+
+    def setLevel(self, level) -> None:
+        self.target_level = _logging._checkLevel(level)
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        if record.levelno < self.target_level:
+            self.__records[self.__next] = record
+            self.__next = (self.__next + 1) % self.capacity
+            self.__count = min(self.__count + 1, self.capacity)
+        elif record.levelno >= self.trigger_level:
+            self.__dump()
+
+    def dump(self) -> None:
+        """ Hand the kept records to the targets and empty the ring """
+        self.acquire()
+        try:
+            self.__dump()
+        finally:
+            self.release()
+
+    def __dump(self) -> None:
+        if not self.__count:
+            return
+        if self.__count == self.capacity:
+            records = self.__records[self.__next:] + self.__records[:self.__next]
+        else:
+            records = self.__records[:self.__count]
+        self.__records[:] = [None] * self.capacity
+        self.__next = self.__count = 0
+        for record in records:
+            for target in self.targets:
+                target.handle(record)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.__records[:] = [None] * self.capacity
+            self.__next = self.__count = 0
+        finally:
+            self.release()
+        super().close()
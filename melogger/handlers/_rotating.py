@@ -0,0 +1,210 @@
+import logging as _logging
+import os as _os
+import time as _time
+from typing import Union as _Union
+from logging.handlers import RotatingFileHandler as _StdRotatingFileHandler
+
+from ._batch import _BatchMixin
+from ._compress import _BackupCompressor
+from ._rotation import _BackgroundRotator
+from ..utils import Compression as _Compression
+
+
+class _RotatingFileHandler(_BatchMixin, _StdRotatingFileHandler):
+    """
+    Rotating file handler that formats every record once. Files are rotated when they reach `maxBytes`, every
+    `interval` seconds of wall clock time (aligned to local time: 3600 rotates at every hour, 86400 at midnight), or both.
+    The size of the current file is tracked with a running byte count, taken from the file when it is opened. Records
+    are encoded once, here, and the bytes both counted and written to the binary buffer under the text stream (streams
+    without one, like StringIO, get the text).
+
+    With `batch_size` records are group committed: many records are written with one write() (see _BatchMixin).
+    The file is fsync-ed every `fsync_ms` milliseconds, every `fsync_records` records and after every record at
+    `fsync_level` or above - 0 / None turns the policy off; by default durability is what the OS page cache gives.
+    With `compression` (gzip, bz2 or lzma) backups are compressed by a background thread (see _BackupCompressor).
+    With `background_rotation` the logging thread only swaps in a file opened in advance (see _BackgroundRotator).
+    """
+    LINE_SEP_EXTRA = len(_os.linesep) - 1
+    HEADER_SIZE = 0
+
+    def __init__(self, filename, mode="a", maxBytes=0, backupCount=0, encoding=None, delay=False, errors=None, *,
+                 batch_size: int = 0, flush_interval: float = 0.5, fsync_ms: int = 0, fsync_records: int = 0, fsync_level: int = None,
+                 compression: _Union[str, _Compression] = None, interval: float = 0, background_rotation: bool = False):
+        self.size = 0
+        self.interval = interval
+        self.rollover_at = None
+        self.compressor = _BackupCompressor(compression) if compression else None
+        self.rotator = None
+        self.fsync_ms = fsync_ms
+        self.fsync_records = fsync_records
+        self.fsync_level = fsync_level
+        self.__unsynced = 0
+        self.__last_sync = _time.monotonic()
+        self.__sync_pending = False
+        if fsync_ms > 0:
+            flush_interval = min(flush_interval, fsync_ms / 1000)
+        self._init_batch(batch_size, flush_interval, min(_logging.ERROR, fsync_level or _logging.ERROR))
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+        if "b" in mode:  # the stdlib handler switches to text mode "a" when maxBytes is set
+            self.mode, self.encoding, self.errors = "ab" if maxBytes > 0 else mode, None, None
+        if interval > 0:
+            try:
+                self.rollover_at = self.next_rollover(_os.path.getmtime(self.baseFilename))
+            except OSError:
+                self.rollover_at = self.next_rollover(_time.time())
+        if background_rotation and backupCount > 0 and _os.name != "nt":  # Windows can not rename open files
+            self.rotator = _BackgroundRotator(self.baseFilename, backupCount, self.__open_file, self.compressor)
+
+    def __open_file(self, path: str):
+        return self._builtin_open(path, self.mode, encoding=self.encoding, errors=self.errors)
+
+    def _open(self):
+        return self._start_file(super()._open())
+
+    def _start_file(self, stream):
+        """ Called with the stream of every file opened as the log file """
+        try:
+            self.size = _os.path.getsize(self.baseFilename) if "a" in self.mode else 0
+        except OSError:
+            self.size = 0
+        return stream
+
+    def next_rollover(self, now: float) -> float:
+        """ The first `interval` boundary, in local time, after `now` """
+        return now - (now + _time.localtime(now).tm_gmtoff) % self.interval + self.interval
+
+    def encode_text(self, text: str) -> bytes:
+        """ `text` as the text stream would write it: in its encoding, with the line separator of the platform """
+        if self.LINE_SEP_EXTRA:
+            text = text.replace("\n", _os.linesep)
+        return text.encode(getattr(self.stream, "encoding", None) or "utf-8", getattr(self.stream, "errors", None) or "strict")
+
+    def shouldRollover(self, record: _logging.LogRecord, size: int = None) -> bool:
+        """
+        True when the file must be rotated before `record` is written: its interval is over, or the record - `size` bytes,
+        measured here when not given - would take the file to `maxBytes`. A file holding no record is never rotated.
+        """
+        interval_due = self.rollover_at is not None and record.created >= self.rollover_at
+        if self.size <= self.HEADER_SIZE:
+            if interval_due:
+                self.rollover_at = self.next_rollover(record.created)
+            return False
+        if not interval_due:
+            if self.maxBytes <= 0:
+                return False
+            if size is None:
+                if self.stream is None:
+                    self.stream = self._open()
+                size = len(self.encode_text(f"{self.format(record)}{self.terminator}"))
+            if self.size + size < self.maxBytes:
+                return False
+        # Never rollover anything other than regular files (bpo-45401)
+        if _os.path.exists(self.baseFilename) and not _os.path.isfile(self.baseFilename):
+            if interval_due:
+                self.rollover_at = self.next_rollover(record.created)
+            return False
+        return True
+
+    def _rollover_due(self, size: int, record: _logging.LogRecord) -> bool:
+        """ shouldRollover() with the `size` emit() already has """
+        return self.shouldRollover(record, size)
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            text = f"{self.format(record)}{self.terminator}"
+            if self.stream is None:
+                self.stream = self._open()
+            data = self.encode_text(text)
+            if self._rollover_due(len(data), record):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self._add_record(data if hasattr(self.stream, "buffer") else text, len(data), record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _add_record(self, data, size: int, levelno: int) -> None:
+        """ Count and write (or batch) the `size` bytes of one formatted record """
+        self.size += size
+        self.__unsynced += 1
+        if self.fsync_level is not None and levelno >= self.fsync_level:
+            self.__sync_pending = True
+        if self.batch_size > 0:
+            self._add_to_batch(data, levelno)
+        else:
+            self._write_batch(data)
+
+    def _write_batch(self, data) -> None:
+        # the bytes encoded by emit() go to the buffer under a text stream
+        getattr(self.stream, "buffer", self.stream).write(data)
+        self.stream.flush()
+        if self.__sync_pending or 0 < self.fsync_records <= self.__unsynced or self.__sync_due():
+            self.sync()
+        elif self.fsync_ms > 0:
+            self._schedule_flush()
+
+    def __sync_due(self) -> bool:
+        return self.fsync_ms > 0 and self.__unsynced > 0 and (_time.monotonic() - self.__last_sync) * 1000 >= self.fsync_ms
+
+    @property
+    def uses_fsync(self) -> bool:
+        return self.fsync_ms > 0 or self.fsync_records > 0 or self.fsync_level is not None
+
+    def sync(self) -> None:
+        """ fsync the current file """
+        if self.stream is not None and self.__unsynced > 0:
+            _os.fsync(self.stream.fileno())
+        self.__unsynced = 0
+        self.__sync_pending = False
+        self.__last_sync = _time.monotonic()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._commit_batch()
+            super().flush()
+            if self.__sync_due():
+                self.sync()
+        finally:
+            self.release()
+
+    def doRollover(self) -> None:
+        self._commit_batch()
+        if self.uses_fsync:
+            self.sync()
+        self.size = 0
+        if self.rotator is not None:
+            stream, self.stream = self.stream, None
+            if (stream := self.rotator.swap(stream)) is not None:
+                self.stream = self._start_file(stream)
+            elif not self.delay:
+                self.stream = self._open()
+        elif self.compressor is not None and self.backupCount > 0:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            self.compressor.rotate(self.baseFilename, self.backupCount)
+            if not self.delay:
+                self.stream = self._open()
+        else:
+            super().doRollover()
+        if self.interval > 0:
+            self.rollover_at = self.next_rollover(_time.time())
+
+    def close(self) -> None:
+        self._stop_batch()
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self._commit_batch()
+                if self.uses_fsync:
+                    self.sync()
+        finally:
+            self.release()
+        super().close()
+        if self.rotator is not None:
+            self.rotator.close()
+        if self.compressor is not None:
+            self.compressor.close()
@@ -0,0 +1,137 @@
+import glob as _glob
+import os as _os
+import queue as _queue
+import sys as _sys
+import threading as _threading
+import traceback as _traceback
+import weakref as _weakref
+from typing import Callable as _Callable
+
+from ._compress import _BackupCompressor
+
+
+class _BackgroundRotator:
+    """
+    Rotation of a log file with the renames and the open() done on a background thread.
+
+    On rotation the logging thread only renames the full file to `<file>.rotating.<n>` and swaps in the next file, opened
+    in advance as `<file>.next.<pid>.<n>`. The thread then moves the backups up (`<file>.1` ... `<file>.<backup_count>`),
+    moves the full file to `<file>.1` and opens the next file. Rotations are done in order, files left over by a process
+    that died mid rotation are moved into place when the next process starts. A forked child gets a thread and a next
+    file of its own, the rotations queued before the fork are left to the parent.
+    """
+    _STOP = object()
+    _instances = _weakref.WeakSet()
+
+    def __init__(self, base_filename: str, backup_count: int, open_file: _Callable[[str], object], compressor: _BackupCompressor = None):
+        self.base_filename = base_filename
+        self.backup_count = backup_count
+        self.compressor = compressor
+        self.__open_file = open_file
+        self.__next_count = 0
+        self.__sequence = 0
+        self.__closed = False
+        for path in _glob.glob(_glob.escape(base_filename) + ".next.*"):
+            _os.remove(path)
+        leftovers = sorted(_glob.glob(_glob.escape(base_filename) + ".rotating.*"), key=lambda path: int(path.rsplit(".", 1)[1]))
+        self.__start(leftovers)
+        self.__sequence = max([self.__sequence] + [int(path.rsplit(".", 1)[1]) for path in leftovers])
+        _BackgroundRotator._instances.add(self)
+
+    def __start(self, rotations: list) -> None:
+        self.__lock = _threading.Lock()
+        self.__next = None
+        self.__queue = _queue.Queue()
+        for path in rotations:
+            self.__queue.put(path)
+        self.__queue.put(None)
+        self.__thread = _threading.Thread(target=self.__run, name="melogger-rotate", daemon=True)
+        self.__thread.start()
+
+    def _after_fork(self) -> None:
+        # the next file of the parent is the parent's to swap in, the child only closes its copy of the descriptor
+        if self.__next is not None:
+            self.__next[1].close()
+        if not self.__closed:
+            self.__start([])
+
+    def swap(self, stream) -> object:
+        """
+        On the logging thread: close `stream`, move its full file aside and return the next file, opened in advance and
+        renamed to the log file name - None when it is not ready yet, the caller then opens the log file itself.
+        """
+        with self.__lock:
+            prepared, self.__next = self.__next, None
+        if stream is not None:
+            stream.close()
+        self.__sequence += 1
+        while _os.path.exists(rotating := f"{self.base_filename}.rotating.{self.__sequence}"):  # forked processes
+            self.__sequence += 1
+        _os.rename(self.base_filename, rotating)
+        if prepared is not None:
+            _os.rename(prepared[0], self.base_filename)
+        self.__queue.put(rotating)
+        return prepared[1] if prepared is not None else None
+
+    def __run(self) -> None:
+        while (rotating := self.__queue.get()) is not self._STOP:
+            try:
+                if rotating is not None:
+                    self.__rotate(rotating)
+                self.__prepare_next()
+            except Exception:
+                # the full file stays as <file>.rotating.<n>, it is moved into place when the next process starts
+                _traceback.print_exc(file=_sys.stderr)
+            finally:
+                self.__queue.task_done()
+        self.__queue.task_done()
+
+    def __rotate(self, rotating: str) -> None:
+        if self.compressor is not None:
+            self.compressor.rotate(self.base_filename, self.backup_count, source=rotating)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.base_filename}.{i}"
+            if _os.path.exists(source):
+                _os.replace(source, f"{self.base_filename}.{i + 1}")
+        _os.replace(rotating, f"{self.base_filename}.1")
+
+    def __prepare_next(self) -> None:
+        with self.__lock:
+            if self.__next is not None:
+                return
+        self.__next_count += 1
+        path = f"{self.base_filename}.next.{_os.getpid()}.{self.__next_count}"
+        stream = self.__open_file(path)
+        with self.__lock:
+            self.__next = (path, stream)
+
+    @property
+    def pending(self) -> int:
+        """ Rotations not done yet """
+        return self.__queue.unfinished_tasks
+
+    def join(self) -> None:
+        """ Wait for the pending rotations """
+        if self.__thread.is_alive():
+            self.__queue.join()
+
+    def close(self) -> None:
+        self.__closed = True
+        if self.__thread.is_alive():
+            self.__queue.put(self._STOP)
+            self.__thread.join()
+        with self.__lock:
+            prepared, self.__next = self.__next, None
+        if prepared is not None:
+            prepared[1].close()
+            _os.remove(prepared[0])
+
+
+def _restart_rotators() -> None:
+    for rotator in list(_BackgroundRotator._instances):
+        rotator._after_fork()
+
+
+if hasattr(_os, "register_at_fork"):
+    _os.register_at_fork(after_in_child=_restart_rotators)
@@ -0,0 +1,101 @@
+import logging as _logging
+import os as _os
+
+try:
+    import fcntl as _fcntl
+except ImportError:  # Windows - rotation is not coordinated between processes
+    _fcntl = None
+
+
+class _SharedFileHandler(_logging.Handler):
+    """
+    File handler for several processes logging to the same file (pre-fork servers, multiprocessing pools).
+
+    Every record is encoded and appended with a single os.write() on an O_APPEND descriptor, so records of different
+    processes never interleave. Rotation is coordinated through an flock()-ed `<file>.lock`: the process that finds the
+    file full rotates it, the others find it already replaced and only reopen it. The size check and the write are not
+    atomic across processes, so a file can end a few records over `maxBytes`.
+    """
+
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0, encoding: str = "utf-8", errors: str = None):
+        super().__init__()
+        self.baseFilename = _os.path.abspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.encoding = encoding or "utf-8"
+        self.errors = errors or "strict"
+        self.terminator = "\n"
+        self.__fd = None
+        self.__inode = None
+        self.__lock_fd = None
+        self.__lock_pid = None
+        self.__open()
+
+    def __open(self) -> None:
+        self.__fd = _os.open(self.baseFilename, _os.O_WRONLY | _os.O_APPEND | _os.O_CREAT, 0o644)
+        self.__inode = _os.fstat(self.__fd).st_ino
+
+    def __close(self) -> None:
+        if self.__fd is not None:
+            _os.close(self.__fd)
+            self.__fd = None
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            data = f"{self.format(record)}{self.terminator}".encode(self.encoding, self.errors)
+            if self.__fd is None:
+                self.__open()
+            if self.maxBytes > 0 and self.backupCount > 0 and _os.lseek(self.__fd, 0, _os.SEEK_END) + len(data) >= self.maxBytes:
+                self.doRollover(len(data))
+            _os.write(self.__fd, data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self, size: int = 0) -> None:
+        """ Rotate the file if it is still the one this process writes to and still full, then reopen it. """
+        self.__acquire_file_lock()
+        try:
+            try:
+                stat = _os.stat(self.baseFilename)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and stat.st_ino == self.__inode and stat.st_size > 0 and stat.st_size + size >= self.maxBytes:
+                self.__close()
+                self.__rotate_files()
+            self.__close()
+            self.__open()
+        finally:
+            self.__release_file_lock()
+
+    def __rotate_files(self) -> None:
+        for i in range(self.backupCount - 1, 0, -1):
+            source, destination = f"{self.baseFilename}.{i}", f"{self.baseFilename}.{i + 1}"
+            if _os.path.exists(source):
+                _os.replace(source, destination)
+        _os.replace(self.baseFilename, f"{self.baseFilename}.1")
+
+    def __acquire_file_lock(self) -> None:
+        if _fcntl is None:
+            return
+        # flock() locks are shared by forked processes through the inherited descriptor - every process opens its own
+        if self.__lock_pid != _os.getpid():
+            self.__lock_fd = _os.open(f"{self.baseFilename}.lock", _os.O_RDWR | _os.O_CREAT, 0o644)
+            self.__lock_pid = _os.getpid()
+        _fcntl.flock(self.__lock_fd, _fcntl.LOCK_EX)
+
+    def __release_file_lock(self) -> None:
+        if _fcntl is not None:
+            _fcntl.flock(self.__lock_fd, _fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self.__close()
+            if self.__lock_fd is not None and self.__lock_pid == _os.getpid():
+                _os.close(self.__lock_fd)
+            self.__lock_fd = None
+        finally:
+            self.release()
+        super().close()
@@ -0,0 +1,39 @@
+import logging as _logging
+
+from ._batch import _BatchMixin
+
+
+class _BufferedStreamHandler(_BatchMixin, _logging.StreamHandler):
+    """
+    Stream handler that joins records and writes/flushes the stream once per batch instead of once per record.
+    Lines left open with `end=""` are written at once, so `\\r` updates of the same line still show up as they happen.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 1024 * 64, flush_interval: float = 0.5, flush_level: int = _logging.ERROR):
+        super().__init__(stream)
+        self._init_batch(batch_size, flush_interval, flush_level, flush_partial=True)
+
+    def emit(self, record: _logging.LogRecord) -> None:
+        try:
+            self._add_to_batch(f"{self.format(record)}{self.terminator}", record.levelno)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _write_batch(self, data: str) -> None:
+        self.stream.write(data)
+        self.stream.flush()
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._commit_batch()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self._stop_batch()
+        self.flush()
+        super().close()
@@ -1,94 +1,227 @@
+import asyncio as _asyncio
 import logging as _logging
 import sys
 import traceback
 
+from ._callsite import CallSite as _CallSite, _CallSiteCache
+from ._record import _LogRecord
+from ._sampling import _Sampler
+from ._stats import instrument as _instrument, uninstrument as _uninstrument, _TimedCallSites
+from ._suppress import _Suppressor
 from .utils import Levels as _Levels, FORMATS as _FORMATS
 
 
-# noinspection DuplicatedCode
 class Logger(_logging.Logger):
     DIR = "/".join(__file__.split("/")[:-2])
+    CALL_SITES = _CallSiteCache()
+    SUPPRESSED_MESSAGE = "Suppressed {} similar messages"
 
-    def debug(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.DEBUG.value).color)})
-        super().debug(msg, extra=kwargs)
-
-    def info(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.INFO.value).color)})
-        super().info(msg, extra=kwargs)
-
-    def warning(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.WARN.value).color)})
-        super().warning(msg, extra=kwargs)
-
-    def warn(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.WARN.value).color)})
-        super().warning(msg, extra=kwargs)
-
-    def error(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.ERROR.value).color)})
-        super().error(msg, extra=kwargs)
-
-    def exception(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.ERROR.value).color)})
-        super().error(msg, extra=kwargs)
-
-    def critical(self, msg, **kwargs):
-        self.__set_module_and_function(kwargs)
-        kwargs.update({"prefix": kwargs.pop("prefix", "")})
-        kwargs.update({"terminator": kwargs.pop("end", "\n")})
-        kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.CRITICAL.value).color)})
-        super().critical(msg, extra=kwargs)
-
-    def plain(self, msg, **kwargs):
+    def __init__(self, name: str, level: _Levels | int = _logging.NOTSET):
+        super().__init__(name, level.value if isinstance(level, _Levels) else level)
+        self._uses_caller = False
+        self.suppressor = None
+        self.sampler = None
+        self.instrumented = False
+
+    def debug(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.DEBUG.value):
+            self.__log(_Levels.DEBUG.value, msg, args, kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.INFO.value):
+            self.__log(_Levels.INFO.value, msg, args, kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.WARN.value):
+            self.__log(_Levels.WARN.value, msg, args, kwargs)
+
+    def warn(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.WARN.value):
+            self.__log(_Levels.WARN.value, msg, args, kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.ERROR.value):
+            self.__log(_Levels.ERROR.value, msg, args, kwargs)
+
+    def exception(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.ERROR.value):
+            self.__log(_Levels.ERROR.value, msg, args, kwargs)
+
+    def critical(self, msg, *args, **kwargs):
+        if self.isEnabledFor(_Levels.CRITICAL.value):
+            self.__log(_Levels.CRITICAL.value, msg, args, kwargs)
+
+    def plain(self, msg, *args, **kwargs):
         """ Print message without any format. """
         if self.isEnabledFor(_Levels.PLAIN.value):
-            self.__set_module_and_function(kwargs)
-            kwargs.update({"prefix": kwargs.pop("prefix", "")})
-            kwargs.update({"terminator": kwargs.pop("end", "\n")})
-            kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.PLAIN.value).color)})
-            self._log(_Levels.PLAIN.value, msg, tuple(), extra=kwargs)
+            self.__log(_Levels.PLAIN.value, msg, args, kwargs)
 
     def end_execution(self, **kwargs) -> None:
         if sys.exc_info() != (None, None, None):
+            self.__log_suppressed()
+            self.dump()
             self.critical("Execution ended.")
             self.critical(traceback.format_exc())
+            self.flush()
             exit(1)
+        self.__log_suppressed()
+        if self.isEnabledFor(_Levels.INFO.value):
+            kwargs.setdefault("color", _FORMATS.get(_Levels.PLAIN.value).color)
+            self.__log(_Levels.INFO.value, "Execution ended.\n\n", (), kwargs)
+        self.flush()
+
+    def flush(self) -> None:
+        """ Write out everything the handlers hold, queued records included. """
+        for handler in self.handlers:
+            handler.flush()
+
+    async def aflush(self) -> None:
+        """
+        flush() for coroutines: wait until the queued records were written without blocking the event loop. Handlers
+        without a queue are flushed on a worker thread.
+        """
+        for handler in list(self.handlers):
+            if hasattr(handler, "aflush"):
+                await handler.aflush()
+            else:
+                await _asyncio.to_thread(handler.flush)
+
+    def dump(self) -> None:
+        """ Write out the records kept by ring buffer handlers. """
+        for handler in self.handlers:
+            if hasattr(handler, "dump"):
+                handler.dump()
+
+    def set_suppression(self, rate: float = 0, burst: int = 10, duplicates: bool = False, summary_interval: float = 10.0) -> None:
+        """
+        Drop calls before any record is built or formatted: more than `burst` calls from one call site, then more than `rate`
+        per second - 0 no limit -, and with `duplicates` calls repeating the previous call of the logger (same call site,
+        level and message - a call from any other site in between ends the run). Dropped calls are reported as
+        "Suppressed N similar messages" records. No rate and no duplicates turns suppression off.
+        """
+        self.suppressor = _Suppressor(rate, burst, duplicates, summary_interval) if rate > 0 or duplicates else None
+
+    @property
+    def suppressed(self) -> int:
+        """ Number of calls dropped by suppression """
+        return self.suppressor.suppressed if self.suppressor is not None else 0
+
+    def set_sampling(self, policies: dict = None, key: str = None) -> None:
+        """
+        Log only a sample of the calls of some levels below WARN, e.g. {Levels.DEBUG: 0.01, Levels.INFO: 10}: a float is the
+        share of the calls logged, an int N logs one call in N. With `key`, calls passing that keyword argument are sampled
+        by a hash of its value - the calls of one request are all kept or all dropped. No policies turn sampling off.
+        """
+        self.sampler = _Sampler(policies, key) if policies else None
+
+    @property
+    def sampled_out(self) -> dict:
+        """ Number of calls dropped by sampling, per level """
+        return dict(self.sampler.sampled_out) if self.sampler is not None else {}
+
+    def instrument(self, enabled: bool = True) -> None:
+        """
+        Count and time the pipeline: the caller lookups of this logger and, per handler - queued and ring buffer targets
+        included -, records, formatted size, format and write time, rotations and errors. Read them with stats().
+        Methods are wrapped per instance, so a logger that is not instrumented runs exactly the uninstrumented code.
+        """
+        for handler in self.handlers:
+            if enabled:
+                _instrument(handler)
+            else:
+                _uninstrument(handler)
+        if enabled and not self.instrumented:
+            self.CALL_SITES = _TimedCallSites(Logger.CALL_SITES)
+        elif not enabled:
+            self.__dict__.pop("CALL_SITES", None)
+        self.instrumented = enabled
+
+    def stats(self) -> dict:
+        """ Snapshot of the counters of an instrumented logger, {} when it is not instrumented """
+        if not self.instrumented:
+            return {}
+        lookups, lookup_ns = self.CALL_SITES.snapshot()
+        return {"logger": {"caller_lookups": lookups, "caller_ns": lookup_ns,
+                           "suppressed": self.suppressed, "sampled_out": self.sampled_out},
+                "handlers": Logger.__handler_stats(self.handlers)}
+
+    @staticmethod
+    def __handler_stats(handlers: list, parent: str = "") -> dict:
+        stats = {}
+        for index, handler in enumerate(handlers):
+            name = parent + (handler.get_name() or f"{type(handler).__name__.lstrip('_')}-{index}")
+            if (handler_stats := handler.__dict__.get("stats")) is not None:
+                stats[name] = handler_stats.snapshot()
+            stats.update(Logger.__handler_stats(getattr(handler, "handlers", None) or [], f"{name}/"))
+        return stats
+
+    def __log(self, level: int, msg, args: tuple, kwargs: dict) -> None:
+        """
+        Build and handle the record of an enabled call. The caller is looked up only if a handler renders it or calls are
+        suppressed per call site.
+        """
+        if self.sampler is not None and not self.sampler.sample(level, kwargs):
+            return
+        if self.suppressor is not None:
+            site = self.CALL_SITES.get(sys._getframe(2))
+            allowed, summaries = self.suppressor.allow(site, level, (msg, args) if args else msg)
+            for summary in summaries:
+                self.__log_summary(*summary)
+            if not allowed:
+                return
+        elif self._uses_caller:
+            site = self.CALL_SITES.get(sys._getframe(2))
         else:
-            self.__set_module_and_function(kwargs)
-            kwargs.update({"prefix": kwargs.pop("prefix", "")})
-            kwargs.update({"terminator": kwargs.pop("end", "\n")})
-            kwargs.update({"col_start": kwargs.pop("color", _FORMATS.get(_Levels.PLAIN.value).color)})
-            super().info("Execution ended.\n\n", extra=kwargs)
-
-    def __set_module_and_function(self, kwargs, depth=3) -> None:
-        module, _, function, _ = self.findCaller(False, depth)
-        module = module.split("/")[-1].split(".")[0]
-        kwargs.update({
-            "crt_module": module,
-            "crt_method_name": function
-        })
+            site = None
+        self.__handle(level, msg, args, kwargs, site)
+
+    def __handle(self, level: int, msg, args: tuple, kwargs: dict, site: _CallSite | None) -> None:
+        if self._uses_caller and site is not None:
+            kwargs["crt_module"] = site.module
+            kwargs["crt_method_name"] = site.function
+            path, line, function = site.path, site.line, site.function
+        else:
+            path, line, function = "(unknown file)", 0, "(unknown function)"
+        kwargs.setdefault("prefix", "")
+        kwargs["terminator"] = kwargs.pop("end", "\n")
+        kwargs["col_start"] = kwargs.pop("color", _FORMATS.get(level).color)
+        self.handle(self.makeRecord(self.name, level, path, line, msg, args, None, function, kwargs))
+
+    def __log_summary(self, level: int, site: _CallSite, count: int) -> None:
+        if self.isEnabledFor(level):
+            self.__handle(level, self.SUPPRESSED_MESSAGE.format(count), (), {}, site)
+
+    def __log_suppressed(self) -> None:
+        if self.suppressor is not None:
+            for summary in self.suppressor.pending():
+                self.__log_summary(*summary)
+
+    def makeRecord(self, name, level, fn, lno, msg, args, exc_info, func=None, extra=None, sinfo=None) -> _LogRecord:
+        """ logging.Logger.makeRecord, building records that render their message only when it is formatted """
+        record = _LogRecord(name, level, fn, lno, msg, args, exc_info, func, sinfo)
+        if extra is not None:
+            for key in extra:
+                if key in ("message", "asctime") or key in record.__dict__:
+                    raise KeyError(f"Attempt to overwrite {key!r} in LogRecord")
+                record.__dict__[key] = extra[key]
+        return record
+
+    def __update_uses_caller(self) -> None:
+        self._uses_caller = any(getattr(handler, "uses_caller", getattr(handler.formatter, "uses_caller", True)) for handler in self.handlers)
+
+    def addHandler(self, handler: _logging.Handler) -> None:
+        super().addHandler(handler)
+        if self.instrumented:
+            _instrument(handler)
+        self.__update_uses_caller()
+
+    def removeHandler(self, handler: _logging.Handler) -> None:
+        super().removeHandler(handler)
+        self.__update_uses_caller()
 
     def setLevel(self, level: _Levels | int):
+        """ Set the level of the handlers. The logger takes records from the lowest level one of them accepts (ring buffers). """
         new_level = level.value if isinstance(level, _Levels) else level
-        super().setLevel(new_level)
         for handler in self.handlers:
             handler.setLevel(new_level)
+        super().setLevel(min([_logging._checkLevel(new_level), *(handler.level for handler in self.handlers)]))
@@ -13,6 +13,31 @@ class Levels(_Enum):
     PLAIN = 60
 
 
+class QueuePolicy(_Enum):
+    """ What a full logging queue does with a new record """
+    BLOCK = "block"
+    DROP_NEWEST = "drop_newest"
+    DROP_OLDEST = "drop_oldest"
+
+
+class FileFormat(_Enum):
+    """ How file handlers write records """
+    TEXT = "text"
+    JSON = "json"
+    BINARY = "binary"
+
+
+class Compression(_Enum):
+    """ How rotated backups are compressed """
+    GZIP = "gzip"
+    BZ2 = "bz2"
+    LZMA = "lzma"
+
+    @property
+    def extension(self) -> str:
+        return {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}[self.value]
+
+
 class LevelData:
     def __init__(self, label: str, color: str, text_format: str):
         self.label = label
@@ -1,7 +1,10 @@
+import logging
+import os
+import time
 import unittest
 from unittest.mock import MagicMock
 
-from melogger import FORMATS, Levels, Colors, ConsoleFormatter
+from melogger import FORMATS, Levels, Colors, ColorSupport, ConsoleFormatter
 
 
 class ConsoleFormatterTest(unittest.TestCase):
@@ -51,3 +54,48 @@ class ConsoleFormatterTest(unittest.TestCase):
         formatter.custom_format(self.message)
         self.assertEqual(Colors.END, self.message.col_end)
         self.assertEqual(Colors.COL.YELLOW, self.message.col_start)
+
+    def test_color_support(self):
+        record = logging.LogRecord("x", Levels.WARN.value, __file__, 1, f"{Colors.COL.PURE.RED}red{Colors.END}", (), None)
+        record.__dict__.update(prefix="", terminator="\n", col_start=Colors.COL.PURE.GREEN)
+        self.assertTrue(ConsoleFormatter(FORMATS, colors=ColorSupport.NONE).format(record).endswith(" red\n"))
+        self.assertNotIn("\033", ConsoleFormatter(FORMATS, colors=ColorSupport.NONE).format(record))
+        self.assertTrue(ConsoleFormatter(FORMATS, colors=ColorSupport.BASIC).format(record).startswith("\033[92m"))
+        self.assertIn("\033[91mred", ConsoleFormatter(FORMATS, colors=ColorSupport.BASIC).format(record))
+        self.assertIn("\033[38;2;255;0;0mred", ConsoleFormatter(FORMATS, colors=ColorSupport.TRUECOLOR).format(record))
+
+    def test_format_does_not_change_record(self):
+        formatter = ConsoleFormatter(FORMATS)
+        record = logging.LogRecord("test", Levels.INFO.value, __file__, 1, "Message", (), None)
+        record.__dict__.update({"prefix": "\t", "terminator": "\n", "col_start": Colors.COL.BLACK, "crt_module": "test_console"})
+        before = dict(record.__dict__)
+
+        output = formatter.format(record)
+        self.assertIn("[INFO] test_console", output)
+        self.assertEqual(before, record.__dict__)
+
+    def test_format_time(self):
+        formatter, reference = ConsoleFormatter(FORMATS), logging.Formatter()
+        record = logging.LogRecord("test", Levels.INFO.value, __file__, 1, "Message", (), None)
+        for created in [1700000000.0, 1700000000.5, 1700000000.999, 1700000001.001, 1700000001.2, 1600000000.25]:
+            record.created, record.msecs = created, int((created - int(created)) * 1000) + 0.0
+            self.assertEqual(reference.formatTime(record), formatter.formatTime(record))
+            self.assertEqual(reference.formatTime(record, "%H:%M:%S"), formatter.formatTime(record, "%H:%M:%S"))
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_format_time_timezone_change(self):
+        formatter, reference = ConsoleFormatter(FORMATS), logging.Formatter()
+        record = logging.LogRecord("test", Levels.INFO.value, __file__, 1, "Message", (), None)
+        record.created, record.msecs = 1700000000.5, 500.0
+        timezone = os.environ.get("TZ")
+        try:
+            for value in ["UTC", "Asia/Tokyo", "America/New_York"]:
+                os.environ["TZ"] = value
+                time.tzset()
+                self.assertEqual(reference.formatTime(record), formatter.formatTime(record))
+        finally:
+            if timezone is None:
+                os.environ.pop("TZ")
+            else:
+                os.environ["TZ"] = timezone
+            time.tzset()
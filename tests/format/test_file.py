@@ -21,3 +21,16 @@ class FileFormatterTest(unittest.TestCase):
         self.assertEqual("", self.message.col_start)
         self.assertEqual("", self.message.col_end)
         self.assertEqual("This is a message with colors", self.message.msg)
+
+    def test_custom_format_non_str(self):
+        formatter = FileFormatter(FORMATS)
+        formatter._FileFormatter__handle_pref = lambda x: x
+
+        self.message.msg = ValueError(f"{Colors.COL.RED}error")
+        formatter.custom_format(self.message)
+        self.assertEqual("error", self.message.msg)
+
+    def test_is_rfh_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            formatter = FileFormatter(FORMATS, is_rfh=True)
+        self.assertEqual(FORMATS, formatter.FORMATS)
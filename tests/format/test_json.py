@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from melogger import FORMATS, Colors, FileFormat, JsonFormatter, Levels, Logger, LoggerBuilder
+from melogger.format._json import _dump
+
+
+class JsonFormatterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.formatter = JsonFormatter(FORMATS)
+
+    def record(self, msg, **extras):
+        record = logging.LogRecord("x", Levels.WARN.value, __file__, 10, msg, (), None, "func")
+        record.__dict__.update({"prefix": "", "terminator": "\n", "col_start": Colors.COL.RED} | extras)
+        return record
+
+    def test_fields(self):
+        data = json.loads(self.formatter.format(self.record(f"{Colors.COL.RED}Message \"1\"{Colors.END}", crt_module="mod", crt_method_name="fn")))
+        self.assertEqual(["timestamp", "level", "module", "function", "process", "message"], list(data))
+        self.assertEqual("WARN", data["level"])
+        self.assertEqual("mod", data["module"])
+        self.assertEqual("fn", data["function"])
+        self.assertEqual(os.getpid(), data["process"])
+        self.assertEqual("Message \"1\"", data["message"])
+
+    def test_extras(self):
+        extras = {"user": "é\n\t\"x\"", "count": 3, "ratio": 0.25, "ok": False, "none": None, "items": [1, {"a": 2}], "big": 2 ** 70}
+        data = json.loads(self.formatter.format(self.record("Message", **extras)))
+        self.assertEqual(extras, {key: data[key] for key in extras})
+        self.assertNotIn("terminator", data)
+        self.assertNotIn("col_start", data)
+
+    def test_reserved_extras(self):
+        text = self.formatter.format(self.record("Message", level="high", timestamp=1, function="f"))
+        pairs = json.loads(text, object_pairs_hook=list)
+        self.assertEqual(len(pairs), len(dict(pairs)))
+        data = dict(pairs)
+        self.assertEqual(("WARN", "high", 1, "f"), (data["level"], data["extra_level"], data["extra_timestamp"], data["extra_function"]))
+
+    def test_non_finite(self):
+        text = self.formatter.format(self.record("Message", ratio=float("nan"), limit=float("inf"), items=[1.5, float("-inf")]))
+        data = json.loads(text, parse_constant=lambda constant: self.fail(f"invalid JSON token {constant}"))
+        self.assertEqual(("NaN", "Infinity", [1.5, "-Infinity"]), (data["ratio"], data["limit"], data["items"]))
+
+    def test_non_str_message(self):
+        self.assertEqual("{'a': 1}", json.loads(self.formatter.format(self.record({"a": 1})))["message"])
+
+    def test_exception(self):
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            record = self.record("Message")
+            record.exc_info = sys.exc_info()
+        self.assertIn("KeyError: 'missing'", json.loads(self.formatter.format(record))["exc_info"])
+
+    def test_dump(self):
+        for value in ["", "a\"b\\c\x01", "ü€😀", 0, -12, 1.5, 1e300, True, False, None, [1, "a"], {"k": (1, 2)}]:
+            self.assertEqual(json.dumps(value, ensure_ascii=False), _dump(value))
+
+
+class JsonFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.logs_path)
+
+    def test_file_handler(self):
+        handler = LoggerBuilder.get_file_handler("test.ndjson", Levels.DEBUG, logs_path=self.logs_path, file_format=FileFormat.JSON)
+        logger = Logger("JsonLogger")
+        logger.addHandler(handler)
+        logger.setLevel(Levels.DEBUG)
+        logger.info("Message 1", end="")
+        logger.warning("Message 2", prefix="\r", request_id=7)
+        handler.close()
+        with open(os.path.join(self.logs_path, "test.ndjson"), encoding="utf-8") as file:
+            lines = [json.loads(line) for line in file.read().splitlines()]
+        self.assertEqual(["Message 1", "Message 2"], [line["message"] for line in lines])
+        self.assertEqual("test_json", lines[1]["module"])
+        self.assertEqual("test_file_handler", lines[1]["function"])
+        self.assertEqual(7, lines[1]["request_id"])
+
+
+if __name__ == '__main__':
+    unittest.main()
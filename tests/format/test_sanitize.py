@@ -0,0 +1,29 @@
+import unittest
+
+from melogger import Colors
+from melogger.format import _sanitize
+
+
+class SanitizeTest(unittest.TestCase):
+
+    def test_strip_ansi(self):
+        text = "Message without colors"
+        self.assertIs(text, _sanitize.strip_ansi(text))
+        self.assertEqual("Message with colors", _sanitize.strip_ansi(f"{Colors.COL.RED}Message {Colors.ALT.BOLD}with colors{Colors.END}"))
+
+    def test_strip_ansi_non_str(self):
+        self.assertEqual("value", _sanitize.strip_ansi(ValueError(f"{Colors.COL.RED}value")))
+        self.assertEqual("12", _sanitize.strip_ansi(12))
+
+    def test_ansi_codes(self):
+        self.assertEqual(Colors.COL.BLACK + Colors.ALT.BOLD, _sanitize.ansi_codes(f" \t{Colors.COL.BLACK} {Colors.ALT.BOLD}\t"))
+        self.assertEqual("", _sanitize.ansi_codes(" \t"))
+
+    def test_validation_cache(self):
+        _sanitize.validate_prefix("\t \r")
+        _sanitize.validate_terminator("\n\n")
+        self.assertIn("\t \r", _sanitize._valid_prefixes)
+        self.assertIn("\n\n", _sanitize._valid_terminators)
+        self.assertRaises(ValueError, _sanitize.validate_prefix, "\t<")
+        self.assertRaises(ValueError, _sanitize.validate_terminator, "\n ")
+        self.assertNotIn("\t<", _sanitize._valid_prefixes)
@@ -0,0 +1,31 @@
+import unittest
+from types import MappingProxyType
+
+from melogger import FORMATS, Levels, Colors, LoggerBuilder
+from melogger.format._template import _Template, compile_formats
+from melogger.utils import LevelData
+
+
+class TemplateTest(unittest.TestCase):
+
+    def test_fields(self):
+        template = _Template(FORMATS.get(Levels.INFO.value).text_format)
+        self.assertTrue(template.uses_time)
+        self.assertIn("module", template.fields)
+        self.assertFalse(_Template(FORMATS.get(Levels.PLAIN.value).text_format).uses_time)
+
+    def test_render(self):
+        template = _Template("%(level_name)s %(process)d 100%% %(message)s")
+        self.assertEqual("INFO 12 100% text", template.render({"level_name": "INFO", "process": 12, "message": "text"}))
+        self.assertRaises(ValueError, template.render, {"level_name": "INFO"})
+
+    def test_invalid_templates(self):
+        for val in ["", "no fields", "%(message)", "%(message)s %", "%(message)s %(level_name)", "%s", None]:
+            self.assertRaises(ValueError, _Template, val)
+
+    def test_compile_formats(self):
+        self.assertEqual(set(FORMATS.keys()), set(compile_formats(FORMATS).keys()))
+
+    def test_rejected_at_build_time(self):
+        formats = MappingProxyType({**FORMATS, Levels.INFO.value: LevelData("INFO", Colors.COL.DEFAULT, "%(message)")})
+        self.assertRaises(ValueError, LoggerBuilder.build, formats=formats)
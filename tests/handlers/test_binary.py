@@ -0,0 +1,132 @@
+import io
+import os
+import shutil
+import tempfile
+import traceback
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from melogger import FORMATS, FileFormatter, Levels, Logger, LoggerBuilder
+from melogger.decode import decode, main, read_records
+from melogger.handlers import BinaryFileHandler, RotatingFileHandler
+from melogger.handlers._binary import FRAME, MAGIC
+
+
+class BinaryFileHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.bin")
+        self.logger = Logger("BinaryLogger")
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            handler.close()
+            self.logger.removeHandler(handler)
+        shutil.rmtree(self.logs_path)
+
+    def decoded(self, file_path: str) -> str:
+        output = io.StringIO()
+        with open(file_path, "rb") as stream:
+            decode(stream, output)
+        return output.getvalue()
+
+    def log_messages(self) -> None:
+        for i in range(100):
+            self.logger.info(f"Message {i}", end="" if i % 5 == 0 else "\n")
+            self.logger.debug("\033[31mdébug\033[0m", prefix="\t")
+            self.logger.plain("Progress", prefix="\r", end="")
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            self.logger.critical(traceback.format_exc())
+
+    def test_same_output_as_text_file(self):
+        text_handler = RotatingFileHandler(os.path.join(self.logs_path, "test.log"), encoding="utf-8")
+        text_handler.setFormatter(FileFormatter(FORMATS))
+        text_handler.terminator = ""
+        self.logger.addHandler(text_handler)
+        self.logger.addHandler(BinaryFileHandler(self.file_path))
+        self.log_messages()
+        self.logger.flush()
+
+        with open(os.path.join(self.logs_path, "test.log"), encoding="utf-8") as file:
+            text = file.read()
+        self.assertEqual(text, self.decoded(self.file_path))
+        self.assertLess(os.path.getsize(self.file_path), len(text.encode()) * 0.75)
+
+    def test_rotation(self):
+        self.logger.addHandler(BinaryFileHandler(self.file_path, maxBytes=2000, backupCount=20))
+        for i in range(500):
+            self.logger.info(f"Message {i}")
+        self.logger.flush()
+
+        files = [f"{self.file_path}.{i}" for i in range(20, 0, -1) if os.path.exists(f"{self.file_path}.{i}")] + [self.file_path]
+        self.assertGreater(len(files), 2)
+        lines = []
+        for file_path in files:
+            with open(file_path, "rb") as file:
+                data = file.read()
+            self.assertTrue(data.startswith(MAGIC))
+            self.assertLessEqual(len(data), 2000)
+            lines += self.decoded(file_path).splitlines()
+        self.assertEqual(500, len(lines))
+        for i, line in enumerate(lines):
+            self.assertTrue(line.endswith(f") Message {i}"), line)
+
+    def test_append(self):
+        for i in range(2):
+            handler = BinaryFileHandler(self.file_path)
+            self.logger.addHandler(handler)
+            self.logger.info(f"Run {i}", crt_module="first" if i == 0 else "second")
+            self.logger.warning(f"Run {i}")
+            handler.close()
+            self.logger.removeHandler(handler)
+
+        lines = self.decoded(self.file_path).splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertEqual(2, [line.endswith("Run 1") for line in lines].count(True))
+
+    def test_truncated_file(self):
+        self.logger.addHandler(BinaryFileHandler(self.file_path))
+        for i in range(10):
+            self.logger.info(f"Message {i}")
+        self.logger.flush()
+        with open(self.file_path, "rb") as file:
+            data = file.read()
+        self.assertEqual(9, len(list(read_records(io.BytesIO(data[:-3])))))
+        self.assertRaises(ValueError, lambda: list(read_records(io.BytesIO(b"not a binary log"))))
+
+    def test_corrupt_file(self):
+        self.logger.addHandler(BinaryFileHandler(self.file_path))
+        self.logger.info("Message")
+        self.logger.flush()
+        with open(self.file_path, "rb") as file:
+            data = file.read()
+        # without its first string frame the call site refers to a string never defined
+        kind, size = FRAME.unpack_from(data, len(MAGIC))
+        corrupt = data[:len(MAGIC)] + data[len(MAGIC) + FRAME.size + size:]
+        with self.assertRaisesRegex(ValueError, r"Corrupt frame of kind \d+ at offset \d+"):
+            list(read_records(io.BytesIO(corrupt)))
+        with open(self.file_path, "wb") as file:
+            file.write(data[:len(MAGIC)] + FRAME.pack(kind, 1) + b"x")
+        with redirect_stderr(io.StringIO()) as errors:
+            self.assertEqual(1, main([self.file_path]))
+        self.assertIn(f"Corrupt frame of kind {kind} at offset {len(MAGIC)}", errors.getvalue())
+
+    def test_builder_and_cli(self):
+        self.logger.addHandler(LoggerBuilder.get_file_handler("test.bin", Levels.DEBUG, logs_path=self.logs_path, file_format="binary"))
+        self.logger.info("Message 1")
+        self.logger.flush()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(0, main([self.file_path]))
+        self.assertTrue(output.getvalue().endswith("[INFO] test_binary (%d) Message 1\n" % os.getpid()))
+        self.assertRaises(ValueError, LoggerBuilder.get_file_handler, "test.bin", Levels.DEBUG, logs_path=self.logs_path,
+                          file_format="binary", file_shared=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
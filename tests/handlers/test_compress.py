@@ -0,0 +1,91 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from melogger import FORMATS, Compression, FileFormatter, Levels, Logger, LoggerBuilder
+from melogger.handlers import RotatingFileHandler
+from melogger.handlers import _compress
+
+
+class BackupCompressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.log")
+        self.logger = Logger("CompressLogger")
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            handler.close()
+            self.logger.removeHandler(handler)
+        shutil.rmtree(self.logs_path)
+
+    def add_handler(self, backup_count: int, compression=Compression.GZIP) -> RotatingFileHandler:
+        handler = RotatingFileHandler(self.file_path, maxBytes=1000, backupCount=backup_count, encoding="utf-8", compression=compression)
+        handler.setFormatter(FileFormatter(FORMATS))
+        handler.terminator = ""
+        self.logger.addHandler(handler)
+        return handler
+
+    def rotate(self, handler: RotatingFileHandler, times: int) -> None:
+        for i in range(times):
+            self.logger.info(f"File {i}")
+            handler.doRollover()
+
+    def first_lines(self, backup_count: int) -> list:
+        return [gzip.open(f"{self.file_path}.{i}.gz", "rt").readline().rstrip().rsplit(" ", 2)[-2:] for i in range(backup_count, 0, -1)]
+
+    def test_compress(self):
+        handler = self.add_handler(3)
+        self.rotate(handler, 3)
+        handler.compressor.join()
+        self.assertEqual(["test.log", "test.log.1.gz", "test.log.2.gz", "test.log.3.gz"], sorted(os.listdir(self.logs_path)))
+        self.assertEqual([["File", "0"], ["File", "1"], ["File", "2"]], self.first_lines(3))
+
+    def test_rotation_does_not_wait(self):
+        unblock = threading.Event()
+
+        def blocked_open(*args, **kwargs):
+            unblock.wait(5)
+            return gzip.open(*args, **kwargs)
+
+        with patch.dict(_compress._OPENERS, {Compression.GZIP: blocked_open}):
+            handler = self.add_handler(2)
+            start = time.monotonic()
+            self.rotate(handler, 5)
+            self.assertLess(time.monotonic() - start, 1)
+            self.assertEqual(["test.log", "test.log.1", "test.log.2"], sorted(name for name in os.listdir(self.logs_path) if ".part" not in name))
+            unblock.set()
+            handler.compressor.join()
+
+        self.assertEqual(["test.log", "test.log.1.gz", "test.log.2.gz"], sorted(os.listdir(self.logs_path)))
+        self.assertEqual([["File", "3"], ["File", "4"]], self.first_lines(2))
+
+    def test_extensions(self):
+        for compression, module in [("bz2", bz2), ("lzma", lzma)]:
+            handler = self.add_handler(1, compression)
+            self.rotate(handler, 1)
+            handler.close()
+            self.logger.removeHandler(handler)
+            backup = f"{self.file_path}.1{Compression(compression).extension}"
+            self.assertIn("File 0", module.open(backup, "rt").read())
+            os.remove(backup)
+
+    def test_builder(self):
+        handler = LoggerBuilder.get_file_handler("test.log", Levels.DEBUG, logs_path=self.logs_path, file_max_size=1000, file_compression="gzip")
+        self.assertEqual(Compression.GZIP, handler.compressor.compression)
+        handler.close()
+        self.assertRaises(ValueError, LoggerBuilder.get_file_handler, "test.log", Levels.DEBUG, logs_path=self.logs_path,
+                          file_compression="gzip", file_shared=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
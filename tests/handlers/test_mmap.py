@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from melogger import FORMATS, FileFormatter, Levels, Logger, LoggerBuilder
+from melogger.handlers import MmapFileHandler
+
+
+class MmapFileHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.log")
+        self.logger = Logger("MmapLogger")
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            handler.close()
+            self.logger.removeHandler(handler)
+        shutil.rmtree(self.logs_path)
+
+    def add_handler(self, segment_size: int = 1000, backup_count: int = 10) -> MmapFileHandler:
+        handler = MmapFileHandler(self.file_path, segment_size=segment_size, backupCount=backup_count)
+        handler.setFormatter(FileFormatter(FORMATS))
+        handler.terminator = ""
+        self.logger.addHandler(handler)
+        return handler
+
+    def read_lines(self, handler: MmapFileHandler) -> list:
+        lines = []
+        for segment in handler.segments():
+            with open(segment, encoding="utf-8") as file:
+                lines += file.read().splitlines()
+        return lines
+
+    def test_segments(self):
+        handler = self.add_handler()
+        for i in range(100):
+            self.logger.info(f"Message {i}")
+        segments = handler.segments()
+        self.assertGreater(len(segments), 2)
+        self.assertTrue(all(0 < os.path.getsize(segment) <= 1000 for segment in segments[:-1]))
+        self.assertEqual(1000, os.path.getsize(segments[-1]))
+
+        handler.close()
+        self.assertEqual(handler.position, os.path.getsize(segments[-1]))
+        lines = self.read_lines(handler)
+        self.assertEqual(100, len(lines))
+        for i, line in enumerate(lines):
+            self.assertTrue(line.endswith(f") Message {i}"), line)
+
+    def test_backups(self):
+        handler = self.add_handler(backup_count=2)
+        for i in range(100):
+            self.logger.info(f"Message {i}")
+        handler.close()
+        self.assertEqual(3, len(handler.segments()))
+        self.assertTrue(self.read_lines(handler)[-1].endswith(") Message 99"))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_crash_recovery(self):
+        if (pid := os.fork()) == 0:
+            self.add_handler()
+            for i in range(30):
+                self.logger.info(f"Message {i}")
+            os._exit(0)  # no close(): the last segment keeps its preallocated size
+        os.waitpid(pid, 0)
+
+        recovered = self.add_handler()
+        self.assertEqual(1000, os.path.getsize(recovered.segment))
+        for i in range(30, 60):
+            self.logger.info(f"Message {i}")
+        recovered.close()
+        lines = self.read_lines(recovered)
+        self.assertEqual(60, len(lines))
+        self.assertTrue(lines[-1].endswith(") Message 59"))
+
+    def test_nul_and_large_records(self):
+        handler = self.add_handler()
+        self.logger.info("a\0b")
+        self.logger.info("x" * 3000)
+        self.logger.info("after")
+        handler.close()
+        lines = self.read_lines(handler)
+        self.assertTrue(lines[0].endswith(") a\\0b"))
+        self.assertTrue(lines[1].endswith("x" * 3000))
+        self.assertTrue(lines[2].endswith(") after"))
+
+    def test_builder(self):
+        handler = LoggerBuilder.get_file_handler("test.log", Levels.DEBUG, logs_path=self.logs_path, file_max_size=4096, file_mmap=True)
+        self.assertIsInstance(handler, MmapFileHandler)
+        self.assertEqual(4096, handler.segment_size)
+        handler.close()
+        self.assertRaises(ValueError, LoggerBuilder.get_file_handler, "test.log", Levels.DEBUG, logs_path=self.logs_path,
+                          file_mmap=True, file_compression="gzip")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import logging
+import os
+import threading
+import time
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+from melogger import LoggerBuilder, Levels, Logger, QueuePolicy
+from melogger.handlers import QueueHandler
+
+
+class _BlockedHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.unblock.wait()
+        self.messages.append(record.msg)
+
+
+class QueueHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.target = _BlockedHandler()
+        self.logger = Logger("QueueLogger")
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        self.target.unblock.set()
+        for handler in self.logger.handlers:
+            handler.close()
+
+    def __add_queue_handler(self, policy, max_size=3):
+        self.logger.addHandler(handler := QueueHandler([self.target], max_size=max_size, policy=policy))
+        self.logger.info("Message 0")
+        while handler.queue.unfinished_tasks and handler.queue.qsize():
+            pass
+        return handler
+
+    def test_order(self):
+        handler = self.__add_queue_handler(QueuePolicy.BLOCK, max_size=100)
+        for i in range(1, 50):
+            self.logger.info(f"Message {i}")
+        self.target.unblock.set()
+        handler.flush()
+        self.assertEqual([f"Message {i}" for i in range(50)], self.target.messages)
+
+    def test_drop_newest(self):
+        handler = self.__add_queue_handler(QueuePolicy.DROP_NEWEST)
+        for i in range(1, 10):
+            self.logger.info(f"Message {i}")
+        self.target.unblock.set()
+        handler.flush()
+        self.assertEqual(6, handler.dropped)
+        self.assertEqual(["Message 0", "Message 1", "Message 2", "Message 3"], self.target.messages)
+
+    def test_drop_oldest(self):
+        handler = self.__add_queue_handler("drop_oldest")
+        for i in range(1, 10):
+            self.logger.info(f"Message {i}")
+        self.target.unblock.set()
+        handler.flush()
+        self.assertEqual(6, handler.dropped)
+        self.assertEqual(["Message 0", "Message 7", "Message 8", "Message 9"], self.target.messages)
+
+    def test_close_drains(self):
+        handler = self.__add_queue_handler(QueuePolicy.BLOCK, max_size=100)
+        for i in range(1, 10):
+            self.logger.info(f"Message {i}")
+        self.target.unblock.set()
+        handler.close()
+        self.assertEqual(10, len(self.target.messages))
+
+    def test_flush_while_logging(self):
+        handler = self.__add_queue_handler(QueuePolicy.BLOCK, max_size=100)
+        self.target.unblock.set()
+        stop = threading.Event()
+
+        def log():
+            while not stop.is_set():
+                self.logger.info("Message")
+
+        thread = threading.Thread(target=log)
+        thread.start()
+        try:
+            start = time.perf_counter()
+            handler.flush()
+            self.assertLess(time.perf_counter() - start, 2)
+        finally:
+            stop.set()
+            thread.join()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_fork(self):
+        handler = self.__add_queue_handler(QueuePolicy.BLOCK, max_size=10)
+        self.target.unblock.set()
+        handler.flush()
+        if (pid := os.fork()) == 0:
+            status = 1
+            try:
+                for i in range(50):
+                    self.logger.info(f"Child {i}")
+                handler.flush()
+                status = 0 if [message for message in self.target.messages if message.startswith("Child")] == [f"Child {i}" for i in range(50)] else 1
+            finally:
+                os._exit(status)
+        for _ in range(500):
+            if (finished := os.waitpid(pid, os.WNOHANG))[0]:
+                break
+            time.sleep(0.01)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            self.fail("the forked child hung on a full queue")
+        self.assertEqual(0, os.waitstatus_to_exitcode(finished[1]))
+
+    def test_level(self):
+        handler = self.__add_queue_handler(QueuePolicy.BLOCK)
+        self.logger.setLevel(Levels.ERROR)
+        self.assertEqual(Levels.ERROR.value, self.target.level)
+        self.assertEqual(Levels.ERROR.value, handler.level)
+
+
+class AsyncLoggerTest(unittest.TestCase):
+
+    def test_end_execution_drains(self):
+        with patch("melogger.builder._sys") as output_mock:
+            output_mock.stdout = StringIO()
+            logger = LoggerBuilder.build("AsyncLogger", logs_level=Levels.DEBUG, async_mode=True)
+            self.assertEqual(1, len(logger.handlers))
+            for i in range(100):
+                logger.debug(f"Message {i}")
+            logger.end_execution()
+            lines = output_mock.stdout.getvalue().splitlines()
+        logger.handlers[0].close()
+        self.assertEqual(100, len([line for line in lines if "Message" in line]))
+        self.assertIn("Message 99", lines[99])
+        self.assertIn("Execution ended.", lines[100])
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import patch
+
+from melogger import Levels, Logger, LoggerBuilder
+from melogger.handlers import QueueHandler, RingBufferHandler
+from tests.utils import ListHandler
+
+
+class RingBufferHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.target = ListHandler(format_records=True)
+        self.ring = RingBufferHandler([self.target], capacity=3)
+        self.logger = Logger("RingLogger")
+        self.logger.addHandler(self.ring)
+        self.logger.addHandler(self.target)
+        self.logger.setLevel(Levels.INFO)
+
+    def tearDown(self):
+        for handler in self.logger.handlers:
+            handler.close()
+
+    def messages(self) -> list:
+        return [record.msg for record in self.target.records]
+
+    def test_levels(self):
+        self.assertEqual(Levels.DEBUG.value, self.logger.level)
+        self.assertEqual(Levels.DEBUG.value, self.ring.level)
+        self.assertEqual(Levels.INFO.value, self.target.level)
+        self.assertEqual(Levels.INFO.value, self.ring.target_level)
+
+    def test_dump_on_trigger(self):
+        with patch.object(self.target.formatter, "format", wraps=self.target.formatter.format) as format_mock:
+            for i in range(5):
+                self.logger.debug(f"Debug {i}")
+            self.logger.info("Info")
+            self.assertEqual(1, format_mock.call_count)
+        self.assertEqual(3, len(self.ring))
+        self.logger.warning("Warning")
+        self.assertEqual(["Info", "Warning"], self.messages())
+        self.logger.error("Error")
+        self.assertEqual(["Info", "Warning", "Debug 2", "Debug 3", "Debug 4", "Error"], self.messages())
+        self.assertEqual(0, len(self.ring))
+        self.logger.critical("Critical")
+        self.assertEqual("Critical", self.messages()[-1])
+        self.assertEqual("test_dump_on_trigger", self.target.records[2].crt_method_name)
+
+    def test_partial_ring(self):
+        self.logger.debug("Debug 0")
+        self.logger.debug("Debug 1")
+        self.logger.error("Error")
+        self.assertEqual(["Debug 0", "Debug 1", "Error"], self.messages())
+
+    def test_end_execution(self):
+        self.logger.debug("Debug")
+        try:
+            raise RuntimeError("Crash")
+        except RuntimeError:
+            with self.assertRaises(SystemExit):
+                self.logger.end_execution()
+        self.assertEqual(["Debug", "Execution ended."], self.messages()[:2])
+
+    def test_end_execution_without_exception(self):
+        self.logger.debug("Debug")
+        self.logger.end_execution()
+        self.assertEqual(["Execution ended.\n\n"], self.messages())
+
+    def test_debug_level(self):
+        self.logger.setLevel(Levels.DEBUG)
+        self.logger.debug("Debug")
+        self.logger.error("Error")
+        self.assertEqual(["Debug", "Error"], self.messages())
+        self.assertEqual(0, len(self.ring))
+
+    def test_builder(self):
+        logger = LoggerBuilder.build("RingBuilder", ring_buffer_size=10, ring_buffer_level=Levels.WARN)
+        ring, console = logger.handlers
+        self.assertIsInstance(ring, RingBufferHandler)
+        self.assertEqual(([console], 10, Levels.WARN.value), (ring.targets, ring.capacity, ring.trigger_level))
+        self.assertEqual((Levels.DEBUG.value, Levels.INFO.value), (logger.level, console.level))
+
+    def test_builder_async(self):
+        logger = LoggerBuilder.build("RingAsyncBuilder", ring_buffer_size=10, async_mode=True)
+        queue, = logger.handlers
+        ring, console = queue.handlers
+        self.assertIsInstance(queue, QueueHandler)
+        self.assertEqual((Levels.DEBUG.value, Levels.DEBUG.value, Levels.INFO.value), (logger.level, queue.level, console.level))
+        target = ListHandler(format_records=True)
+        ring.targets = [target]
+        console.setLevel(Levels.CRITICAL.value)
+        logger.debug("Debug")
+        logger.error("Error")
+        logger.flush()
+        self.assertEqual(["Debug"], [record.msg for record in target.records])
+        queue.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
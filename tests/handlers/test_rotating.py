@@ -0,0 +1,168 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from melogger import FORMATS, FileFormatter, Levels, Logger
+from melogger.handlers import RotatingFileHandler
+from tests.utils import ListHandler
+
+
+class RotatingFileHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.log")
+        self.handler = RotatingFileHandler(self.file_path, maxBytes=1000, backupCount=3, encoding="utf-8")
+        self.handler.setFormatter(FileFormatter(FORMATS))
+        self.handler.terminator = ""
+        self.logger = Logger("RotatingLogger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        self.handler.close()
+        shutil.rmtree(self.logs_path)
+
+    def test_format_once(self):
+        with patch.object(self.handler.formatter, "format", wraps=self.handler.formatter.format) as format_mock:
+            for i in range(50):
+                self.logger.info(f"Message {i}")
+        self.assertEqual(50, format_mock.call_count)
+
+    def test_running_size(self):
+        self.logger.info("Message ascii")
+        self.logger.info("Message ăîșț")
+        self.assertEqual(os.path.getsize(self.file_path), self.handler.size)
+
+    def test_should_rollover(self):
+        self.logger.info("Message")
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(records := ListHandler())
+        self.logger.info("Short")
+        self.logger.info("Long " * 200)
+        short, long = records.records
+        self.assertFalse(self.handler.shouldRollover(short))
+        self.assertTrue(self.handler.shouldRollover(long))
+        self.assertTrue(self.handler.shouldRollover(short, size=1000))
+
+    def test_encoding(self):
+        handler = RotatingFileHandler(self.file_path, maxBytes=1000, backupCount=3, encoding="latin-1", batch_size=100)
+        handler.setFormatter(FileFormatter(FORMATS))
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(handler)
+        self.logger.info("Message àéî")
+        handler.close()
+        with open(self.file_path, encoding="latin-1") as file:
+            self.assertIn("Message àéî", file.read())
+        self.assertEqual(os.path.getsize(self.file_path), handler.size)
+
+    def test_size_from_existing_file(self):
+        self.logger.info("Message 1")
+        self.handler.close()
+        handler = RotatingFileHandler(self.file_path, maxBytes=1000, backupCount=3, encoding="utf-8")
+        self.assertEqual(os.path.getsize(self.file_path), handler.size)
+        handler.close()
+
+    def test_rotation(self):
+        for i in range(100):
+            self.logger.info(f"Message {i:03}")
+        self.assertEqual(["test.log", "test.log.1", "test.log.2", "test.log.3"], sorted(os.listdir(self.logs_path)))
+        for name in os.listdir(self.logs_path):
+            self.assertLess(os.path.getsize(os.path.join(self.logs_path, name)), 1000)
+        self.assertEqual(os.path.getsize(self.file_path), self.handler.size)
+        with open(self.file_path, encoding="utf-8") as file:
+            self.assertIn("Message 099", file.readlines()[-1])
+
+
+class RotatingFileHandlerGroupCommitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.log")
+        self.fsync_mock = patch("melogger.handlers._rotating._os.fsync").start()
+
+    def tearDown(self):
+        self.handler.close()
+        patch.stopall()
+        shutil.rmtree(self.logs_path)
+
+    def __get_logger(self, **kwargs):
+        self.handler = RotatingFileHandler(self.file_path, maxBytes=10000, backupCount=3, encoding="utf-8", **kwargs)
+        self.handler.setFormatter(FileFormatter(FORMATS))
+        self.handler.terminator = ""
+        logger = Logger("GroupCommitLogger")
+        logger.addHandler(self.handler)
+        logger.setLevel(Levels.DEBUG)
+        return logger
+
+    def test_group_commit(self):
+        logger = self.__get_logger(batch_size=1000, flush_interval=60)
+        with patch.object(self.handler.stream.buffer, "write", wraps=self.handler.stream.buffer.write) as write_mock:
+            for i in range(50):
+                logger.info(f"Message {i}")
+            self.assertLess(0, write_mock.call_count)
+            self.assertLess(write_mock.call_count, 10)
+            self.handler.flush()
+        with open(self.file_path, encoding="utf-8") as file:
+            self.assertEqual(50, len(file.readlines()))
+        self.assertEqual(os.path.getsize(self.file_path), self.handler.size)
+        self.fsync_mock.assert_not_called()
+
+    def test_fork(self):
+        logger = self.__get_logger(batch_size=1000, flush_interval=0.05)
+        logger.info("Parent")
+        self.handler.flush()
+        if (pid := os.fork()) == 0:
+            status = 1
+            try:
+                logger.info("Child")
+                time.sleep(0.5)
+                with open(self.file_path, encoding="utf-8") as file:
+                    status = 0 if "Child" in file.read() else 1
+            finally:
+                os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, os.waitstatus_to_exitcode(status))
+
+    def test_group_commit_rotation(self):
+        logger = self.__get_logger(batch_size=3000, flush_interval=60)
+        for i in range(500):
+            logger.info(f"Message {i:03}")
+        self.handler.flush()
+        lines = 0
+        for name in os.listdir(self.logs_path):
+            self.assertLess(os.path.getsize(os.path.join(self.logs_path, name)), 10000)
+            with open(os.path.join(self.logs_path, name), encoding="utf-8") as file:
+                lines += len(file.readlines())
+        self.assertEqual(500, lines)
+        self.assertEqual(["test.log", "test.log.1", "test.log.2", "test.log.3"], sorted(os.listdir(self.logs_path)))
+        self.assertEqual(os.path.getsize(self.file_path), self.handler.size)
+
+    def test_fsync_records(self):
+        logger = self.__get_logger(fsync_records=10)
+        for i in range(35):
+            logger.info(f"Message {i}")
+        self.assertEqual(3, self.fsync_mock.call_count)
+
+    def test_fsync_level(self):
+        logger = self.__get_logger(batch_size=1000, flush_interval=60, fsync_level=Levels.CRITICAL.value)
+        logger.info("Message 1")
+        logger.error("Message 2")
+        self.fsync_mock.assert_not_called()
+        logger.critical("Message 3")
+        self.assertEqual(1, self.fsync_mock.call_count)
+        with open(self.file_path, encoding="utf-8") as file:
+            self.assertEqual(3, len(file.readlines()))
+
+    def test_fsync_ms(self):
+        logger = self.__get_logger(fsync_ms=20)
+        logger.info("Message 1")
+        self.fsync_mock.assert_not_called()
+        for _ in range(200):
+            if self.fsync_mock.call_count:
+                break
+            time.sleep(0.01)
+        self.assertEqual(1, self.fsync_mock.call_count)
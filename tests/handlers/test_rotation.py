@@ -0,0 +1,143 @@
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from melogger import FORMATS, FileFormatter, Levels, Logger, LoggerBuilder
+from melogger.decode import decode
+from melogger.handlers import BinaryFileHandler, RotatingFileHandler
+
+
+class RotationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.logs_path, "test.log")
+        self.logger = Logger("RotationLogger")
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            handler.close()
+            self.logger.removeHandler(handler)
+        shutil.rmtree(self.logs_path)
+
+    def add_handler(self, **kwargs) -> RotatingFileHandler:
+        handler = RotatingFileHandler(self.file_path, encoding="utf-8", **kwargs)
+        handler.setFormatter(FileFormatter(FORMATS))
+        handler.terminator = ""
+        self.logger.addHandler(handler)
+        return handler
+
+    def read_lines(self, backup_count: int) -> list:
+        lines = []
+        for path in [f"{self.file_path}.{i}" for i in range(backup_count, 0, -1)] + [self.file_path]:
+            with open(path, encoding="utf-8") as file:
+                lines += file.read().splitlines()
+        return lines
+
+    @unittest.skipIf(os.name == "nt", "open files are not renamed on Windows")
+    def test_background_rotation(self):
+        handler = self.add_handler(maxBytes=1000, backupCount=3, background_rotation=True)
+        for i in range(200):
+            self.logger.info(f"Message {i}")
+        handler.close()
+        self.assertEqual(["test.log", "test.log.1", "test.log.2", "test.log.3"], sorted(os.listdir(self.logs_path)))
+        lines = self.read_lines(3)
+        first = int(lines[0].rsplit(" ", 1)[1])
+        self.assertEqual([f"Message {i}" for i in range(first, 200)], [line.rsplit(" ", 2)[1] + " " + line.rsplit(" ", 1)[1] for line in lines])
+
+    @unittest.skipIf(os.name == "nt", "open files are not renamed on Windows")
+    def test_swap_does_not_open(self):
+        handler = self.add_handler(maxBytes=1000, backupCount=3, background_rotation=True)
+        self.logger.info("Message 1")
+        handler.rotator.join()
+        with patch.object(handler, "_open", side_effect=AssertionError("opened on the logging thread")):
+            handler.doRollover()
+            self.logger.info("Message 2")
+        handler.rotator.join()
+        self.assertIn("Message 1", open(f"{self.file_path}.1", encoding="utf-8").read())
+        self.assertIn("Message 2", open(self.file_path, encoding="utf-8").read())
+
+    @unittest.skipIf(os.name == "nt", "open files are not renamed on Windows")
+    def test_fork(self):
+        handler = self.add_handler(maxBytes=300, backupCount=2, background_rotation=True)
+        handler.rotator.join()
+        if (pid := os.fork()) == 0:
+            status = 1
+            try:
+                for i in range(40):
+                    self.logger.info(f"Child {i}")
+                handler.close()
+                status = 0 if sorted(os.listdir(self.logs_path)) == ["test.log", "test.log.1", "test.log.2"] + [
+                    name for name in os.listdir(self.logs_path) if name.startswith(f"test.log.next.{os.getppid()}.")] else 1
+            finally:
+                os._exit(status)
+        for _ in range(500):
+            if (finished := os.waitpid(pid, os.WNOHANG))[0]:
+                break
+            time.sleep(0.01)
+        else:
+            os.kill(pid, 9)
+            os.waitpid(pid, 0)
+            self.fail("the forked child hung rotating")
+        self.assertEqual(0, os.waitstatus_to_exitcode(finished[1]))
+
+    @unittest.skipIf(os.name == "nt", "open files are not renamed on Windows")
+    def test_leftovers(self):
+        with open(f"{self.file_path}.rotating.4", "w") as file:
+            file.write("rotated before a crash\n")
+        open(f"{self.file_path}.next.2", "w").close()
+        handler = self.add_handler(maxBytes=1000, backupCount=3, background_rotation=True)
+        handler.rotator.join()
+        self.assertEqual("rotated before a crash\n", open(f"{self.file_path}.1").read())
+        self.assertFalse(os.path.exists(f"{self.file_path}.next.2"))
+        self.assertFalse(os.path.exists(f"{self.file_path}.rotating.4"))
+
+    def test_interval(self):
+        handler = self.add_handler(backupCount=3, interval=3600)
+        handler.rollover_at = time.time() - 1
+        self.logger.info("Message 1")
+        self.assertFalse(os.path.exists(f"{self.file_path}.1"))  # nothing to rotate yet
+        self.assertGreater(handler.rollover_at, time.time())
+
+        handler.rollover_at = time.time() - 1
+        self.logger.info("Message 2")
+        self.assertGreater(handler.rollover_at, time.time())
+        self.assertEqual(["Message 1", "Message 2"], [line.rsplit(" ", 2)[1] + " " + line.rsplit(" ", 1)[1] for line in self.read_lines(1)])
+
+    def test_next_rollover(self):
+        handler = self.add_handler(interval=3600)
+        now = time.time()
+        for interval, field in [(3600, "tm_min"), (60, "tm_sec")]:
+            handler.interval = interval
+            rollover_at = handler.next_rollover(now)
+            self.assertTrue(0 < rollover_at - now <= interval)
+            self.assertEqual(0, getattr(time.localtime(rollover_at), field))
+
+    @unittest.skipIf(os.name == "nt", "open files are not renamed on Windows")
+    def test_binary_background_rotation(self):
+        handler = BinaryFileHandler(self.file_path, maxBytes=1000, backupCount=20, background_rotation=True)
+        self.logger.addHandler(handler)
+        for i in range(100):
+            self.logger.info(f"Message {i}")
+        handler.close()
+        output = io.StringIO()
+        for path in [f"{self.file_path}.{i}" for i in range(20, 0, -1) if os.path.exists(f"{self.file_path}.{i}")] + [self.file_path]:
+            with open(path, "rb") as file:
+                decode(file, output)
+        self.assertEqual(100, len(output.getvalue().splitlines()))
+
+    def test_builder(self):
+        handler = LoggerBuilder.get_file_handler("test.log", Levels.DEBUG, logs_path=self.logs_path, file_rotate_interval=86400,
+                                                 file_background_rotation=True)
+        self.assertEqual(86400, handler.interval)
+        self.assertEqual(os.name != "nt", handler.rotator is not None)
+        handler.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
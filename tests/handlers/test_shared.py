@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+from melogger import LoggerBuilder, Levels, Logger
+from melogger.handlers import SharedFileHandler
+from melogger.handlers._shared import _fcntl
+
+PROCESSES = 4
+RECORDS = 500
+
+
+def _log(logs_path):
+    logger = Logger("SharedLogger")
+    logger.addHandler(LoggerBuilder.get_file_handler("shared.log", Levels.INFO, logs_path=logs_path, file_max_size=20000, file_backups=50, file_shared=True))
+    logger.setLevel(Levels.INFO)
+    for i in range(RECORDS):
+        logger.info(f"Process {os.getpid()} message {i:04}")
+    logger.handlers[0].close()
+
+
+@unittest.skipIf(_fcntl is None or "fork" not in multiprocessing.get_all_start_methods(), "needs fcntl and fork")
+class SharedFileHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.logs_path)
+
+    def test_single_process(self):
+        handler = LoggerBuilder.get_file_handler("shared.log", Levels.INFO, logs_path=self.logs_path, file_shared=True)
+        self.assertIsInstance(handler, SharedFileHandler)
+        logger = Logger("SharedLogger")
+        logger.addHandler(handler)
+        logger.info("Message 1", end="")
+        logger.info("Message 2")
+        handler.close()
+        with open(os.path.join(self.logs_path, "shared.log"), encoding="utf-8") as file:
+            lines = file.readlines()
+        self.assertEqual(2, len(lines))
+        self.assertIn("Message 2", lines[1])
+
+    def test_processes(self):
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target=_log, args=(self.logs_path,)) for _ in range(PROCESSES)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(0, process.exitcode)
+
+        messages, files = [], [name for name in os.listdir(self.logs_path) if not name.endswith(".lock")]
+        self.assertGreater(len(files), 2)
+        line_regex = re.compile(r"^\d{4}-\d{2}-\d{2} [\d:,]+ \[INFO] \w+ \(\d+\) Process \d+ message \d{4}\n$")
+        for name in files:
+            # the size check and the write are not atomic across processes, a file can exceed the limit by a few records
+            self.assertLess(os.path.getsize(os.path.join(self.logs_path, name)), 20000 + PROCESSES * 100)
+            with open(os.path.join(self.logs_path, name), encoding="utf-8") as file:
+                for line in file:
+                    self.assertRegex(line, line_regex)
+                    messages.append(line.split(") ", 1)[1])
+        self.assertEqual(PROCESSES * RECORDS, len(messages))
+        self.assertEqual(PROCESSES * RECORDS, len(set(messages)))
@@ -0,0 +1,100 @@
+import time
+import unittest
+from io import StringIO
+from types import MappingProxyType
+
+from melogger import ConsoleFormatter, ColorSupport, Levels, Logger, Colors, LoggerBuilder
+from melogger.handlers import BufferedStreamHandler
+from melogger.utils import LevelData
+
+
+class _CountingStream(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class BufferedStreamHandlerTest(unittest.TestCase):
+    FORMATS = MappingProxyType({level.value: LevelData(level.name, Colors.COL.DEFAULT, "%(prefix)s%(col_start)s[%(level_name)s] %(message)s%(col_end)s%(terminator)s")
+                                for level in Levels})
+
+    def setUp(self):
+        self.output = StringIO()
+        self.handler = BufferedStreamHandler(self.output, batch_size=1024, flush_interval=60)
+        self.handler.setFormatter(ConsoleFormatter(self.FORMATS))
+        self.handler.terminator = ""
+        self.logger = Logger("BufferedLogger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        self.handler.close()
+
+    def test_batch(self):
+        self.logger.info("Message 1")
+        self.logger.warning("Message 2")
+        self.assertEqual("", self.output.getvalue())
+        self.handler.flush()
+        self.assertEqual(2, len(self.output.getvalue().splitlines()))
+
+    def test_batch_size(self):
+        for i in range(100):
+            self.logger.info(f"Message {i}")
+        self.assertGreater(len(self.output.getvalue()), 1024)
+        self.assertLess(len(self.output.getvalue().splitlines()), 100)
+
+    def test_flush_level(self):
+        self.logger.info("Message 1")
+        self.logger.error("Message 2")
+        self.assertEqual(2, len(self.output.getvalue().splitlines()))
+
+    def test_commit_flushes_stream(self):
+        self.handler.stream = output = _CountingStream()
+        self.logger.info("Message 1")
+        self.assertEqual((0, 0), (output.writes, output.flushes))
+        self.logger.error("Message 2")
+        self.assertEqual((1, 1), (output.writes, output.flushes))
+        self.logger.info("Progress", prefix="\r", end="")
+        self.assertEqual((2, 2), (output.writes, output.flushes))
+
+    def test_flush_interval(self):
+        self.handler.flush_interval = 0.01
+        self.logger.info("Message 1")
+        for _ in range(200):
+            if self.output.getvalue():
+                break
+            time.sleep(0.01)
+        self.assertIn("Message 1", self.output.getvalue())
+
+    def test_continuation(self):
+        self.logger.info("Message 1", end="")
+        self.assertTrue(self.output.getvalue().endswith("Message 1\033[0m"))
+        self.logger.plain("Message 2", prefix="\r", end="")
+        self.assertTrue(self.output.getvalue().endswith("\r\033[39m[PLAIN] Message 2\033[0m"))
+
+    def test_same_output_as_stream_handler(self):
+        stream_output = StringIO()
+        stream_handler = LoggerBuilder.get_console_handler(Levels.DEBUG, formats=self.FORMATS, colors=ColorSupport.TRUECOLOR)
+        stream_handler.setStream(stream_output)
+        stream_logger = Logger("StreamLogger")
+        stream_logger.addHandler(stream_handler)
+        stream_logger.setLevel(Levels.DEBUG)
+        for logger in [self.logger, stream_logger]:
+            logger.info("Message 1", end="")
+            logger.plain("Message 2", prefix="\r")
+            logger.info("Message 3", end="")
+            logger.info("Message 4", prefix="\t")
+            logger.plain("Message 5", end="")
+            logger.plain("Message 6", prefix="\t")
+            logger.debug("Message 7")
+        self.handler.flush()
+        self.assertEqual(stream_output.getvalue(), self.output.getvalue())
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import threading
+import time
+import unittest
+
+from melogger import FORMATS, FileFormatter, Levels, Logger, LoggerBuilder, QueuePolicy
+from melogger.handlers import QueueHandler
+
+
+class _SlowHandler(logging.Handler):
+    """ A handler with slow I/O: every record and every flush takes `delay` seconds """
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+        self.unblock = threading.Event()
+        self.unblock.set()
+        self.lines = []
+        self.flushes = 0
+        self.setFormatter(FileFormatter(FORMATS))
+
+    def emit(self, record):
+        self.unblock.wait()
+        time.sleep(self.delay)
+        self.lines.append(self.format(record))
+
+    def flush(self):
+        self.flushes += 1
+
+
+class AsyncioTest(unittest.TestCase):
+
+    def setUp(self):
+        self.target = _SlowHandler()
+        self.queue = QueueHandler([self.target], max_size=100)
+        self.logger = Logger("AsyncioLogger")
+        self.logger.addHandler(self.queue)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        self.target.unblock.set()
+        self.queue.close()
+
+    def test_aflush(self):
+        async def main():
+            for i in range(50):
+                self.logger.info(f"Message {i}")
+            await self.logger.aflush()
+            return len(self.target.lines), self.target.flushes
+
+        self.target.delay = 0.001
+        self.assertEqual((50, 1), asyncio.run(main()))
+
+    def test_loop_lag(self):
+        async def ticker(lags: list, stop: asyncio.Event):
+            while not stop.is_set():
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                lags.append(time.perf_counter() - start - 0.001)
+
+        async def main():
+            lags, stop = [], asyncio.Event()
+            task = asyncio.create_task(ticker(lags, stop))
+            for i in range(20):
+                for j in range(100):
+                    self.logger.info(f"Message {i} {j} " + "x" * 200)
+                await asyncio.sleep(0)
+            await self.logger.aflush()
+            stop.set()
+            await task
+            return max(lags)
+
+        self.logger.removeHandler(self.queue)
+        self.queue.close()
+        self.logger.addHandler(queue := QueueHandler([self.target], max_size=10000))
+        self.queue = queue
+        self.target.delay = 0.0005
+        # writing the 2000 records takes more than one second, the loop never waits for it
+        self.assertLess(asyncio.run(main()), 0.1)
+        self.assertEqual((0, 2000), (self.queue.dropped, len(self.target.lines)))
+
+    def test_full_queue_never_blocks_the_loop(self):
+        async def main():
+            start = time.perf_counter()
+            for i in range(300):
+                self.logger.info(f"Message {i}")
+            return time.perf_counter() - start
+
+        self.target.unblock.clear()
+        self.assertLess(asyncio.run(main()), 0.5)
+        self.assertGreaterEqual(self.queue.dropped, 199)
+
+    def test_aflush_drop_oldest(self):
+        async def main():
+            self.logger.info("Message 0")
+            flush = asyncio.create_task(self.logger.aflush())
+            await asyncio.sleep(0.01)
+            for i in range(1, 10):
+                self.logger.info(f"Message {i}")
+            self.target.unblock.set()
+            await asyncio.wait_for(flush, 5)
+
+        self.logger.removeHandler(self.queue)
+        self.queue.close()
+        self.logger.addHandler(queue := QueueHandler([self.target], max_size=3, policy=QueuePolicy.DROP_OLDEST))
+        self.queue = queue
+        self.target.unblock.clear()
+        asyncio.run(main())
+        self.assertEqual(6, self.queue.dropped)
+        self.assertEqual(1, self.target.flushes)
+
+    def test_loop_closed_before_flush(self):
+        async def main():
+            self.logger.info("Message")
+            asyncio.create_task(self.logger.aflush())
+            await asyncio.sleep(0.01)
+
+        self.target.unblock.clear()
+        asyncio.run(main())
+        self.target.unblock.set()
+        self.queue.flush()
+        self.assertEqual(1, len(self.target.lines))
+        self.logger.info("After the loop")
+        self.queue.flush()
+        self.assertEqual(2, len(self.target.lines))
+
+    def test_builder(self):
+        logger = LoggerBuilder.build("AsyncioBuilder", async_mode=True)
+
+        async def main():
+            logger.info("Message")
+            await logger.aflush()
+            return logger.handlers[0].queue.unfinished_tasks
+
+        self.assertEqual(0, asyncio.run(main()))
+        logger.handlers[0].close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import sys
+import unittest
+
+from melogger._callsite import _CallSiteCache
+
+
+class CallSiteCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = _CallSiteCache(max_size=4)
+
+    def test_call_site(self):
+        site = self.cache.get(sys._getframe())
+        self.assertEqual(("test_callsite", "test_call_site", __file__), site[:3])
+
+    def test_reused_per_call_site(self):
+        sites = [self.cache.get(sys._getframe()) for _ in range(10)]
+        self.assertEqual(1, len(self.cache))
+        self.assertTrue(all(site is sites[0] for site in sites))
+
+    def test_bounded(self):
+        for i in range(20):
+            code = compile("import sys\nframe = sys._getframe()", f"generated_{i}.py", "exec")
+            scope = {}
+            exec(code, scope)
+            self.assertEqual(f"generated_{i}", self.cache.get(scope["frame"]).module)
+        self.assertEqual(4, len(self.cache))
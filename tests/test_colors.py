@@ -0,0 +1,77 @@
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from melogger import Colors, ColorSupport
+from melogger.colors import Palette
+
+
+class _Tty(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class ColorSupportTest(unittest.TestCase):
+
+    def detect(self, stream, **env):
+        with patch.dict(os.environ, env, clear=True):
+            return ColorSupport.detect(stream)
+
+    def test_detect(self):
+        self.assertEqual(ColorSupport.NONE, self.detect(io.StringIO(), TERM="xterm-256color"))
+        self.assertEqual(ColorSupport.NONE, self.detect(_Tty(), TERM="dumb"))
+        self.assertEqual(ColorSupport.NONE, self.detect(_Tty(), TERM="xterm", NO_COLOR="1"))
+        self.assertEqual(ColorSupport.BASIC, self.detect(_Tty(), TERM="xterm"))
+        self.assertEqual(ColorSupport.EXTENDED, self.detect(_Tty(), TERM="xterm-256color"))
+        self.assertEqual(ColorSupport.TRUECOLOR, self.detect(_Tty(), TERM="xterm-256color", COLORTERM="truecolor"))
+
+    def test_force_color(self):
+        self.assertEqual(ColorSupport.BASIC, self.detect(io.StringIO(), FORCE_COLOR="1"))
+        self.assertEqual(ColorSupport.EXTENDED, self.detect(io.StringIO(), FORCE_COLOR="2"))
+        self.assertEqual(ColorSupport.TRUECOLOR, self.detect(io.StringIO(), FORCE_COLOR="3"))
+        self.assertEqual(ColorSupport.NONE, self.detect(_Tty(), TERM="xterm", FORCE_COLOR="0"))
+
+    def test_closed_stream(self):
+        stream = io.StringIO()
+        stream.close()
+        self.assertEqual(ColorSupport.NONE, self.detect(stream, TERM="xterm"))
+
+
+class PaletteTest(unittest.TestCase):
+
+    def test_truecolor_is_unchanged(self):
+        palette = Palette(ColorSupport.TRUECOLOR)
+        for code in [Colors.COL.PURE.RED, Colors.COL.RED + Colors.ALT.BOLD, Colors.hex("#123456")]:
+            self.assertEqual(code, palette(code))
+
+    def test_extended(self):
+        palette = Palette(ColorSupport.EXTENDED)
+        self.assertEqual("\033[38;5;196m", palette(Colors.COL.PURE.RED))
+        self.assertEqual("\033[48;5;21m\033[1m", palette(Colors.BGD.PURE.BLUE + Colors.ALT.BOLD))
+        self.assertEqual(Colors.COL.RED, palette(Colors.COL.RED))
+
+    def test_basic(self):
+        palette = Palette(ColorSupport.BASIC)
+        self.assertEqual("\033[91m", palette(Colors.COL.PURE.RED))
+        self.assertEqual("\033[44m", palette(Colors.BGD.PURE.BLUE))
+        self.assertEqual("\033[91m", palette("\033[38;5;196m"))
+        self.assertEqual(Colors.ALT.BOLD, palette(Colors.ALT.BOLD))
+
+    def test_none(self):
+        palette = Palette(ColorSupport.NONE)
+        self.assertEqual("", palette(Colors.COL.PURE.RED + Colors.ALT.BOLD))
+
+    def test_text(self):
+        palette = Palette(ColorSupport.BASIC)
+        self.assertEqual("a \033[91mred\033[0m b", palette.text(f"a {Colors.COL.PURE.RED}red{Colors.END} b"))
+        self.assertEqual("plain", palette.text("plain"))
+
+    def test_memoized(self):
+        self.assertIs(Colors.hex("#010203"), Colors.hex("#010203"))
+        palette = Palette(ColorSupport.EXTENDED)
+        self.assertIs(palette(Colors.COL.PURE.RED), palette(Colors.COL.PURE.RED))
+
+
+if __name__ == '__main__':
+    unittest.main()
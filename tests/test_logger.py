@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from melogger import FORMATS, Colors, FileFormatter, Levels, Logger
+from melogger.utils import LevelData
+from tests.utils import ListHandler
+
+
+class LoggerTest(unittest.TestCase):
+    NO_CALLER_FORMATS = {level: LevelData(data.label, data.color, "%(message)s%(terminator)s") for level, data in FORMATS.items()}
+
+    def setUp(self):
+        self.handler = ListHandler(FORMATS)
+        self.logger = Logger("Logger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.INFO)
+
+    def test_disabled_call_does_no_work(self):
+        with patch.object(self.logger, "makeRecord") as make_record, patch("melogger.logger.sys._getframe") as get_frame:
+            self.logger.debug("Message", end="", color="")
+        make_record.assert_not_called()
+        get_frame.assert_not_called()
+        self.assertEqual([], self.handler.records)
+
+    def test_caller(self):
+        self.logger.info("Message")
+        record = self.handler.records[0]
+        self.assertEqual("test_logger", record.crt_module)
+        self.assertEqual("test_caller", record.crt_method_name)
+        self.assertEqual(__file__, record.pathname)
+
+    def test_caller_skipped_when_not_rendered(self):
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(handler := ListHandler(self.NO_CALLER_FORMATS))
+        self.logger.info("Message", end="")
+        record = handler.records[0]
+        self.assertFalse(hasattr(record, "crt_module"))
+        self.assertEqual("", record.terminator)
+
+        self.logger.addHandler(self.handler)
+        self.logger.info("Message")
+        self.assertEqual("test_logger", handler.records[1].crt_module)
+
+    def test_args(self):
+        self.logger.info("User %s logged in %d times", "bob", 3)
+        self.assertEqual("User bob logged in 3 times", self.handler.records[0].getMessage())
+        self.assertEqual("User bob logged in 3 times", FileFormatter(self.NO_CALLER_FORMATS).format(self.handler.records[0]).strip())
+
+    def test_lazy_message(self):
+        producer = Mock(return_value="expensive")
+        self.logger.debug(lambda: f"Message {producer()}")
+        self.logger.debug("Message %s", lambda: producer())
+        producer.assert_not_called()
+
+        self.logger.info(lambda: f"Message {producer()}")
+        self.logger.info("Message %s %s", lambda: producer(), 1)
+        producer.assert_not_called()
+        self.logger.addHandler(second := ListHandler(FORMATS))
+        for record in self.handler.records:
+            self.handler.format(record)
+            second.format(record)
+        self.assertEqual(2, producer.call_count)
+        self.assertEqual(["Message expensive", "Message expensive 1"], [record.getMessage() for record in self.handler.records])
+
+    def test_args_sanitized(self):
+        self.logger.info("Message %s", f"{Colors.COL.RED}red")
+        self.assertEqual("Message red", FileFormatter(self.NO_CALLER_FORMATS).format(self.handler.records[0]).strip())
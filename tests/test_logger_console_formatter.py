@@ -2,7 +2,7 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
-from melogger import LoggerBuilder, Levels, Colors, Logger
+from melogger import LoggerBuilder, Levels, Colors, ColorSupport, Logger
 from tests.utils import FormatterExtension
 
 
@@ -20,9 +20,13 @@ class StreamHandlerWithConsoleFormatterTest(unittest.TestCase, FormatterExtensio
         cls.output_mock.stdout = StringIO()
         cls.output = cls.output_mock.stdout
         cls.logger = Logger("ConsoleLogger")
-        cls.logger.addHandler(LoggerBuilder.get_console_handler(Levels.DEBUG))
+        cls.logger.addHandler(LoggerBuilder.get_console_handler(Levels.DEBUG, colors=ColorSupport.TRUECOLOR))
         cls.logger.setLevel(Levels.DEBUG)
 
+    @classmethod
+    def tearDown(cls):
+        patch.stopall()
+
     def test_change_level(self):
         self.logger.debug("Message debug 1")
         self.logger.debug("Message debug 2", color=Colors.COL.YELLOW)
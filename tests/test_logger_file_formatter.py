@@ -21,6 +21,10 @@ class RotatingFileHandlerWithFileFormatterTest(unittest.TestCase, FormatterExten
         cls.logger.addHandler(LoggerBuilder.get_file_handler("dummy.txt", Levels.DEBUG, file_max_size=0))
         cls.logger.setLevel(Levels.DEBUG)
 
+    @classmethod
+    def tearDown(cls):
+        patch.stopall()
+
     def test_remove_color_inside_files(self):
         self.logger.debug("Message debug")
         self.logger.info("Message info")
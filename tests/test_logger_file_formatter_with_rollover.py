@@ -21,6 +21,10 @@ class RotatingFileHandlerWithFileFormatterWithRolloverTest(unittest.TestCase, Fo
         cls.logger.addHandler(LoggerBuilder.get_file_handler("dummy.txt", Levels.DEBUG))
         cls.logger.setLevel(Levels.DEBUG)
 
+    @classmethod
+    def tearDown(cls):
+        patch.stopall()
+
     def test_remove_color_inside_files(self):
         self.logger.debug("Message debug")
         self.logger.info("Message info")
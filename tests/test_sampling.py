@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+
+from melogger import Levels, Logger, LoggerBuilder
+from tests.utils import ListHandler
+
+
+class SamplingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ListHandler()
+        self.logger = Logger("SamplingLogger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def messages(self) -> list:
+        return [record.msg for record in self.handler.records]
+
+    def test_one_in_n(self):
+        self.logger.set_sampling({Levels.DEBUG: 4})
+        for i in range(10):
+            self.logger.debug(f"Debug {i}")
+            self.logger.info(f"Info {i}")
+        self.assertEqual(["Debug 0", "Debug 4", "Debug 8"], [message for message in self.messages() if message.startswith("Debug")])
+        self.assertEqual(10, len([message for message in self.messages() if message.startswith("Info")]))
+        self.assertEqual({Levels.DEBUG.value: 7}, self.logger.sampled_out)
+
+    def test_rate(self):
+        self.logger.set_sampling({Levels.INFO: 0.25})
+        with patch("melogger._sampling._random.random", side_effect=[0.1, 0.5, 0.3, 0.2]):
+            for i in range(4):
+                self.logger.info(f"Info {i}")
+        self.assertEqual(["Info 0", "Info 3"], self.messages())
+        self.assertEqual({Levels.INFO.value: 2}, self.logger.sampled_out)
+
+    def test_key(self):
+        self.logger.set_sampling({Levels.DEBUG: 0.5, Levels.INFO: 0.5}, key="request_id")
+        for request_id in range(100):
+            self.logger.debug("Debug", request_id=request_id)
+            self.logger.info("Info", request_id=request_id)
+        kept = [record.request_id for record in self.handler.records]
+        self.assertEqual(kept[0::2], kept[1::2])
+        self.assertTrue(20 < len(kept) // 2 < 80)
+        with patch("melogger._sampling._random.random", return_value=0.9):
+            self.logger.info("No key")
+        self.assertEqual(len(kept), len(self.handler.records))
+
+    def test_never_above_info(self):
+        for level in [Levels.WARN, Levels.ERROR, Levels.CRITICAL, Levels.PLAIN]:
+            with self.assertRaises(ValueError):
+                self.logger.set_sampling({level: 2})
+        for policy in [0, 1.5, -0.1, "10", True]:
+            with self.assertRaises(ValueError):
+                self.logger.set_sampling({Levels.DEBUG: policy})
+
+    def test_before_caller_lookup(self):
+        self.logger.set_sampling({Levels.INFO: 0.0})
+        with patch.object(Logger.CALL_SITES, "get", wraps=Logger.CALL_SITES.get) as get, \
+                patch.object(self.logger, "makeRecord", wraps=self.logger.makeRecord) as make_record:
+            for _ in range(100):
+                self.logger.info("Message")
+        get.assert_not_called()
+        make_record.assert_not_called()
+        self.assertEqual({Levels.INFO.value: 100}, self.logger.sampled_out)
+
+    def test_builder(self):
+        logger = LoggerBuilder.build("SamplingBuilder", logs_level=Levels.DEBUG, sampling={Levels.DEBUG: 10}, sampling_key="trace")
+        self.assertEqual(({Levels.DEBUG.value: 10}, "trace"), (logger.sampler.policies, logger.sampler.key))
+        self.assertIsNone(LoggerBuilder.build("NoSamplingBuilder").sampler)
+        self.assertEqual({}, LoggerBuilder.build("NoSamplingBuilder").sampled_out)
+
+
+if __name__ == '__main__':
+    unittest.main()
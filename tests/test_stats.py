@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from melogger import FORMATS, FileFormatter, Levels, Logger, LoggerBuilder
+from melogger.handlers import BinaryFileHandler, QueueHandler, RotatingFileHandler
+from tests.utils import ListHandler
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def setUp(self):
+        self.logs_path = tempfile.mkdtemp()
+        self.handler = ListHandler(format_records=True)
+        self.logger = Logger("StatsLogger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def tearDown(self):
+        for handler in self.logger.handlers:
+            handler.close()
+        shutil.rmtree(self.logs_path)
+
+    def test_disabled(self):
+        self.assertEqual({}, self.logger.stats())
+        self.assertNotIn("emit", self.handler.__dict__)
+        self.assertNotIn("CALL_SITES", self.logger.__dict__)
+
+    def test_counters(self):
+        self.logger.instrument()
+        for i in range(5):
+            self.logger.info(f"Message {i} ăîș")
+        stats = self.logger.stats()
+        handler = stats["handlers"]["ListHandler-0"]
+        self.assertEqual(5, handler["records"])
+        self.assertEqual(sum(len(line.encode("utf-8")) for line in self.handler.lines), handler["bytes"])
+        self.assertGreater(handler["format_ns"], 0)
+        self.assertGreater(handler["write_ns"], 0)
+        self.assertEqual((0, 0), (handler["rotations"], handler["errors"]))
+        self.assertEqual(5, stats["logger"]["caller_lookups"])
+        self.assertGreater(stats["logger"]["caller_ns"], 0)
+
+    def test_rotations_and_errors(self):
+        file_handler = RotatingFileHandler(os.path.join(self.logs_path, "test.log"), maxBytes=500, backupCount=2, encoding="utf-8")
+        file_handler.setFormatter(FileFormatter(FORMATS))
+        file_handler.set_name("file")
+        self.logger.removeHandler(self.handler)
+        self.logger.addHandler(file_handler)
+        self.logger.instrument()
+        for i in range(50):
+            self.logger.info(f"Message {i:03}")
+        # the wrapper instrument() set on the instance calls the real handleError, only its traceback is silenced
+        with patch("logging.raiseExceptions", False):
+            self.logger.info("%d", "not a number")
+        stats = self.logger.stats()["handlers"]["file"]
+        self.assertEqual(51, stats["records"])
+        self.assertGreater(stats["rotations"], 3)
+        self.assertGreater(stats["rotate_ns"], 0)
+        self.assertEqual(1, stats["errors"])
+
+    def test_binary_and_queue(self):
+        binary = BinaryFileHandler(os.path.join(self.logs_path, "test.bin"))
+        self.logger.addHandler(QueueHandler([binary]))
+        self.logger.instrument()
+        self.logger.info("Message")
+        self.logger.flush()
+        stats = self.logger.stats()["handlers"]
+        self.assertEqual(1, stats["QueueHandler-1"]["records"])
+        self.assertEqual(1, stats["QueueHandler-1/BinaryFileHandler-0"]["records"])
+        self.assertEqual(os.path.getsize(binary.baseFilename) - len(b"MELOGBIN\x01\n"), stats["QueueHandler-1/BinaryFileHandler-0"]["bytes"])
+
+    def test_switch_off(self):
+        self.logger.instrument()
+        self.logger.instrument(False)
+        self.test_disabled()
+        self.logger.info("Message")
+        self.assertEqual(1, len(self.handler.lines))
+
+    def test_added_handler(self):
+        self.logger.instrument()
+        self.logger.addHandler(handler := ListHandler(format_records=True))
+        self.logger.info("Message")
+        self.assertEqual(1, self.logger.stats()["handlers"]["ListHandler-1"]["records"])
+        self.assertIsNotNone(handler.stats)
+
+    def test_builder(self):
+        logger = LoggerBuilder.build("StatsBuilder", logs_path=self.logs_path, file_name="builder.log", instrument=True)
+        self.assertEqual({"StreamHandler-0", "RotatingFileHandler-1"}, set(logger.stats()["handlers"]))
+        self.assertEqual({}, LoggerBuilder.build("NoStatsBuilder").stats())
+        for handler in logger.handlers:
+            handler.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import patch
+
+from melogger import Levels, Logger, LoggerBuilder
+from tests.utils import ListHandler
+
+
+class SuppressionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.handler = ListHandler()
+        self.logger = Logger("SuppressLogger")
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(Levels.DEBUG)
+        self.now = 1000.0
+        self.clock = patch("melogger._suppress._time.monotonic", side_effect=lambda: self.now)
+        self.clock.start()
+
+    def tearDown(self):
+        self.clock.stop()
+
+    def messages(self) -> list:
+        return [record.msg for record in self.handler.records]
+
+    def log_failure(self, i: int) -> None:
+        self.logger.error(f"Failed {i}")
+
+    def test_rate_limit(self):
+        self.logger.set_suppression(rate=1, burst=3, duplicates=False)
+        for i in range(10):
+            self.log_failure(i)
+        self.logger.info("Other call site")
+        self.assertEqual(["Failed 0", "Failed 1", "Failed 2", "Other call site"], self.messages())
+        self.assertEqual(7, self.logger.suppressed)
+
+        self.now += 1
+        for i in range(10, 12):
+            self.log_failure(i)
+        self.assertEqual(["Suppressed 7 similar messages", "Failed 10"], self.messages()[4:])
+        self.assertEqual(Levels.ERROR.value, self.handler.records[4].levelno)
+        self.assertEqual("log_failure", self.handler.records[4].crt_method_name)
+
+    def test_duplicates(self):
+        self.logger.set_suppression(duplicates=True)
+        for _ in range(5):
+            self.logger.warning("Same")
+        for prefix in ["", "\t"]:
+            self.logger.warning("Different", prefix=prefix)
+        self.logger.warning("Different")  # another call site
+        self.assertEqual(["Same", "Suppressed 4 similar messages", "Different", "Suppressed 1 similar messages", "Different"], self.messages())
+
+    def test_periodic_summary(self):
+        self.logger.set_suppression(duplicates=True, summary_interval=10)
+        for _ in range(5):
+            self.logger.error("Same")
+            self.now += 3
+        self.assertEqual(["Same", "Suppressed 4 similar messages"], self.messages())
+
+    def test_end_execution(self):
+        self.logger.set_suppression(rate=1, burst=1, duplicates=False)
+        for _ in range(3):
+            self.logger.error("Failed")
+        for i in range(3):
+            self.logger.info(f"Loop {i}")
+        self.logger.end_execution()
+        self.assertEqual(["Failed", "Loop 0", "Suppressed 2 similar messages", "Suppressed 2 similar messages", "Execution ended.\n\n"],
+                         self.messages())
+
+    def test_dropped_before_formatting(self):
+        self.logger.set_suppression(rate=1, burst=1)
+        with patch.object(self.logger, "makeRecord", wraps=self.logger.makeRecord) as make_record:
+            for _ in range(100):
+                self.logger.info("Message")
+        self.assertEqual(1, make_record.call_count)
+
+    def test_off(self):
+        self.logger.set_suppression()
+        self.assertIsNone(self.logger.suppressor)
+        for _ in range(5):
+            self.logger.info("Same")
+        self.assertEqual(5, len(self.handler.records))
+
+    def test_builder(self):
+        logger = LoggerBuilder.build("SuppressBuilder", suppress_rate=5, suppress_burst=2, suppress_duplicates=True)
+        self.assertEqual((5, 2, True), (logger.suppressor.rate, logger.suppressor.burst, logger.suppressor.collapse))
+        self.assertIsNone(LoggerBuilder.build("NoSuppressBuilder").suppressor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import logging
+import threading
+import time
+import unittest
+
+from melogger import FORMATS, ConsoleFormatter, FileFormatter, Levels, Logger
+
+
+class _FormattedHandler(logging.Handler):
+    def __init__(self, formatter):
+        super().__init__()
+        self.setFormatter(formatter)
+        self.formatted = {}
+
+    def emit(self, record):
+        self.formatted.setdefault(record.thread, []).append(self.format(record))
+
+
+class ThreadsTest(unittest.TestCase):
+    THREADS = 16
+    RECORDS = 300
+
+    def setUp(self):
+        self.console = _FormattedHandler(ConsoleFormatter(FORMATS))
+        self.file = _FormattedHandler(FileFormatter(FORMATS))
+        self.logger = Logger("ThreadsLogger")
+        self.logger.addHandler(self.console)
+        self.logger.addHandler(self.file)
+        self.logger.setLevel(Levels.DEBUG)
+
+    def __log(self, start):
+        start.wait()
+        for i in range(self.RECORDS):
+            self.logger.info(f"Message {i}", end="")
+            self.logger.info(f"Continued {i}")
+
+    def test_no_cross_thread_interference(self):
+        start = threading.Event()
+        threads = [threading.Thread(target=self.__log, args=(start,)) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        started = time.perf_counter()
+        start.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        print(f"\n{self.THREADS} threads: {self.THREADS * self.RECORDS * 2 / elapsed:.0f} records/s")
+
+        for handler in [self.console, self.file]:
+            self.assertEqual(self.THREADS, len(handler.formatted))
+            for lines in handler.formatted.values():
+                self.assertEqual(self.RECORDS * 2, len(lines))
+                # each `end=""` record is followed by a record of the same thread that starts a new line,
+                # whatever the other threads logged in between
+                for i in range(0, len(lines), 2):
+                    self.assertFalse(lines[i].startswith("\n"), lines[i])
+                    self.assertTrue(lines[i + 1].startswith("\n"), lines[i + 1])
+
+    def test_handlers_do_not_share_state(self):
+        other = _FormattedHandler(ConsoleFormatter(FORMATS))
+        logger = Logger("OtherLogger")
+        logger.addHandler(other)
+        logger.setLevel(Levels.DEBUG)
+
+        self.logger.info("Message", end="")
+        logger.info("Message")
+        self.assertFalse(other.formatted[threading.get_ident()][0].startswith("\n"))
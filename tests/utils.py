@@ -1,6 +1,23 @@
+import logging
 import re
 
-from melogger import FORMATS, Levels
+from melogger import FORMATS, ConsoleFormatter, Levels
+
+
+class ListHandler(logging.Handler):
+    """ Keeps the records it handles and, with `format_records`, their formatted lines """
+
+    def __init__(self, formats=FORMATS, format_records=False):
+        super().__init__()
+        self.format_records = format_records
+        self.records = []
+        self.lines = []
+        self.setFormatter(ConsoleFormatter(formats))
+
+    def emit(self, record):
+        if self.format_records:
+            self.lines.append(self.format(record))
+        self.records.append(record)
 
 
 class FormatterExtension: